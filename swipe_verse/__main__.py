@@ -1,16 +1,23 @@
 #!/usr/bin/env python
 """Main entry point for SwipeVerse using standard Flet ft.app()."""
 
+import sys
+
 import flet as ft
 from swipe_verse.main import main as app_main  # Import the main function from main.py
 
 
 def main():
-    """Runs the Flet application."""
+    """Runs the Flet application, or a command-line tool if one is named."""
+    from swipe_verse.cli import COMMANDS, run
+
+    if len(sys.argv) > 1 and sys.argv[1] in COMMANDS:
+        return run(sys.argv[1:])
+
     # Note: assets_dir here should be relative to the project root when running
     # 'flet run' or building. Flet handles packaging these.
     ft.app(target=app_main, assets_dir="swipe_verse/assets")
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
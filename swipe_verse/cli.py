@@ -0,0 +1,366 @@
+"""Command-line tools for SwipeVerse, run as ``swipe-verse <command>``."""
+
+import argparse
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Sequence, cast
+
+from swipe_verse.models.config import GameConfig
+from swipe_verse.services.cache_manager import NAMESPACES
+
+if TYPE_CHECKING:
+    from swipe_verse.services.scenario_graph import GraphReport
+
+PACKAGE_DIR = Path(__file__).parent
+SCENARIOS_DIR = PACKAGE_DIR / "scenarios"
+
+
+def resolve_scenario(scenario: str) -> Path:
+    """
+    Resolve a scenario argument to a file.
+
+    Accepts a path, or a bundled scenario name such as ``kingdom``.
+    """
+    path = Path(scenario)
+    if path.exists():
+        return path
+    bundled = SCENARIOS_DIR / f"{scenario}_game.json"
+    if bundled.exists():
+        return bundled
+    raise FileNotFoundError(f"Scenario not found: {scenario}")
+
+
+def load_scenario(path: Path) -> GameConfig:
+    """Load and validate a scenario, raising on errors instead of falling back."""
+    with open(path, "r", encoding="utf-8") as f:
+        return GameConfig.model_validate(json.load(f))
+
+
+def _parse_filters(value: str) -> List[Optional[str]]:
+    from swipe_verse.services.image_processor import ImageProcessor
+
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    if names == ["all"]:
+        return list(ImageProcessor().filters)
+    return [None if name == "none" else name for name in names]
+
+
+def _parse_scales(value: str) -> List[Optional[float]]:
+    return [
+        None if part.strip() == "none" else float(part)
+        for part in value.split(",")
+        if part.strip()
+    ]
+
+
+def _cmd_prerender(args: argparse.Namespace) -> int:
+    from swipe_verse.services.asset_manager import AssetManager
+    from swipe_verse.services.image_processor import CHAIN_SEPARATOR
+    from swipe_verse.services.prerender import (
+        collect_theme_images,
+        format_report,
+        prerender,
+    )
+
+    scenario_path = resolve_scenario(args.scenario)
+    config = load_scenario(scenario_path)
+
+    base_path = Path(args.assets) if args.assets else PACKAGE_DIR
+    asset_manager = AssetManager(
+        base_path=str(base_path),
+        default_assets_path=str(PACKAGE_DIR / "assets" / "default"),
+    )
+    images = collect_theme_images(config, asset_manager)
+
+    filters = _parse_filters(args.filters)
+    if args.filters == "all":
+        # Include the theme's named filter chains
+        filters.extend(
+            CHAIN_SEPARATOR.join(steps) for steps in config.theme.looks().values()
+        )
+
+    report = prerender(
+        images,
+        filters=filters,
+        scales=_parse_scales(args.scales),
+        cache_dir=Path(args.cache_dir) if args.cache_dir else None,
+        workers=args.workers,
+        scenario=str(scenario_path),
+    )
+    print(format_report(report))
+    return 1 if report["errors"] else 0
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def _cmd_cache(args: argparse.Namespace) -> int:
+    from swipe_verse.services.cache_manager import CacheManager
+
+    kwargs = {}
+    if args.budget is not None:
+        kwargs["budget"] = int(args.budget * 1024 * 1024)
+    if args.max_age is not None:
+        kwargs["max_age"] = args.max_age * 24 * 3600
+    manager = CacheManager(root=Path(args.root) if args.root else None, **kwargs)
+
+    if args.action == "gc":
+        removed = manager.gc()
+        print(f"Removed {removed['files']} files ({_format_bytes(removed['bytes'])})")
+    elif args.action == "clear":
+        removed = manager.clear(args.namespace)
+        print(f"Removed {removed['files']} files ({_format_bytes(removed['bytes'])})")
+
+    stats = manager.stats()
+    print(
+        f"Cache {stats['root']}: {stats['files']} files, "
+        f"{_format_bytes(stats['bytes'])} of {_format_bytes(stats['budget'])} budget"
+    )
+    for namespace, ns in stats["namespaces"].items():
+        print(
+            f"  {namespace:<10} {ns['files']:>6} files {_format_bytes(ns['bytes']):>10}"
+            f"  hits {ns['hits']}, misses {ns['misses']} ({ns['hit_rate']:.0%})"
+        )
+    return 0
+
+
+def _cmd_pack(args: argparse.Namespace) -> int:
+    import time
+
+    from swipe_verse.services.scenario_pack import (
+        PACK_SUFFIX,
+        PackedCardStore,
+        open_pack,
+        write_pack,
+    )
+
+    scenario_path = resolve_scenario(args.scenario)
+    output = Path(args.output) if args.output else Path(scenario_path.stem + PACK_SUFFIX)
+
+    started = time.perf_counter()
+    config = load_scenario(scenario_path)
+    validated = time.perf_counter()
+    stats = write_pack(config, output)
+    written = time.perf_counter()
+    # Check the pack reads back, and time what a launch now costs
+    cast(PackedCardStore, open_pack(output).cards).close()
+    opened = time.perf_counter()
+
+    print(
+        f"Packed {stats['cards']} cards, {stats['strings']} strings into {output} "
+        f"({_format_bytes(stats['bytes'])}, JSON {_format_bytes(scenario_path.stat().st_size)})"
+    )
+    print(
+        f"  validate {(validated - started) * 1000:.0f} ms, "
+        f"write {(written - validated) * 1000:.0f} ms, "
+        f"open {(opened - written) * 1000:.1f} ms"
+    )
+    return 0
+
+
+def _format_graph_report(name: str, report: "GraphReport") -> List[str]:
+    problems = []
+    for link in report["dangling"]:
+        problems.append(
+            f"  dangling link: {link['card']} -> {link['direction']} -> {link['target']}"
+        )
+    problems.extend(f"  dead end: {card_id}" for card_id in report["dead_ends"])
+    problems.extend(
+        f"  forced cycle: {' -> '.join(cycle)}" for cycle in report["forced_cycles"]
+    )
+    if report["unreachable"]:
+        problems.append(f"  unreachable: {', '.join(report['unreachable'])}")
+    status = "ok" if not problems else f"{len(problems)} problems"
+    summary = (
+        f"{name}: {report['cards']} cards, {report['links']} links, "
+        f"{len(report['cycles'])} cycles, {status}"
+    )
+    return [summary, *problems]
+
+
+def _cmd_analyze(args: argparse.Namespace) -> int:
+    from swipe_verse.services.scenario_graph import ScenarioGraph, has_errors
+    from swipe_verse.services.scenario_pack import PackedCardStore, is_pack, open_pack
+
+    failed = False
+    reports = {}
+    for scenario in args.scenarios:
+        scenario_path = resolve_scenario(scenario)
+        try:
+            if is_pack(scenario_path):
+                cards = cast(PackedCardStore, open_pack(scenario_path).cards)
+                try:
+                    # Packs store the report of a random start
+                    if args.start is None:
+                        report = cards.graph_report()
+                    else:
+                        report = ScenarioGraph.from_cards(cards).analyze(args.start)
+                finally:
+                    cards.close()
+            else:
+                config = load_scenario(scenario_path)
+                report = ScenarioGraph.from_cards(config.cards).analyze(args.start)
+        except Exception as e:
+            print(f"{scenario_path}: error: {e}")
+            failed = True
+            continue
+
+        failed = failed or has_errors(report)
+        if args.json:
+            reports[str(scenario_path)] = report
+        else:
+            print("\n".join(_format_graph_report(str(scenario_path), report)))
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    return 1 if failed else 0
+
+
+def _cmd_play(args: argparse.Namespace) -> int:
+    import functools
+
+    import flet as ft
+
+    from swipe_verse.ui.app import main as app_main
+
+    scenario = args.scenario
+    if scenario is not None and not scenario.startswith(("http://", "https://")):
+        scenario = str(resolve_scenario(scenario).resolve())
+    ft.app(
+        target=functools.partial(
+            app_main,
+            config_path=scenario,
+            offline=args.offline,
+            watch_scenario=args.watch,
+        ),
+        assets_dir=str(PACKAGE_DIR / "assets"),
+    )
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="swipe-verse")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    prerender = subparsers.add_parser(
+        "prerender", help="Pre-render filtered variants of a scenario's images"
+    )
+    prerender.add_argument("scenario", help="Scenario file or bundled name (e.g. kingdom)")
+    prerender.add_argument(
+        "--filters",
+        default="all",
+        help="Comma-separated filter names or chains such as grayscale+blur, "
+        "or 'all' for every filter and theme look (default: all)",
+    )
+    prerender.add_argument(
+        "--scales",
+        default="none",
+        help="Comma-separated scale factors, 'none' for original size (default: none)",
+    )
+    prerender.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: CPU count)"
+    )
+    prerender.add_argument("--cache-dir", default=None, help="Image cache directory")
+    prerender.add_argument(
+        "--assets", default=None, help="Base path for relative asset paths"
+    )
+    prerender.set_defaults(handler=_cmd_prerender)
+
+    cache = subparsers.add_parser(
+        "cache", help="Show, trim or clear the on-disk caches"
+    )
+    cache.add_argument(
+        "action",
+        choices=("stats", "gc", "clear"),
+        help="stats: show usage; gc: evict old and over-budget files; clear: remove all",
+    )
+    cache.add_argument(
+        "--namespace",
+        choices=tuple(NAMESPACES),
+        default=None,
+        help="Only clear this namespace",
+    )
+    cache.add_argument(
+        "--budget", type=float, default=None, help="Size budget in MiB (default: 512)"
+    )
+    cache.add_argument(
+        "--max-age",
+        type=float,
+        default=None,
+        help="Evict files unused for this many days (default: 30)",
+    )
+    cache.add_argument(
+        "--root", default=None, help="Cache root (default: ~/.swipe_verse)"
+    )
+    cache.set_defaults(handler=_cmd_cache)
+
+    pack = subparsers.add_parser(
+        "pack", help="Compile a scenario into a binary pack that loads without parsing"
+    )
+    pack.add_argument("scenario", help="Scenario file or bundled name (e.g. kingdom)")
+    pack.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help="Pack file to write (default: <scenario>.svpack in the current directory)",
+    )
+    pack.set_defaults(handler=_cmd_pack)
+
+    analyze = subparsers.add_parser(
+        "analyze",
+        help="Check scenarios for dangling links, dead ends and inescapable loops",
+    )
+    analyze.add_argument(
+        "scenarios", nargs="+", help="Scenario files, packs or bundled names"
+    )
+    analyze.add_argument(
+        "--start",
+        default=None,
+        help="Card the game starts on, to find cards it cannot reach "
+        "(default: a random card, which can reach every card)",
+    )
+    analyze.add_argument(
+        "--json", action="store_true", help="Print the reports as JSON"
+    )
+    analyze.set_defaults(handler=_cmd_analyze)
+
+    play = subparsers.add_parser("play", help="Play a scenario")
+    play.add_argument(
+        "scenario",
+        nargs="?",
+        default=None,
+        help="Scenario file, URL or bundled name (default: kingdom)",
+    )
+    play.add_argument(
+        "--offline",
+        action="store_true",
+        help="Load remote scenarios only from their cached copies",
+    )
+    play.add_argument(
+        "--watch",
+        action="store_true",
+        help="Reload the scenario file into the running game when it is saved",
+    )
+    play.set_defaults(handler=_cmd_play)
+
+    return parser
+
+
+# Subcommands handled here rather than by the Flet app
+COMMANDS = ("prerender", "cache", "pack", "analyze", "play")
+
+
+def run(argv: Optional[Sequence[str]] = None) -> int:
+    """Parse arguments and run a command, returning the exit code."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return int(args.handler(args))
+    except FileNotFoundError as e:
+        parser.exit(2, f"swipe-verse: {e}\n")
+    return 2
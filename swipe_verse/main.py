@@ -8,6 +8,8 @@ from typing import Any, Dict, Optional
 import flet as ft
 from flet import Page
 
+from swipe_verse.ui.render_scheduler import RenderScheduler
+
 # Global settings/state (Restored)
 APP_CONFIG: Dict[str, Any] = {
     "game_theme": "tutorial",
@@ -129,37 +131,52 @@ def main(page: Page) -> None:
     resource_indicators_row = ft.Row(
         controls=[], alignment=ft.MainAxisAlignment.CENTER, spacing=10
     )
+    # Resource name -> (indicator container, fill overlay), reused between swipes
+    resource_indicators: Dict[str, Any] = {}
     
     # --- Restore update_resource_indicators logic --- 
     def update_resource_indicators():
-        """Rebuilds the resource indicators row based on current GAME_STATE."""
+        """Updates the resource indicators row in place from the current GAME_STATE.
+
+        The indicator controls are only rebuilt when the set of resources changes;
+        otherwise just each overlay's height and tooltip are set, so Flet sends only
+        the values that changed.
+        """
         global GAME_DATA, GAME_STATE
         print("--- Updating resource indicators ---")
-        resource_icons = GAME_DATA.get("theme", {}).get("resource_icons", {})
-        indicators = []
-        for name, value in GAME_STATE.get("resources", {}).items():
-            # Use path directly from JSON data
-            icon_path = resource_icons.get(name, '') 
-            print(f"    Icon path used: {icon_path}") 
-            indicators.append(
-                ft.Container(
+        resources = GAME_STATE.get("resources", {})
+        if list(resources) != list(resource_indicators):
+            resource_icons = GAME_DATA.get("theme", {}).get("resource_icons", {})
+            resource_indicators.clear()
+            for name in resources:
+                # Use path directly from JSON data
+                icon_path = resource_icons.get(name, '') 
+                print(f"    Icon path used: {icon_path}") 
+                overlay = ft.Container(
+                    width=40, height=40,
+                    bgcolor=ft.colors.with_opacity(0.6, ft.colors.BLACK),
+                    alignment=ft.alignment.top_center,
+                )
+                indicator = ft.Container(
                     content=ft.Stack([
                         ft.Image(
                             src=icon_path, width=40, height=40,
                             fit=ft.ImageFit.CONTAIN,
                             error_content=ft.Icon(ft.icons.BROKEN_IMAGE_OUTLINED, size=30),
                         ),
-                        ft.Container(
-                            width=40, height=40 * (1 - min(max(value, 0), 100) / 100),
-                            bgcolor=ft.colors.with_opacity(0.6, ft.colors.BLACK),
-                            alignment=ft.alignment.top_center,
-                        )
+                        overlay,
                     ]),
-                    width=50, height=50, tooltip=f"{name.capitalize()}: {value}", margin=3,
+                    width=50, height=50, margin=3,
                 )
-            )
-        resource_indicators_row.controls = indicators
-        print(f"--- Resource indicators updated with {len(indicators)} controls ---")
+                resource_indicators[name] = (indicator, overlay)
+            resource_indicators_row.controls = [
+                indicator for indicator, _ in resource_indicators.values()
+            ]
+            print(f"--- Resource indicators rebuilt with {len(resource_indicators)} controls ---")
+        for name, value in resources.items():
+            indicator, overlay = resource_indicators[name]
+            overlay.height = 40 * (1 - min(max(value, 0), 100) / 100)
+            indicator.tooltip = f"{name.capitalize()}: {value}"
 
     # --- Screen Navigation --- 
     def navigate_to(screen_name, container):
@@ -223,8 +240,6 @@ def main(page: Page) -> None:
                  ], alignment=ft.MainAxisAlignment.CENTER, horizontal_alignment=ft.CrossAxisAlignment.CENTER)
                  return
                 
-        current_card = get_card(GAME_STATE.get("current_card_id", ""))
-        
         card_display_area = ft.Column( 
             controls=[], 
             horizontal_alignment=ft.CrossAxisAlignment.CENTER,
@@ -236,136 +251,199 @@ def main(page: Page) -> None:
             padding=10,
             bgcolor=ft.colors.SURFACE_VARIANT,
         )
+
+        # The card controls are built once; show_card fills them in for each card
+        card_title = ft.Text("", size=20, weight=ft.FontWeight.BOLD, text_align=ft.TextAlign.CENTER)
+        card_image = ft.Image(
+            src="", 
+            height=150,
+            fit=ft.ImageFit.CONTAIN,
+            error_content=ft.Container( 
+                height=150, 
+                alignment=ft.alignment.center, 
+                content=ft.Icon(ft.icons.IMAGE_NOT_SUPPORTED_OUTLINED, color=ft.colors.GREY_500, size=40)
+            ),
+            border_radius=ft.border_radius.all(8),
+        )
+        card_image_container = ft.Container(content=card_image)
+        card_text = ft.Text("", size=16, text_align=ft.TextAlign.CENTER, selectable=True)
+
+        card_inner_content = ft.Column([
+            card_title,
+            card_image_container,
+            card_text,
+        ], spacing=8, horizontal_alignment=ft.CrossAxisAlignment.CENTER)
         
-        card_controls = []
-        if not current_card:
-            print("--- No current card, showing Game Over / No Cards screen ---")
-            card_controls.append(
-                ft.Container(
-                    content=ft.Column([
-                        ft.Text("Game Over" if GAME_STATE.get("history") else "No more cards!", size=24, weight=ft.FontWeight.BOLD),
-                        ft.Text("Thanks for playing!" if GAME_STATE.get("history") else "You've reached the end."),
-                        ft.Container(height=20),
-                        ft.ElevatedButton("Back to Menu", on_click=lambda e: navigate_to("title", container)),
-                    ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=10),
-                    padding=20,
-                    border_radius=10,
-                    width=300,
-                    alignment=ft.alignment.center,
-                )
+        card_inner_container = ft.Container(
+            content=card_inner_content,
+            padding=15,
+            bgcolor=ft.colors.SURFACE_VARIANT,
+            border_radius=10,
+            width=300,
+            alignment=ft.alignment.center,
+            border=ft.border.all(1, ft.colors.with_opacity(0.1, ft.colors.WHITE)),
+            shadow=ft.BoxShadow(
+                spread_radius=1,
+                blur_radius=5,
+                color=ft.colors.with_opacity(0.1, ft.colors.BLACK),
+                offset=ft.Offset(2, 2),
             )
-        else:
-            # Use path directly from JSON data
-            card_image_path = current_card.get("image", "")
-            print(f"--- Building card display for: {current_card.get('id')} Image path used: {card_image_path} ---") 
-            
-            card_inner_content = ft.Column([
-                ft.Text(current_card.get("title", ""), size=20, weight=ft.FontWeight.BOLD, text_align=ft.TextAlign.CENTER),
-                ft.Container(
-                    content=ft.Image(
-                        src=card_image_path, 
-                        height=150,
-                        fit=ft.ImageFit.CONTAIN,
-                        error_content=ft.Container( 
-                            height=150, 
-                            alignment=ft.alignment.center, 
-                            content=ft.Icon(ft.icons.IMAGE_NOT_SUPPORTED_OUTLINED, color=ft.colors.GREY_500, size=40)
-                        ),
-                        border_radius=ft.border_radius.all(8),
-                    ), 
-                    padding=ft.padding.symmetric(vertical=10)
-                ) if card_image_path else ft.Container(height=10), 
-                ft.Text(current_card.get("text", ""), size=16, text_align=ft.TextAlign.CENTER, selectable=True),
-            ], spacing=8, horizontal_alignment=ft.CrossAxisAlignment.CENTER)
-            
-            card_inner_container = ft.Container(
-                content=card_inner_content,
-                padding=15,
-                bgcolor=ft.colors.SURFACE_VARIANT,
-                border_radius=10,
-                width=300,
-                alignment=ft.alignment.center,
-                border=ft.border.all(1, ft.colors.with_opacity(0.1, ft.colors.WHITE)),
-                shadow=ft.BoxShadow(
-                    spread_radius=1,
-                    blur_radius=5,
-                    color=ft.colors.with_opacity(0.1, ft.colors.BLACK),
-                    offset=ft.Offset(2, 2),
+        )
+
+        # The drag container animates its offset, rotation and opacity; the
+        # animations are switched off while a new card is brought back
+        card_animations = {
+            "animate_offset": ft.animation.Animation(200, ft.AnimationCurve.EASE_OUT),
+            "animate_rotation": ft.animation.Animation(200, ft.AnimationCurve.EASE_OUT),
+            "animate_opacity": ft.animation.Animation(200, ft.AnimationCurve.EASE_OUT),
+        }
+        drag_container = ft.Container(
+            content=card_inner_container,
+            width=320, 
+            alignment=ft.alignment.center,
+            **card_animations,
+        )
+
+        def reset_card_position():
+            """Put the card back in the middle at once, without animating the way back.
+
+            The container keeps the thrown card's offset, rotation and opacity; with
+            its animations on, the next card would slide back from there. Call
+            restore_card_animations() once the reset has been sent.
+            """
+            for name in card_animations:
+                setattr(drag_container, name, None)
+            drag_container.offset = ft.transform.Offset(0, 0)
+            drag_container.rotate = ft.transform.Rotate(0)
+            drag_container.opacity = 1.0
+
+        def restore_card_animations():
+            for name, animation in card_animations.items():
+                setattr(drag_container, name, animation)
+
+        swipe_state = {"distance": 0}
+        # Drag events arrive every 10 ms; send at most one update per frame
+        drag_render = RenderScheduler(page.update)
+        swipe_threshold = 80
+        max_swipe_angle = 8
+        max_offset = 120
+        
+        def handle_drag_update(e: ft.DragUpdateEvent):
+            state = swipe_state
+            state["distance"] += e.delta_x
+            clamped_distance = min(max(state["distance"], -max_offset*1.5), max_offset*1.5)
+            normalized_distance = min(abs(clamped_distance) / swipe_threshold, 1)
+            rotation_rad = (clamped_distance / max_offset) * (max_swipe_angle * (3.14159 / 180))
+            offset_x = clamped_distance / drag_container.width if drag_container.width else 0
+            drag_container.offset = ft.transform.Offset(offset_x, 0)
+            drag_container.rotate = ft.transform.Rotate(angle=rotation_rad, alignment=ft.alignment.center)
+            drag_container.opacity = 1.0 - (normalized_distance * 0.3)
+            drag_render.request()
+
+        def handle_drag_end(e: ft.DragEndEvent):
+            state = swipe_state
+            final_distance = state["distance"]
+            state["distance"] = 0
+
+            if abs(final_distance) > swipe_threshold:
+                direction = "right" if final_distance > 0 else "left"
+                final_offset_x = 1.5 if direction == "right" else -1.5 
+                final_rotation = max_swipe_angle if direction == "right" else -max_swipe_angle
+                final_rotation_rad = final_rotation * (3.14159 / 180)
+                
+                drag_container.offset = ft.transform.Offset(final_offset_x, 0)
+                drag_container.rotate = ft.transform.Rotate(angle=final_rotation_rad, alignment=ft.alignment.center)
+                drag_container.opacity = 0
+                drag_render.flush()
+                
+                process_choice(direction)
+                
+            else:
+                drag_container.offset = ft.transform.Offset(0, 0)
+                drag_container.rotate = ft.transform.Rotate(0)
+                drag_container.opacity = 1.0
+                drag_render.flush()
+
+            report_drag_stats()
+
+        def report_drag_stats():
+            # Kept in the session for tools and tests, printed when debugging
+            stats = drag_render.stats()
+            page.session.set("drag_render_stats", stats)
+            if APP_CONFIG.get("debug"):
+                print(
+                    f"--- Drag updates: {stats['requests']} requested, "
+                    f"{stats['flushes']} sent, {stats['coalesced']} coalesced, "
+                    f"{stats['messages_per_second']}/s ---"
                 )
-            )
+        
+        card_gesture_detector = ft.GestureDetector(
+            mouse_cursor=ft.MouseCursor.MOVE,
+            drag_interval=10,
+            on_horizontal_drag_update=handle_drag_update,
+            on_horizontal_drag_end=handle_drag_end,
+            content=drag_container,
+        )
 
-            drag_container = ft.Container(
-                content=card_inner_container,
-                width=320, 
-                alignment=ft.alignment.center,
-                animate_offset=ft.animation.Animation(200, ft.AnimationCurve.EASE_OUT),
-                animate_rotation=ft.animation.Animation(200, ft.AnimationCurve.EASE_OUT),
-                animate_opacity=ft.animation.Animation(200, ft.AnimationCurve.EASE_OUT),
-            )
+        left_choice_text = ft.Text("...", italic=True, color=ft.colors.GREY_500)
+        right_choice_text = ft.Text("...", italic=True, color=ft.colors.GREY_500)
+        choice_row = ft.Row([
+                left_choice_text,
+                ft.Container(width=40, expand=True), # Spacer
+                right_choice_text,
+            ],
+            width=300,
+            alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+        )
 
-            swipe_state = {"distance": 0}
-            swipe_threshold = 80
-            max_swipe_angle = 8
-            max_offset = 120
-            
-            def handle_drag_update(e: ft.DragUpdateEvent):
-                state = swipe_state
-                state["distance"] += e.delta_x
-                clamped_distance = min(max(state["distance"], -max_offset*1.5), max_offset*1.5)
-                normalized_distance = min(abs(clamped_distance) / swipe_threshold, 1)
-                rotation_rad = (clamped_distance / max_offset) * (max_swipe_angle * (3.14159 / 180))
-                offset_x = clamped_distance / drag_container.width if drag_container.width else 0
-                drag_container.offset = ft.transform.Offset(offset_x, 0)
-                drag_container.rotate = ft.transform.Rotate(angle=rotation_rad, alignment=ft.alignment.center)
-                drag_container.opacity = 1.0 - (normalized_distance * 0.3)
-                page.update()
-
-            def handle_drag_end(e: ft.DragEndEvent):
-                state = swipe_state
-                final_distance = state["distance"]
-                state["distance"] = 0
-
-                if abs(final_distance) > swipe_threshold:
-                    direction = "right" if final_distance > 0 else "left"
-                    final_offset_x = 1.5 if direction == "right" else -1.5 
-                    final_rotation = max_swipe_angle if direction == "right" else -max_swipe_angle
-                    final_rotation_rad = final_rotation * (3.14159 / 180)
-                    
-                    drag_container.offset = ft.transform.Offset(final_offset_x, 0)
-                    drag_container.rotate = ft.transform.Rotate(angle=final_rotation_rad, alignment=ft.alignment.center)
-                    drag_container.opacity = 0
-                    page.update() 
-                    
-                    process_choice(direction)
-                    
-                else:
-                    drag_container.offset = ft.transform.Offset(0, 0)
-                    drag_container.rotate = ft.transform.Rotate(0)
-                    drag_container.opacity = 1.0
-                    page.update()
-            
-            card_gesture_detector = ft.GestureDetector(
-                mouse_cursor=ft.MouseCursor.MOVE,
-                drag_interval=10,
-                on_horizontal_drag_update=handle_drag_update,
-                on_horizontal_drag_end=handle_drag_end,
-                content=drag_container,
-            )
-            
-            card_controls.append(card_gesture_detector)
+        def show_card():
+            """Shows the current card by updating the existing controls in place.
+
+            Only properties are changed here, never controls replaced, so the next
+            page.update() sends just the values that differ from the previous card.
+            """
+            if not GAME_STATE.get("current_card_id") and GAME_STATE.get("cards"):
+                # A choice without a next card starts the deck over
+                first_card_id = next(iter(GAME_STATE["cards"]))
+                GAME_STATE["current_card_id"] = first_card_id
+                print(f"--- Restarting game with first card: {first_card_id} ---")
+            current_card = get_card(GAME_STATE.get("current_card_id", ""))
+            if not current_card:
+                print("--- No current card, showing Game Over / No Cards screen ---")
+                card_display_area.controls = [
+                    ft.Container(
+                        content=ft.Column([
+                            ft.Text("Game Over" if GAME_STATE.get("history") else "No more cards!", size=24, weight=ft.FontWeight.BOLD),
+                            ft.Text("Thanks for playing!" if GAME_STATE.get("history") else "You've reached the end."),
+                            ft.Container(height=20),
+                            ft.ElevatedButton("Back to Menu", on_click=lambda e: navigate_to("title", container)),
+                        ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=10),
+                        padding=20,
+                        border_radius=10,
+                        width=300,
+                        alignment=ft.alignment.center,
+                    )
+                ]
+                return
+
+            # Use path directly from JSON data
+            card_image_path = current_card.get("image", "")
+            print(f"--- Showing card: {current_card.get('id')} Image path used: {card_image_path} ---") 
+            card_title.value = current_card.get("title", "")
+            card_image.src = card_image_path
+            card_image.visible = bool(card_image_path)
+            # 10 px above and below the image, or a 10 px gap without one
+            card_image_container.padding = ft.padding.symmetric(vertical=10 if card_image_path else 5)
+            card_text.value = current_card.get("text", "")
+
+            # Bring the card back from where the last swipe threw it
+            reset_card_position()
 
             left_choice_data = current_card.get("choices", {}).get("left", {})
             right_choice_data = current_card.get("choices", {}).get("right", {})
-            card_controls.append(
-                ft.Row([
-                        ft.Text(left_choice_data.get("text", "..."), italic=True, color=ft.colors.GREY_500),
-                        ft.Container(width=40, expand=True), # Spacer
-                        ft.Text(right_choice_data.get("text", "..."), italic=True, color=ft.colors.GREY_500),
-                    ],
-                    width=300,
-                    alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
-                )
-            )
+            left_choice_text.value = left_choice_data.get("text", "...")
+            right_choice_text.value = right_choice_data.get("text", "...")
+            card_display_area.controls = [card_gesture_detector, choice_row]
         
         def process_choice(direction):
             global GAME_STATE, GAME_DATA
@@ -388,9 +466,12 @@ def main(page: Page) -> None:
             )
             page.snack_bar.open = True
             
-            print("--- Choice processed, rebuilding game screen for next state ---")
-            show_game_screen(container)
+            print("--- Choice processed, updating game screen for next state ---")
+            show_card()
+            update_resource_indicators()
             page.update()
+            # Sent with the next update, so dragging the new card animates again
+            restore_card_animations()
             
         # --- Assemble Game Screen --- 
         header_container.content = ft.Row([
@@ -399,8 +480,10 @@ def main(page: Page) -> None:
                 ft.Container(width=40) # Balance the back button space
             ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN)
 
+        show_card()
+        # Nothing has been sent yet, so the first card starts animated
+        restore_card_animations()
         update_resource_indicators() # Update the globally defined row
-        card_display_area.controls = card_controls 
 
         container.content = ft.Column([
             header_container,
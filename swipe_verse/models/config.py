@@ -54,7 +54,31 @@ class Theme(BaseModel):
     background: Optional[Union[str, HttpUrl]] = None
     color_scheme: ColorScheme
     resource_icons: Dict[str, Union[str, HttpUrl]]
-    filters: Dict[str, List[str]]
+    # e.g. {"default": "none", "available": ["grayscale", "cartoon"]}, plus
+    # optional named looks chaining several filters, e.g. "noir": ["grayscale", "blur"]
+    filters: Dict[str, Union[str, List[str]]]
+
+    def looks(self) -> Dict[str, List[str]]:
+        """Return the named filter chains defined by the theme."""
+        return {
+            name: list(steps)
+            for name, steps in self.filters.items()
+            if name not in ("default", "available") and isinstance(steps, list)
+        }
+
+    def filter_chain(self, name: Optional[str]) -> List[str]:
+        """
+        Resolve a filter selection to the filters to apply, in order.
+
+        Args:
+            name: A filter name, a named look, or None/"none"
+
+        Returns:
+            List[str]: Filter names (empty for no filter)
+        """
+        if not name or name == "none":
+            return []
+        return self.looks().get(name, [name])
 
 
 class GameInfo(BaseModel):
@@ -79,3 +103,26 @@ class GameConfig(BaseModel):
     theme: Theme
     game_settings: GameSettings
     cards: List[Card]
+
+
+class ThemeSummary(BaseModel):
+    """The parts of a Theme shown before a game is chosen."""
+
+    name: str
+    card_back: Union[str, HttpUrl]
+    resource_icons: Dict[str, Union[str, HttpUrl]]
+
+
+class ScenarioManifest(BaseModel):
+    """
+    Header of a scenario file: enough to list it without loading its cards.
+
+    Built by ScenarioCatalog; shaped like GameConfig for the fields it keeps,
+    so it can stand in for one wherever only those are read.
+    """
+
+    path: str
+    game_info: GameInfo
+    theme: ThemeSummary
+    card_count: int
+    resource_count: int
@@ -79,11 +79,9 @@ class GameState:
     def load_game(cls, save_data: Dict[str, Any], config: GameConfig) -> "GameState":
         """Load game state from saved data and config"""
         # Find the current card by ID
-        current_card = None
-        for card in config.cards:
-            if card.id == save_data["current_card_id"]:
-                current_card = card
-                break
+        from swipe_verse.services.card_store import card_store
+
+        current_card = card_store(config).get(save_data["current_card_id"])
 
         if not current_card:
             # Fallback if card not found
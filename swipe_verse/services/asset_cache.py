@@ -0,0 +1,264 @@
+import base64
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# (mtime_ns, size) of a file, or None when the file does not exist
+FileStamp = Optional[Tuple[int, int]]
+
+
+def file_stamp(path: Union[str, Path]) -> FileStamp:
+    """Return the (mtime_ns, size) stamp of a file, or None if it is missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class _CacheEntry:
+    __slots__ = ("value", "sources", "expires_at")
+
+    def __init__(
+        self,
+        value: str,
+        sources: Dict[str, FileStamp],
+        expires_at: Optional[float],
+    ) -> None:
+        self.value = value
+        self.sources = sources
+        self.expires_at = expires_at
+
+
+class AssetCache:
+    """
+    Bounded LRU mapping of asset keys to resolved local image paths.
+
+    Each entry remembers the (mtime, size) stamp of the files it was derived
+    from and is dropped as soon as any of them changes on disk. Entries for
+    failed loads are stored with a TTL so transient errors are retried.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 256,
+        failure_ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        on_invalidate: Optional[Callable[[str, List[str]], None]] = None,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.failure_ttl = failure_ttl
+        self._clock = clock
+        # Called with (key, source paths) when an entry's sources changed
+        self.on_invalidate = on_invalidate
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached path, validating it against its source files.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[str]: The cached path, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.expires_at is not None and self._clock() >= entry.expires_at:
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        for source, stamp in entry.sources.items():
+            if file_stamp(source) != stamp:
+                del self._entries[key]
+                self.invalidations += 1
+                self.misses += 1
+                if self.on_invalidate is not None:
+                    self.on_invalidate(key, list(entry.sources))
+                return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def put(
+        self,
+        key: str,
+        value: str,
+        sources: Iterable[Union[str, Path]] = (),
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Store a resolved path.
+
+        Args:
+            key: Cache key
+            value: Resolved local path
+            sources: Files the value depends on; a change to any of them
+                (including appearing or disappearing) invalidates the entry
+            ttl: Optional lifetime in seconds
+        """
+        stamps = {str(source): file_stamp(source) for source in sources}
+        expires_at = self._clock() + ttl if ttl is not None else None
+
+        self._entries[key] = _CacheEntry(value, stamps, expires_at)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def put_failure(
+        self, key: str, value: str, sources: Iterable[Union[str, Path]] = ()
+    ) -> None:
+        """Store a fallback path for a failed load, expiring after failure_ttl."""
+        self.put(key, value, sources=sources, ttl=self.failure_ttl)
+
+    def invalidate(self, key: str) -> bool:
+        """Remove a single entry. Returns True if it was present."""
+        return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        self._entries.clear()
+
+    def values(self) -> List[str]:
+        """Return the cached paths, least recently used first."""
+        return [entry.value for entry in self._entries.values()]
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters and current size."""
+        return {
+            "size": len(self._entries),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "expirations": self.expirations,
+        }
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+
+class InlineImageStore:
+    """
+    Byte-budgeted LRU of small images held as base64 strings.
+
+    Lets UI components pass images to Flet via ``src_base64`` instead of a
+    file path, so the client needs no asset-server request for them. Only
+    files up to ``max_item_bytes`` are kept; entries are checked against the
+    file's (mtime, size) stamp before being served. Safe to use from worker
+    threads.
+    """
+
+    def __init__(
+        self, budget: int = 8 * 1024 * 1024, max_item_bytes: int = 128 * 1024
+    ) -> None:
+        if budget < 1:
+            raise ValueError("budget must be at least 1 byte")
+        self.budget = budget
+        self.max_item_bytes = max_item_bytes
+        self._entries: "OrderedDict[str, Tuple[FileStamp, str]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.skipped = 0
+
+    def get(self, path: Union[str, Path]) -> Optional[str]:
+        """
+        Return a file's contents as base64, loading it if it is small enough.
+
+        Args:
+            path: Local image file
+
+        Returns:
+            Optional[str]: Base64-encoded bytes, or None for missing or
+                oversized files
+        """
+        key = str(path)
+        stamp = file_stamp(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        if stamp is None or stamp[1] > self.max_item_bytes:
+            with self._lock:
+                self.skipped += 1
+            return None
+
+        try:
+            with open(key, "rb") as f:
+                encoded = base64.b64encode(f.read()).decode("ascii")
+        except OSError:
+            return None
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous[1])
+            self._entries[key] = (stamp, encoded)
+            self._bytes += len(encoded)
+            while self._bytes > self.budget and self._entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+        return encoded
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return store counters, entry count and bytes held."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "budget": self.budget,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "skipped": self.skipped,
+            }
+
+    def __contains__(self, path: object) -> bool:
+        return str(path) in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
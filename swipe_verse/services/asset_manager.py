@@ -1,18 +1,101 @@
+import functools
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import aiohttp
+from pydantic_core import from_json
+
+from swipe_verse.services.asset_cache import AssetCache, InlineImageStore
+from swipe_verse.services.atlas import Atlas, build_atlas
+from swipe_verse.services.cache_manager import CacheManager
+from swipe_verse.services.image_executor import (
+    PRIORITY_PREFETCH,
+    PRIORITY_VISIBLE,
+    ImageExecutor,
+)
+from swipe_verse.services.image_processor import ImageProcessor
 
 
 class AssetManager:
-    def __init__(self, base_path: str, default_assets_path: str):
+    def __init__(
+        self,
+        base_path: str,
+        default_assets_path: str,
+        cache_size: int = 256,
+        failure_ttl: float = 30.0,
+        max_download_bytes: int = 20 * 1024 * 1024,
+        image_processor: Optional[ImageProcessor] = None,
+        executor: Optional[ImageExecutor] = None,
+        display_density: float = 2.0,
+        cache_manager: Optional[CacheManager] = None,
+    ):
         self.base_path = Path(base_path)
         self.default_assets_path = Path(default_assets_path)
-        # Cache maps a key to the local image path
-        self.cache: Dict[str, str] = {}
+        # Bounded LRU mapping a key to the local image path; entries are
+        # invalidated when their source files change on disk
+        self.cache = AssetCache(
+            capacity=cache_size,
+            failure_ttl=failure_ttl,
+            on_invalidate=self._forget_sources,
+        )
+
+        # Downloads and processed images are tracked by the cache manager
+        # (if any), which bounds their disk usage across runs
+        self.cache_manager = cache_manager
+
+        # Downloads are streamed here in chunks and capped in size
+        if cache_manager is not None:
+            self.download_dir = cache_manager.path("downloads")
+        else:
+            self.download_dir = Path.home() / ".swipe_verse" / "cache"
+        self.download_chunk_size = 64 * 1024
+        self.max_download_bytes = max_download_bytes
+
+        # PIL work runs in a worker pool so it never blocks the event loop
+        self.image_processor = image_processor or ImageProcessor(
+            cache_manager=cache_manager
+        )
+        self.executor = executor or ImageExecutor()
+
+        # Device pixels per logical pixel for display-sized derivatives
+        self.display_density = display_density
+
+        # Small display images held in memory as base64 (see enable_inline_images)
+        self.inline_store: Optional[InlineImageStore] = None
+
+        # Derivatives queued by display_image/sprite_source, with the
+        # callbacks waiting for each
+        self._rendering: Dict[Tuple, List[Callable[[str], None]]] = {}
+        self._render_lock = threading.Lock()
+
+    def enable_inline_images(
+        self, budget: int = 8 * 1024 * 1024, max_item_bytes: int = 128 * 1024
+    ) -> None:
+        """
+        Serve small display images inline (Flet ``src_base64``) from memory.
+
+        Intended for web mode, where every file ``src`` costs a request to
+        the asset server.
+
+        Args:
+            budget: Total bytes of base64 data to keep
+            max_item_bytes: Larger display images are served from the
+                scenario's own (assets-relative) path instead
+        """
+        self.inline_store = InlineImageStore(
+            budget=budget, max_item_bytes=max_item_bytes
+        )
 
     async def get_image(
-        self, image_path: str, filter_type: Optional[str] = None
+        self,
+        image_path: str,
+        filter_type: Optional[str] = None,
+        priority: int = PRIORITY_VISIBLE,
     ) -> str:
         """
         Load an image from filesystem or URL, apply filters if specified,
@@ -21,109 +104,606 @@ class AssetManager:
         Args:
             image_path: Path or URL to the image
             filter_type: Optional type of filter to apply (grayscale, cartoon, etc.)
+            priority: Executor priority for filtering (PRIORITY_VISIBLE or
+                PRIORITY_PREFETCH)
 
         Returns:
             str: Path to the image file that Flet can use
         """
         cache_key = f"{image_path}_{filter_type if filter_type else 'none'}"
 
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
             # Try to load from local path first
-            path = Path(image_path)
-            if path.is_absolute():
-                img_path = path
-            else:
-                img_path = self.base_path / image_path
+            img_path = self._local_path(image_path)
+
+            # Files the result depends on; the requested path is tracked even
+            # when missing so the entry is dropped once it appears
+            sources = [img_path]
 
             if not img_path.exists():
                 # Try to load from URL if it looks like a URL
                 if image_path.startswith(("http://", "https://")):
                     temp_path = await self._download_image(image_path)
                     img_path = temp_path
+                    sources = [img_path]
                 else:
                     # Fall back to default asset
                     default_img = self._get_default_asset_for_type(image_path)
                     img_path = self.default_assets_path / default_img
+                    sources.append(img_path)
 
             # Apply filters if needed
             if filter_type:
-                filtered_path = await self._apply_filter(img_path, filter_type)
-                self.cache[cache_key] = str(filtered_path)
+                filtered_path = await self._apply_filter(
+                    img_path, filter_type, priority=priority
+                )
+                sources.append(filtered_path)
+                self.cache.put(cache_key, str(filtered_path), sources=sources)
                 return str(filtered_path)
 
-            self.cache[cache_key] = str(img_path)
+            self.cache.put(cache_key, str(img_path), sources=sources)
             return str(img_path)
 
         except Exception as e:
             print(f"Error loading image {image_path}: {e}")
-            # Return a default fallback image
+            # Return a default fallback image, retried once failure_ttl expires
             fallback = self.default_assets_path / "card_back.png"
-            self.cache[cache_key] = str(fallback)
+            self.cache.put_failure(cache_key, str(fallback))
             return str(fallback)
 
+    def display_image(
+        self,
+        image_path: str,
+        width: float,
+        height: float,
+        profile: Optional[str] = None,
+        on_ready: Optional[Callable[[str], None]] = None,
+    ) -> str:
+        """
+        Return a copy of an image sized for a width x height display box.
+
+        Used by UI components while building, so it never decodes or encodes
+        an image itself: if the derivative already exists (e.g. it was made by
+        prepare_display_source) its path is returned, otherwise image_path is
+        returned unchanged and the derivative is queued in the image executor.
+        Remote and missing images are also returned unchanged.
+
+        Args:
+            image_path: Path to the image as referenced by the scenario
+            width: Display box width in logical pixels
+            height: Display box height in logical pixels
+            profile: Encoding profile for the use, e.g. "card_art" or "icon"
+            on_ready: Called with the derivative's path once a queued one has
+                been rendered; runs on a worker thread, possibly before this
+                method returns
+
+        Returns:
+            str: Path to the sized image, or image_path unchanged
+        """
+        local_path = self.resolve_local_path(image_path)
+        if local_path is None:
+            return image_path
+        args = (str(local_path), width, height, self.display_density, None, profile)
+        cached = self.image_processor.cached_derivative(*args)
+        if cached is not None:
+            return cached
+        self._render_later(("display",) + args, self.image_processor.derivative, args, on_ready)
+        return image_path
+
+    def display_source(
+        self,
+        image_path: str,
+        width: float,
+        height: float,
+        profile: Optional[str] = None,
+        on_ready: Optional[Callable[[Dict[str, str]], None]] = None,
+    ) -> Dict[str, str]:
+        """
+        Return ft.Image source arguments for a display-sized image.
+
+        Non-blocking like display_image: until the derivative is rendered the
+        arguments point at image_path, and on_ready receives the arguments for
+        the derivative once it is.
+
+        Args:
+            image_path: Path to the image as referenced by the scenario
+            width: Display box width in logical pixels
+            height: Display box height in logical pixels
+            profile: Encoding profile for the use, e.g. "card_art" or "icon"
+            on_ready: Called with the new source arguments (see display_image)
+
+        Returns:
+            Dict[str, str]: {"src_base64": ...} when the image is held inline,
+                otherwise {"src": path}
+        """
+
+        def ready(path: str) -> None:
+            if on_ready is not None:
+                on_ready(self._image_source(path, image_path))
+
+        path = self.display_image(image_path, width, height, profile, on_ready=ready)
+        return self._image_source(path, image_path)
+
+    async def prepare_display_source(
+        self,
+        image_path: str,
+        width: float,
+        height: float,
+        profile: Optional[str] = None,
+        priority: int = PRIORITY_PREFETCH,
+    ) -> Dict[str, str]:
+        """Generate (and inline) a display-sized image in the worker pool ahead of use."""
+        return await self.executor.run(
+            self._render_display_source,
+            image_path,
+            width,
+            height,
+            profile,
+            priority=priority,
+        )
+
+    def _render_display_source(
+        self,
+        image_path: str,
+        width: float,
+        height: float,
+        profile: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """Blocking counterpart of display_source, for the worker pool."""
+        local_path = self.resolve_local_path(image_path)
+        if local_path is None:
+            return {"src": image_path}
+        try:
+            path = self.image_processor.derivative(
+                str(local_path),
+                width,
+                height,
+                density=self.display_density,
+                profile=profile,
+            )
+        except Exception as e:
+            print(f"Error creating display image for {image_path}: {e}")
+            return {"src": image_path}
+        return self._image_source(path, image_path)
+
+    def sprite_source(
+        self,
+        icon_path: str,
+        size: float,
+        frames: int,
+        on_ready: Optional[Callable[[Dict[str, str]], None]] = None,
+    ) -> Optional[Dict[str, str]]:
+        """
+        Return ft.Image source arguments for an icon's fill-level sprite.
+
+        See ImageProcessor.depletion_sprite for the layout. Non-blocking like
+        display_image: a sprite that does not exist yet is queued in the image
+        executor and passed to on_ready once rendered.
+
+        Args:
+            icon_path: Path to the icon as referenced by the scenario
+            size: Frame width and height in logical pixels
+            frames: Number of fill levels
+            on_ready: Called with the source arguments once a queued sprite
+                has been rendered; runs on a worker thread, possibly before
+                this method returns
+
+        Returns:
+            Optional[Dict[str, str]]: Source arguments, or None if the sprite
+                is not ready or cannot be made (remote or unreadable icon)
+        """
+        local_path = self.resolve_local_path(icon_path)
+        if local_path is None:
+            return None
+        args = (str(local_path), size, frames, self.display_density)
+        cached = self.image_processor.cached_depletion_sprite(*args)
+        if cached is not None:
+            return self._generated_source(cached)
+
+        def ready(path: str) -> None:
+            source = self._generated_source(path)
+            if on_ready is not None and source is not None:
+                on_ready(source)
+
+        self._render_later(
+            ("sprite",) + args, self.image_processor.depletion_sprite, args, ready
+        )
+        return None
+
+    async def prepare_sprite_source(
+        self,
+        icon_path: str,
+        size: float,
+        frames: int,
+        priority: int = PRIORITY_PREFETCH,
+    ) -> Optional[Dict[str, str]]:
+        """Generate an icon's fill-level sprite in the worker pool ahead of use."""
+        return await self.executor.run(
+            self._render_sprite_source, icon_path, size, frames, priority=priority
+        )
+
+    def _render_sprite_source(
+        self, icon_path: str, size: float, frames: int
+    ) -> Optional[Dict[str, str]]:
+        """Blocking counterpart of sprite_source, for the worker pool."""
+        local_path = self.resolve_local_path(icon_path)
+        if local_path is None:
+            return None
+        try:
+            path = self.image_processor.depletion_sprite(
+                str(local_path), size, frames=frames, density=self.display_density
+            )
+        except Exception as e:
+            print(f"Error creating fill sprite for {icon_path}: {e}")
+            return None
+        return self._generated_source(path)
+
+    def _render_later(
+        self,
+        key: Tuple,
+        render: Callable[..., str],
+        args: Tuple,
+        on_ready: Optional[Callable[[str], None]],
+    ) -> None:
+        """
+        Queue render(*args) in the image executor, once per key.
+
+        Callers asking for a key that is already queued are added to its
+        callbacks; each receives the rendered path. Failures are printed and
+        the callbacks are not called, so callers keep their fallback image.
+        """
+        with self._render_lock:
+            callbacks = self._rendering.get(key)
+            if callbacks is not None:
+                if on_ready is not None:
+                    callbacks.append(on_ready)
+                return
+            self._rendering[key] = [on_ready] if on_ready is not None else []
+        future = self.executor.submit(render, *args, priority=PRIORITY_VISIBLE)
+        future.add_done_callback(functools.partial(self._rendered, key))
+
+    def _rendered(self, key: Tuple, future: "Future[str]") -> None:
+        with self._render_lock:
+            callbacks = self._rendering.pop(key, [])
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            print(f"Error creating display image for {key[1]}: {error}")
+            return
+        path = future.result()
+        for callback in callbacks:
+            try:
+                callback(path)
+            except Exception as e:
+                print(f"Error updating image {key[1]}: {e}")
+
+    def _image_source(self, path: str, image_path: str) -> Dict[str, str]:
+        """
+        Return ft.Image source arguments for a derivative of image_path.
+
+        Derivatives live in the cache directory, outside the app's assets. In
+        web mode (inline images enabled) the browser cannot fetch them, so a
+        derivative too large to inline is replaced by image_path itself, which
+        is served from the assets directory.
+        """
+        if path == image_path or path.startswith(("http://", "https://")):
+            return {"src": path}
+        source = self._generated_source(path)
+        return source if source is not None else {"src": image_path}
+
+    def _generated_source(self, path: str) -> Optional[Dict[str, str]]:
+        """
+        Return ft.Image source arguments for a file in the cache directory.
+
+        Returns:
+            Optional[Dict[str, str]]: {"src_base64": ...} when inline images
+                are enabled and the file fits, {"src": path} when they are
+                disabled, and None in web mode for files too large to inline
+        """
+        if self.inline_store is None:
+            return {"src": path}
+        encoded = self.inline_store.get(path)
+        if encoded is not None:
+            return {"src_base64": encoded}
+        return None
+
+    def atlas_for(
+        self, images: Dict[str, Tuple[str, Tuple[float, float]]]
+    ) -> Optional[Atlas]:
+        """
+        Pack a set of display images into an atlas (see services.atlas).
+
+        Remote images are left out, so callers should fall back to
+        display_source for keys without a region.
+
+        Args:
+            images: (image path as referenced by the scenario, (width, height)
+                display box in logical pixels) by key
+
+        Returns:
+            Optional[Atlas]: The atlas, or None if nothing could be packed
+        """
+        local_images = {}
+        for key, (image_path, box) in images.items():
+            local_path = self.resolve_local_path(image_path)
+            if local_path is not None and local_path.exists():
+                local_images[key] = (local_path, box)
+        if not local_images:
+            return None
+
+        try:
+            return build_atlas(
+                local_images, self.image_processor, density=self.display_density
+            )
+        except Exception as e:
+            print(f"Error building atlas: {e}")
+            return None
+
+    async def prepare_atlas(
+        self,
+        images: Dict[str, Tuple[str, Tuple[float, float]]],
+        priority: int = PRIORITY_PREFETCH,
+    ) -> Optional[Atlas]:
+        """Build an atlas in the worker pool."""
+        return await self.executor.run(self.atlas_for, images, priority=priority)
+
+    def atlas_page_source(self, atlas: Atlas, page: int) -> Optional[Dict[str, str]]:
+        """
+        Return ft.Image source arguments for an atlas page.
+
+        Returns:
+            Optional[Dict[str, str]]: Source arguments, or None in web mode when
+                the page is too large to inline (see _generated_source)
+        """
+        return self._generated_source(atlas.pages[page])
+
+    def _forget_sources(self, key: str, sources: List[str]) -> None:
+        """Drop processed variants of sources that changed on disk."""
+        for source in sources:
+            self.image_processor.forget(source)
+
+    def resolve_local_path(self, image_path: str) -> Optional[Path]:
+        """
+        Resolve an image reference to a local file the way get_image does,
+        without downloading or filtering.
+
+        Args:
+            image_path: Path or URL to the image
+
+        Returns:
+            Optional[Path]: Local file (or default asset), None for remote URLs
+        """
+        img_path = self._local_path(image_path)
+        if img_path.exists():
+            return img_path
+        if image_path.startswith(("http://", "https://")):
+            return None
+        return self.default_assets_path / self._get_default_asset_for_type(image_path)
+
+    def _local_path(self, image_path: str) -> Path:
+        """Interpret image_path as absolute or relative to base_path."""
+        path = Path(image_path)
+        if path.is_absolute():
+            return path
+        return self.base_path / image_path
+
     async def _download_image(self, url: str) -> Path:
         """
         Download image from URL and save to temp location.
 
+        The file is named by a hash of the full URL, so images with the same
+        name on different hosts or query strings never share a file. A copy
+        downloaded earlier is revalidated with the ETag and Last-Modified
+        date it was served with, and only used as is if the server answers
+        304 Not Modified (or cannot be reached); a copy without validators
+        is downloaded again.
+
+        The body is streamed in chunks to a ``.part`` file which is renamed
+        into place once complete. If a previous transfer was interrupted the
+        partial file is resumed with an HTTP Range request, guarded by
+        If-Range with the ETag (or Last-Modified date) of the first response:
+        if the remote file has changed since, the server sends the whole new
+        body and the download starts over instead of appending to stale bytes.
+
         Args:
             url: URL of the image to download
 
         Returns:
             Path: Path to the downloaded image file
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    content = await response.read()
-                    # Create a temp file path
-                    temp_dir = Path.home() / ".swipe_verse" / "cache"
-                    temp_dir.mkdir(parents=True, exist_ok=True)
+        self.download_dir.mkdir(parents=True, exist_ok=True)
 
-                    filename = url.split("/")[-1]
-                    temp_path = temp_dir / filename
+        temp_path = self._download_path(url)
+        part_path = temp_path.with_name(temp_path.name + ".part")
+        # Validator of the response the .part file came from, for If-Range
+        validator_path = temp_path.with_name(temp_path.name + ".part.validator")
+        # Validators of the completed download, for revalidation
+        meta_path = temp_path.with_name(temp_path.name + ".meta.json")
+        meta = self._read_download_meta(meta_path, temp_path)
 
-                    with open(temp_path, "wb") as f:
-                        f.write(content)
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        validator = self._read_validator(validator_path) if offset else None
+        headers = {}
+        if offset and validator:
+            headers = {"Range": f"bytes={offset}-", "If-Range": validator}
+        else:
+            # A partial file that cannot be validated is not resumed
+            offset = 0
+            if meta is not None:
+                if meta.get("etag"):
+                    headers["If-None-Match"] = meta["etag"]
+                if meta.get("last_modified"):
+                    headers["If-Modified-Since"] = meta["last_modified"]
 
-                    return temp_path
-                else:
-                    raise Exception(
-                        f"Failed to download {url}, status {response.status}"
-                    )
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 304 and meta is not None:
+                        if self.cache_manager is not None:
+                            self.cache_manager.record_hit("downloads", temp_path)
+                        return temp_path
+                    if response.status == 206 and offset:
+                        # Only append if the server resumed exactly where we stopped
+                        if self._content_range_start(response) != offset:
+                            self._discard_partial(part_path, validator_path)
+                            raise Exception(f"Server ignored resume offset for {url}")
+                        mode = "ab"
+                    elif response.status == 200:
+                        # Full body (the remote file changed, or the server does
+                        # not support ranges): start over
+                        offset = 0
+                        mode = "wb"
+                        self._write_validator(validator_path, response)
+                    else:
+                        if response.status == 416:
+                            # Partial file no longer matches the remote one
+                            self._discard_partial(part_path, validator_path)
+                        raise Exception(
+                            f"Failed to download {url}, status {response.status}"
+                        )
+
+                    if not response.content_type.startswith("image/"):
+                        raise Exception(
+                            f"Refusing to download {url}: unexpected content type "
+                            f"{response.content_type}"
+                        )
+
+                    expected = response.content_length
+                    if expected is not None and offset + expected > self.max_download_bytes:
+                        self._discard_partial(part_path, validator_path)
+                        raise Exception(
+                            f"Refusing to download {url}: {offset + expected} bytes "
+                            f"exceeds limit of {self.max_download_bytes}"
+                        )
+
+                    received = offset
+                    with open(part_path, mode) as f:
+                        async for chunk in response.content.iter_chunked(
+                            self.download_chunk_size
+                        ):
+                            received += len(chunk)
+                            if received > self.max_download_bytes:
+                                f.close()
+                                self._discard_partial(part_path, validator_path)
+                                raise Exception(
+                                    f"Download of {url} exceeded limit of "
+                                    f"{self.max_download_bytes} bytes"
+                                )
+                            f.write(chunk)
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+        except aiohttp.ClientError as e:
+            if meta is None:
+                raise
+            print(f"Could not revalidate {url}, using downloaded copy: {e}")
+            if self.cache_manager is not None:
+                self.cache_manager.record_hit("downloads", temp_path)
+            return temp_path
 
-    async def _apply_filter(self, img_path: Path, filter_type: str) -> Path:
+        # Atomic rename so readers never see a half-written image
+        os.replace(part_path, temp_path)
+        validator_path.unlink(missing_ok=True)
+        meta_path.write_text(
+            json.dumps(
+                {
+                    "url": url,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "size": temp_path.stat().st_size,
+                }
+            ),
+            encoding="utf-8",
+        )
+        if self.cache_manager is not None:
+            self.cache_manager.record_miss("downloads", temp_path)
+        return temp_path
+
+    def _download_path(self, url: str) -> Path:
+        """File a URL is downloaded to: a hash of the URL plus its extension."""
+        key = hashlib.blake2b(url.encode(), digest_size=12).hexdigest()
+        suffix = Path(url.split("?")[0].split("#")[0]).suffix.lower()
+        if not suffix.isascii() or not suffix[1:].isalnum():
+            suffix = ""
+        return self.download_dir / f"{key}{suffix}"
+
+    @staticmethod
+    def _read_download_meta(meta_path: Path, temp_path: Path) -> Optional[Dict[str, Any]]:
+        """Return the validators of a completed download, if they describe it."""
+        try:
+            with open(meta_path, "rb") as f:
+                meta = from_json(f.read())
+            if meta["size"] != temp_path.stat().st_size:
+                return None
+            if not (meta.get("etag") or meta.get("last_modified")):
+                return None
+            return dict(meta)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    @staticmethod
+    def _read_validator(validator_path: Path) -> Optional[str]:
+        """Return the saved If-Range validator for a partial download, if any."""
+        try:
+            return validator_path.read_text(encoding="utf-8").strip() or None
+        except OSError:
+            return None
+
+    @staticmethod
+    def _write_validator(validator_path: Path, response: aiohttp.ClientResponse) -> None:
+        """Save the ETag (preferred) or Last-Modified date of a full response."""
+        etag = response.headers.get("ETag")
+        if etag and etag.startswith("W/"):
+            # If-Range only accepts strong validators
+            etag = None
+        validator = etag or response.headers.get("Last-Modified")
+        if validator:
+            validator_path.write_text(validator, encoding="utf-8")
+        else:
+            validator_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _discard_partial(part_path: Path, validator_path: Path) -> None:
+        """Remove a partial download and its validator."""
+        part_path.unlink(missing_ok=True)
+        validator_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _content_range_start(response: aiohttp.ClientResponse) -> Optional[int]:
+        """Parse the first byte offset from a Content-Range header."""
+        content_range = response.headers.get("Content-Range", "")
+        try:
+            # Format: "bytes <start>-<end>/<total>"
+            return int(content_range.split()[1].split("-")[0])
+        except (IndexError, ValueError):
+            return None
+
+    async def _apply_filter(
+        self, img_path: Path, filter_type: str, priority: int = PRIORITY_VISIBLE
+    ) -> Path:
         """
         Apply a filter to an image and save the result.
 
         Args:
             img_path: Path to the image file
             filter_type: Type of filter to apply (pixelate, cartoon, posterize, blur, grayscale)
+            priority: Executor priority for the job
 
         Returns:
             Path: Path to the filtered image
         """
-        # Get image processor from app
-        from swipe_verse.services.image_processor import ImageProcessor
-
-        processor = ImageProcessor()
-
-        # Create output directory
-        output_dir = Path.home() / ".swipe_verse" / "filtered"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        output_path = output_dir / f"{img_path.stem}_{filter_type}{img_path.suffix}"
-
-        # Check if filtered image already exists
-        if output_path.exists():
-            return output_path
-
-        # Process the image using ImageProcessor
+        # Process the image using ImageProcessor, which caches the result
         try:
-            # Use the image processor service
-            processed_path = processor.process_image(
-                str(img_path), filter_name=filter_type
+            # Decode, filter and encode in the worker pool
+            processed_path = await self.executor.run(
+                self.image_processor.process_image,
+                str(img_path),
+                filter_type,
+                priority=priority,
             )
             return Path(processed_path)
         except Exception as e:
@@ -0,0 +1,209 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, TypedDict
+
+from PIL import Image
+
+from swipe_verse.services.image_encoding import output_suffix, resolve_profile, save_image
+from swipe_verse.services.image_processor import ImageProcessor
+
+# Bumped when the index layout or packing changes, so old atlases are rebuilt
+ATLAS_VERSION = 1
+
+
+class AtlasRegion(TypedDict):
+    page: int
+    x: int
+    y: int
+    w: int
+    h: int
+
+
+class Atlas:
+    """
+    A set of atlas page images plus the region of each packed image.
+
+    Regions are in atlas pixels; a UI shows one by scaling the page and
+    clipping to the region (see ui.components.atlas_image.AtlasImage).
+    """
+
+    def __init__(
+        self,
+        pages: List[str],
+        page_sizes: List[Tuple[int, int]],
+        regions: Dict[str, AtlasRegion],
+    ) -> None:
+        self.pages = pages
+        self.page_sizes = page_sizes
+        self.regions = regions
+
+    def region(self, key: str) -> Optional[AtlasRegion]:
+        """Return the region for a key, or None if it was not packed."""
+        return self.regions.get(key)
+
+    def save(self, index_path: Path) -> None:
+        """Write the index as JSON (atomically)."""
+        data = {
+            "version": ATLAS_VERSION,
+            "pages": self.pages,
+            "page_sizes": self.page_sizes,
+            "regions": self.regions,
+        }
+        tmp_path = index_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, index_path)
+
+    @classmethod
+    def load(cls, index_path: Path) -> Optional["Atlas"]:
+        """Read an index, returning None if it is missing, stale or incomplete."""
+        try:
+            with open(index_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != ATLAS_VERSION:
+            return None
+        if not all(Path(page).exists() for page in data["pages"]):
+            return None
+        return cls(
+            pages=data["pages"],
+            page_sizes=[tuple(size) for size in data["page_sizes"]],
+            regions=data["regions"],
+        )
+
+
+def pack_shelves(
+    sizes: Dict[str, Tuple[int, int]], max_side: int = 2048, padding: int = 2
+) -> Tuple[Dict[str, AtlasRegion], List[Tuple[int, int]]]:
+    """
+    Pack rectangles onto pages using shelf packing.
+
+    Rectangles are placed tallest first, left to right along shelves; a new
+    shelf starts when a row is full and a new page when a page is full.
+
+    Args:
+        sizes: Rectangle (width, height) by key
+        max_side: Maximum page width and height
+        padding: Gap around each rectangle, to avoid bleeding when scaled
+
+    Returns:
+        Tuple: Regions by key, and the used (width, height) of each page
+
+    Raises:
+        ValueError: If a rectangle does not fit on an empty page
+    """
+    regions: Dict[str, AtlasRegion] = {}
+    pages: List[Tuple[int, int]] = []
+
+    page = -1
+    x = y = shelf_height = page_width = 0
+    order = sorted(sizes, key=lambda key: (-sizes[key][1], -sizes[key][0], key))
+    for key in order:
+        width, height = sizes[key]
+        if width + 2 * padding > max_side or height + 2 * padding > max_side:
+            raise ValueError(f"Image {key} ({width}x{height}) exceeds the atlas size")
+
+        if page >= 0 and x + width + 2 * padding > max_side:
+            # Next shelf
+            x = 0
+            y += shelf_height
+            shelf_height = 0
+        if page < 0 or y + height + 2 * padding > max_side:
+            # Next page
+            if page >= 0:
+                pages[page] = (page_width, y + shelf_height)
+            page += 1
+            pages.append((0, 0))
+            x = y = shelf_height = page_width = 0
+
+        regions[key] = {"page": page, "x": x + padding, "y": y + padding, "w": width, "h": height}
+        x += width + 2 * padding
+        shelf_height = max(shelf_height, height + 2 * padding)
+        page_width = max(page_width, x)
+
+    if page >= 0:
+        pages[page] = (page_width, y + shelf_height)
+    return regions, pages
+
+
+def build_atlas(
+    images: Dict[str, Tuple[Path, Tuple[float, float]]],
+    processor: ImageProcessor,
+    density: float = 1.0,
+    max_side: int = 2048,
+    padding: int = 2,
+    profile: str = "card_art",
+) -> Atlas:
+    """
+    Pack images, each scaled to fit its display box, into atlas pages.
+
+    The result is cached in the processor's cache directory under a digest
+    of the sources' contents and the packing parameters, so rebuilding an
+    unchanged theme only reads the index.
+
+    Args:
+        images: (source path, (width, height) display box) by key
+        processor: ImageProcessor providing the cache directory and digests
+        density: Device pixels per logical pixel
+        max_side: Maximum page width and height in pixels
+        padding: Gap around each image in pixels
+        profile: Encoding profile for the pages; the default suits a mix of
+            card art and icons (lossy WebP keeps alpha)
+
+    Returns:
+        Atlas: The pages and regions
+    """
+    boxes: Dict[str, Tuple[int, int]] = {
+        key: (max(1, round(box[0] * density)), max(1, round(box[1] * density)))
+        for key, (_, box) in images.items()
+    }
+
+    signature = hashlib.blake2b(digest_size=12)
+    signature.update(f"{ATLAS_VERSION}:{max_side}:{padding}:{profile}".encode())
+    for key in sorted(images):
+        digest = processor.source_digest(images[key][0])
+        signature.update(f"|{key}:{digest}:{boxes[key][0]}x{boxes[key][1]}".encode())
+    name = f"atlas_{signature.hexdigest()}"
+    index_path = processor.cache_dir / f"{name}.json"
+
+    atlas = Atlas.load(index_path)
+    if atlas is not None:
+        if processor.cache_manager is not None:
+            for page_file in atlas.pages:
+                processor.cache_manager.record_hit("images", Path(page_file))
+        return atlas
+
+    thumbnails: Dict[str, Image.Image] = {}
+    for key, (path, _) in images.items():
+        thumb = processor.open_source(path, boxes[key]).convert("RGBA")
+        thumb.thumbnail(boxes[key], Image.Resampling.LANCZOS, reducing_gap=2.0)
+        thumbnails[key] = thumb
+
+    regions, page_sizes = pack_shelves(
+        {key: thumb.size for key, thumb in thumbnails.items()},
+        max_side=max_side,
+        padding=padding,
+    )
+
+    encoding = resolve_profile(profile)
+    suffix = output_suffix(encoding, ".png")
+    pages: List[str] = []
+    for index, size in enumerate(page_sizes):
+        page = Image.new("RGBA", size, (0, 0, 0, 0))
+        for key, region in regions.items():
+            if region["page"] == index:
+                page.paste(thumbnails[key], (region["x"], region["y"]))
+        page_path = processor.cache_dir / f"{name}_{index}{suffix}"
+        save_image(page, page_path, encoding)
+        pages.append(str(page_path))
+
+    atlas = Atlas(pages=pages, page_sizes=page_sizes, regions=regions)
+    atlas.save(index_path)
+    if processor.cache_manager is not None:
+        for page_path in map(Path, pages):
+            processor.cache_manager.record_miss("images", page_path)
+        processor.cache_manager.record_miss("images", index_path)
+    return atlas
@@ -0,0 +1,349 @@
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, TypedDict
+
+# Cache namespaces and their directories under the cache root. The
+# directory names are the ones used before the caches were unified.
+NAMESPACES: Dict[str, str] = {
+    "downloads": "cache",
+    "images": "image_cache",
+    "configs": "config_cache",
+}
+
+# Directories that older versions created but nothing reads any more
+LEGACY_DIRS = ("filtered",)
+
+INDEX_NAME = "cache_index.json"
+INDEX_VERSION = 1
+
+# Bookkeeping files kept in namespace directories that are never evicted
+PROTECTED_FILES = ("digest_index.json", "prerender_manifest.json")
+
+
+class CacheEntry(TypedDict):
+    namespace: str
+    size: int
+    accessed: float
+
+
+class CacheManager:
+    """
+    Tracks the files cached under ``~/.swipe_verse`` in one index.
+
+    Each component writes to its own namespace directory and reports hits
+    and new files here. ``gc`` removes files not used within ``max_age``
+    and then the least recently used files until the total fits ``budget``.
+
+    Files written without the manager (e.g. by pre-render workers) are
+    picked up by ``scan``, which ``stats`` and ``gc`` run first. Eviction
+    only happens in ``gc`` and ``clear``. The app runs ``gc`` on a
+    background thread at startup and the ``swipe-verse cache`` command runs
+    either on demand, so a file can be removed while a running app still
+    holds its path; components check that a remembered path still exists
+    before returning it.
+    """
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        budget: int = 512 * 1024 * 1024,
+        max_age: float = 30 * 24 * 3600,
+        save_interval: float = 5.0,
+    ) -> None:
+        self.root = Path(root) if root else Path.home() / ".swipe_verse"
+        self.budget = budget
+        self.max_age = max_age
+        self.save_interval = save_interval
+
+        self._lock = threading.Lock()
+        self._entries: Dict[str, CacheEntry] = {}
+        self._counters: Dict[str, Dict[str, int]] = {
+            namespace: {"hits": 0, "misses": 0} for namespace in NAMESPACES
+        }
+        self._dirty = False
+        self._last_save = 0.0
+        self._load()
+
+    def path(self, namespace: str) -> Path:
+        """
+        Return (creating it) the directory for a namespace.
+
+        Raises:
+            ValueError: If the namespace is unknown
+        """
+        if namespace not in NAMESPACES:
+            raise ValueError(f"Unknown cache namespace: {namespace}")
+        directory = self.root / NAMESPACES[namespace]
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory
+
+    def lookup(self, namespace: str, path: Path) -> bool:
+        """
+        Check whether a cached file exists, recording a hit or a miss.
+
+        Args:
+            namespace: Cache namespace
+            path: Cached file
+
+        Returns:
+            bool: True if the file exists
+        """
+        if Path(path).exists():
+            self.record_hit(namespace, path)
+            return True
+        with self._lock:
+            self._counters[namespace]["misses"] += 1
+            key = self._key(path)
+            if key is not None:
+                self._entries.pop(key, None)
+            due = self._changed()
+        if due:
+            self.save()
+        return False
+
+    def record_hit(self, namespace: str, path: Path) -> None:
+        """Record that a cached file was used."""
+        with self._lock:
+            self._counters[namespace]["hits"] += 1
+            key = self._key(path)
+            if key is not None and key in self._entries:
+                self._entries[key]["accessed"] = time.time()
+            due = self._changed()
+        if due:
+            self.save()
+
+    def record_miss(self, namespace: str, path: Path) -> None:
+        """Record a file that was just written to the cache."""
+        try:
+            size = os.stat(path).st_size
+        except OSError:
+            return
+        with self._lock:
+            self._counters[namespace]["misses"] += 1
+            key = self._key(path)
+            if key is not None:
+                self._entries[key] = {
+                    "namespace": namespace,
+                    "size": size,
+                    "accessed": time.time(),
+                }
+            due = self._changed()
+        if due:
+            self.save()
+
+    def scan(self) -> None:
+        """Bring the index in line with the files on disk."""
+        found: Dict[str, CacheEntry] = {}
+        for namespace, dirname in NAMESPACES.items():
+            directory = self.root / dirname
+            if not directory.is_dir():
+                continue
+            for dir_entry in os.scandir(directory):
+                if not dir_entry.is_file() or dir_entry.name in PROTECTED_FILES:
+                    continue
+                st = dir_entry.stat()
+                found[self._key(Path(dir_entry.path)) or dir_entry.path] = {
+                    "namespace": namespace,
+                    "size": st.st_size,
+                    "accessed": st.st_mtime,
+                }
+
+        with self._lock:
+            for key, entry in found.items():
+                known = self._entries.get(key)
+                if known is not None:
+                    # Keep the recorded access time, refresh the size
+                    entry["accessed"] = max(known["accessed"], entry["accessed"])
+            self._entries = found
+            self._dirty = True
+
+    def stats(self) -> Dict:
+        """
+        Return disk usage and hit counts per namespace.
+
+        Returns:
+            Dict: Totals plus a "namespaces" dict of files, bytes, hits,
+                misses and hit_rate
+        """
+        self.scan()
+        with self._lock:
+            namespaces = {}
+            for namespace in NAMESPACES:
+                entries = [
+                    entry
+                    for entry in self._entries.values()
+                    if entry["namespace"] == namespace
+                ]
+                hits = self._counters[namespace]["hits"]
+                misses = self._counters[namespace]["misses"]
+                namespaces[namespace] = {
+                    "files": len(entries),
+                    "bytes": sum(entry["size"] for entry in entries),
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                }
+        return {
+            "root": str(self.root),
+            "budget": self.budget,
+            "max_age": self.max_age,
+            "files": sum(ns["files"] for ns in namespaces.values()),
+            "bytes": sum(ns["bytes"] for ns in namespaces.values()),
+            "namespaces": namespaces,
+        }
+
+    def gc(
+        self,
+        budget: Optional[int] = None,
+        max_age: Optional[float] = None,
+        now: Optional[float] = None,
+    ) -> Dict[str, int]:
+        """
+        Evict expired files, then least recently used files over budget.
+
+        Also removes legacy cache directories.
+
+        Args:
+            budget: Size budget in bytes (default: self.budget)
+            max_age: Seconds since last use before a file expires
+                (default: self.max_age)
+            now: Current time, for tests
+
+        Returns:
+            Dict[str, int]: Number of files and bytes removed
+        """
+        budget = self.budget if budget is None else budget
+        max_age = self.max_age if max_age is None else max_age
+        now = time.time() if now is None else now
+
+        removed = self._remove_legacy_dirs()
+        self.scan()
+        with self._lock:
+            by_age = sorted(self._entries.items(), key=lambda item: item[1]["accessed"])
+            total = sum(entry["size"] for entry in self._entries.values())
+            victims = []
+            for key, entry in by_age:
+                if entry["accessed"] < now - max_age or total > budget:
+                    victims.append(key)
+                    total -= entry["size"]
+            for key in victims:
+                removed["bytes"] += self._remove(key)
+                removed["files"] += 1
+        self.save()
+        return removed
+
+    def clear(self, namespace: Optional[str] = None) -> Dict[str, int]:
+        """
+        Remove every cached file, or those of one namespace, and reset
+        its hit counts.
+
+        Returns:
+            Dict[str, int]: Number of files and bytes removed
+        """
+        if namespace is not None and namespace not in NAMESPACES:
+            raise ValueError(f"Unknown cache namespace: {namespace}")
+
+        removed = {"files": 0, "bytes": 0}
+        if namespace is None:
+            removed = self._remove_legacy_dirs()
+        self.scan()
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if namespace is None or entry["namespace"] == namespace:
+                    removed["bytes"] += self._remove(key)
+                    removed["files"] += 1
+            for name in [namespace] if namespace else NAMESPACES:
+                self._counters[name] = {"hits": 0, "misses": 0}
+        self.save()
+        return removed
+
+    def flush(self) -> None:
+        """Save the index if anything changed since the last save."""
+        if self._dirty:
+            self.save()
+
+    def save(self) -> None:
+        """Write the index (atomically)."""
+        with self._lock:
+            data = {
+                "version": INDEX_VERSION,
+                "entries": dict(self._entries),
+                "counters": {ns: dict(c) for ns, c in self._counters.items()},
+            }
+            self._dirty = False
+            self._last_save = time.monotonic()
+
+        index_path = self.root / INDEX_NAME
+        tmp_path = index_path.with_name(f"{INDEX_NAME}.{os.getpid()}.tmp")
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            # The index only drives eviction order and stats; scan rebuilds it
+            print(f"Error saving cache index: {e}")
+
+    def _load(self) -> None:
+        try:
+            with open(self.root / INDEX_NAME, "r") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        self._entries = {
+            key: entry
+            for key, entry in data.get("entries", {}).items()
+            if entry.get("namespace") in NAMESPACES
+        }
+        for namespace, counters in data.get("counters", {}).items():
+            if namespace in self._counters:
+                self._counters[namespace].update(counters)
+
+    def _changed(self) -> bool:
+        """Mark the index dirty; True if it is due to be saved (at most
+        every save_interval seconds). Called with the lock held."""
+        self._dirty = True
+        if time.monotonic() - self._last_save < self.save_interval:
+            return False
+        # Claim this save so concurrent callers do not write too
+        self._last_save = time.monotonic()
+        return True
+
+    def _key(self, path: Path) -> Optional[str]:
+        """Index key for a path: relative to the root, or None if outside it."""
+        try:
+            relative = Path(os.path.abspath(path)).relative_to(os.path.abspath(self.root))
+            return relative.as_posix()
+        except ValueError:
+            return None
+
+    def _remove(self, key: str) -> int:
+        # Called with the lock held
+        entry = self._entries.pop(key)
+        try:
+            os.unlink(self.root / key)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error removing cached file {key}: {e}")
+            return 0
+        return entry["size"]
+
+    def _remove_legacy_dirs(self) -> Dict[str, int]:
+        removed = {"files": 0, "bytes": 0}
+        for dirname in LEGACY_DIRS:
+            directory = self.root / dirname
+            if not directory.is_dir():
+                continue
+            for path in directory.rglob("*"):
+                if path.is_file():
+                    removed["files"] += 1
+                    removed["bytes"] += path.stat().st_size
+            shutil.rmtree(directory, ignore_errors=True)
+        return removed
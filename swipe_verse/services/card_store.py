@@ -0,0 +1,364 @@
+import json
+import mmap
+import random
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+    overload,
+)
+
+from pydantic_core import from_json
+
+from swipe_verse.models.config import Card, GameConfig
+
+# Bytes decoded per read while indexing a scenario file
+CHUNK_SIZE = 1024 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class CardStore(Sequence[Card]):
+    """
+    The cards of a scenario, by position and by id.
+
+    Wraps the list of a fully loaded GameConfig. LazyCardStore has the same
+    interface for scenarios whose cards are read from disk on demand.
+    """
+
+    def __init__(self, cards: List[Card]) -> None:
+        self._cards = cards
+        self._by_id: Dict[str, Card] = {}
+        for card in cards:
+            # The first card wins when ids repeat, as in a linear search
+            self._by_id.setdefault(card.id, card)
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    @overload
+    def __getitem__(self, index: int) -> Card: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Card]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Card, List[Card]]:
+        return self._cards[index]
+
+    def ids(self) -> List[str]:
+        """Return the card ids, in deck order."""
+        return [card.id for card in self._cards]
+
+    def get(self, card_id: str) -> Optional[Card]:
+        """Return the card with the given id, or None."""
+        return self._by_id.get(card_id)
+
+    def random_card(
+        self,
+        condition: Optional[Callable[[Card], bool]] = None,
+        skip_ids: Collection[str] = (),
+    ) -> Optional[Card]:
+        """
+        Pick a random card.
+
+        Args:
+            condition: Only pick cards for which this returns True
+            skip_ids: Ids never to pick (checked before the condition)
+
+        Returns:
+            Optional[Card]: The card, or None if no card qualifies
+        """
+        available = [
+            card
+            for card in self._cards
+            if card.id not in skip_ids and (condition is None or condition(card))
+        ]
+        return random.choice(available) if available else None
+
+
+class LazyCardStore(CardStore):
+    """
+    Cards read from a scenario file on demand.
+
+    Holds only each card's id and byte span in the file; a card is parsed
+    and validated when first used and kept in a small LRU cache, so memory
+    grows with the cards in play rather than the size of the deck. The file
+    must not change while the store is in use.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        spans: Dict[str, Tuple[int, int]],
+        ids: List[str],
+        cache_size: int = 128,
+    ) -> None:
+        self.path = Path(path)
+        self.cache_size = cache_size
+        self._spans = spans
+        self._ids = ids
+        self._cache: "OrderedDict[str, Card]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._file = open(self.path, "rb")
+        self.loads = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @overload
+    def __getitem__(self, index: int) -> Card: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Card]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Card, List[Card]]:
+        if isinstance(index, slice):
+            return [self._load(card_id) for card_id in self._ids[index]]
+        return self._load(self._ids[index])
+
+    def __iter__(self) -> Iterator[Card]:
+        for card_id in self._ids:
+            yield self._load(card_id)
+
+    def ids(self) -> List[str]:
+        return list(self._ids)
+
+    def get(self, card_id: str) -> Optional[Card]:
+        if card_id not in self._spans:
+            return None
+        return self._load(card_id)
+
+    def random_card(
+        self,
+        condition: Optional[Callable[[Card], bool]] = None,
+        skip_ids: Collection[str] = (),
+    ) -> Optional[Card]:
+        # Try a few random draws first: with a large deck nearly every card
+        # qualifies, and this avoids listing the whole deck each turn
+        for _ in range(8):
+            if not self._ids:
+                return None
+            card_id = self._ids[random.randrange(len(self._ids))]
+            if card_id in skip_ids:
+                continue
+            card = self._load(card_id)
+            if condition is None or condition(card):
+                return card
+
+        candidates = [card_id for card_id in self._ids if card_id not in skip_ids]
+        random.shuffle(candidates)
+        for card_id in candidates:
+            card = self._load(card_id)
+            if condition is None or condition(card):
+                return card
+        return None
+
+    def close(self) -> None:
+        """Close the scenario file."""
+        with self._lock:
+            self._file.close()
+
+    def _load(self, card_id: str) -> Card:
+        with self._lock:
+            card = self._cache.get(card_id)
+            if card is not None:
+                self._cache.move_to_end(card_id)
+                return card
+            start, end = self._spans[card_id]
+            self._file.seek(start)
+            data = self._file.read(end - start)
+
+        card = Card.model_validate_json(data)
+        with self._lock:
+            self.loads += 1
+            self._cache[card_id] = card
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return card
+
+
+def card_store(config: GameConfig) -> CardStore:
+    """Return the store for a config's cards (wrapping a plain list)."""
+    cards = config.cards
+    if isinstance(cards, CardStore):
+        return cards
+    return CardStore(cards)
+
+
+class _JsonStream:
+    """
+    Reads consecutive JSON values from a byte buffer, a window at a time.
+
+    Windows are decoded as latin-1 so that string offsets are byte offsets;
+    JSON syntax is ASCII, so this finds the same value boundaries as UTF-8,
+    but strings with non-ASCII characters decode wrongly and must be
+    re-read from their bytes.
+    """
+
+    def __init__(self, buffer: Any, chunk_size: int = CHUNK_SIZE) -> None:
+        self.buffer = buffer
+        self.size = len(buffer)
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.base = 0
+        self.window = ""
+        # Absolute byte offset of the next unread character
+        self.pos = 0
+
+    def _fill(self, size: int) -> None:
+        self.base = self.pos
+        self.window = self.buffer[self.pos : self.pos + size].decode("latin-1")
+
+    def skip_whitespace(self) -> None:
+        while True:
+            index = self.pos - self.base
+            if index >= len(self.window):
+                if self.pos >= self.size:
+                    return
+                self._fill(self.chunk_size)
+                continue
+            end = _WHITESPACE.match(self.window, index).end()  # type: ignore[union-attr]
+            self.pos = self.base + end
+            if end < len(self.window):
+                return
+
+    def peek(self) -> str:
+        self.skip_whitespace()
+        if self.pos >= self.size:
+            raise ValueError("Unexpected end of scenario file")
+        return self.window[self.pos - self.base]
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if char not in chars:
+            raise ValueError(f"Expected one of {chars!r} at byte {self.pos}")
+        self.pos += 1
+        return char
+
+    def value(self) -> Tuple[Any, int, int]:
+        """Decode the next value; returns it with its byte span."""
+        self.skip_whitespace()
+        size = self.chunk_size
+        while True:
+            index = self.pos - self.base
+            window_end = self.base + len(self.window)
+            try:
+                value, end = self.decoder.raw_decode(self.window, index)
+            except json.JSONDecodeError as e:
+                if window_end >= self.size:
+                    raise ValueError(f"Invalid JSON at byte {self.pos}: {e}") from e
+            else:
+                # A number ending at the window edge may continue past it
+                if end < len(self.window) or window_end >= self.size:
+                    start = self.pos
+                    self.pos = self.base + end
+                    return value, start, self.pos
+            # The value runs past the window: read a larger one
+            size = max(size * 2, 2 * (window_end - self.pos))
+            self._fill(size)
+
+
+def index_cards(
+    buffer: Any, chunk_size: int = CHUNK_SIZE
+) -> Tuple[Dict[str, Any], Dict[str, Tuple[int, int]], List[str]]:
+    """
+    Parse a scenario's top-level fields and index its cards.
+
+    Fields other than "cards" are parsed; each card is decoded only to read
+    its id and is then dropped, keeping its byte span.
+
+    Args:
+        buffer: The scenario file's bytes (e.g. an mmap)
+        chunk_size: Bytes decoded at a time (grown for larger values)
+
+    Returns:
+        Tuple: (top-level fields except "cards", byte span by card id,
+            card ids in deck order)
+
+    Raises:
+        ValueError: If the file is not a JSON object, has no cards array
+            or a card has no id
+    """
+    stream = _JsonStream(buffer, chunk_size)
+    header: Dict[str, Any] = {}
+    spans: Dict[str, Tuple[int, int]] = {}
+    ids: List[str] = []
+
+    found_cards = False
+    stream.expect("{")
+    while stream.peek() != "}":
+        key, start, end = stream.value()
+        if not isinstance(key, str):
+            raise ValueError(f"Expected a key at byte {start}")
+        key = from_json(buffer[start:end]) if not key.isascii() else key
+        stream.expect(":")
+
+        if key == "cards":
+            found_cards = True
+            stream.expect("[")
+            if stream.peek() == "]":
+                stream.expect("]")
+            else:
+                while True:
+                    card, start, end = stream.value()
+                    card_id = card.get("id") if isinstance(card, dict) else None
+                    if not isinstance(card_id, str):
+                        raise ValueError(f"Card without an id at byte {start}")
+                    if not card_id.isascii():
+                        card_id = from_json(buffer[start:end])["id"]
+                    if card_id not in spans:
+                        spans[card_id] = (start, end)
+                        ids.append(card_id)
+                    if stream.expect(",]") == "]":
+                        break
+        else:
+            _, start, end = stream.value()
+            header[key] = from_json(buffer[start:end])
+
+        if stream.expect(",}") == "}":
+            break
+    else:
+        stream.expect("}")
+
+    if not found_cards:
+        raise ValueError("Scenario has no cards")
+    return header, spans, ids
+
+
+def open_scenario(path: Path, cache_size: int = 128) -> GameConfig:
+    """
+    Load a scenario with its cards left on disk.
+
+    game_info, theme and game_settings are validated now; ``config.cards``
+    is a LazyCardStore, which reads and validates each card when used.
+    Such a config is for playing: it is not meant to be pickled or dumped.
+
+    Args:
+        path: Scenario file
+        cache_size: Number of parsed cards to keep in memory
+
+    Returns:
+        GameConfig: The configuration, with lazily loaded cards
+    """
+    with open(path, "rb") as f:
+        if not f.seek(0, 2):
+            raise ValueError(f"Scenario file is empty: {path}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            header, spans, ids = index_cards(buffer)
+
+    config = GameConfig.model_validate({**header, "cards": []})
+    # Not a list, but a Sequence[Card] like one; validation would copy it
+    config.cards = cast(List[Card], LazyCardStore(path, spans, ids, cache_size))
+    return config
@@ -0,0 +1,172 @@
+import functools
+import gc
+import hashlib
+import json
+import os
+import pickle
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Tuple, cast
+
+import pydantic
+
+from swipe_verse.models.config import GameConfig
+from swipe_verse.services.cache_manager import CacheManager
+
+_gc_lock = threading.Lock()
+_gc_pauses = 0
+_gc_was_enabled = True
+
+
+@contextmanager
+def paused_gc() -> Iterator[None]:
+    """
+    Suspend cyclic garbage collection while building a large config.
+
+    Parsing a scenario allocates many objects and no reference cycles, but
+    each allocation burst triggers collections that scan them all; for big
+    scenarios that is most of the load time. Pauses nest across threads.
+    """
+    global _gc_pauses, _gc_was_enabled
+    with _gc_lock:
+        if _gc_pauses == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pauses += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_pauses -= 1
+            if _gc_pauses == 0 and _gc_was_enabled:
+                gc.enable()
+
+
+@functools.lru_cache(maxsize=None)
+def schema_version() -> str:
+    """
+    Digest of the GameConfig schema and pydantic version.
+
+    Cached configs made with a different model definition are revalidated.
+    """
+    schema = json.dumps(GameConfig.model_json_schema(), sort_keys=True)
+    hasher = hashlib.blake2b(digest_size=8)
+    hasher.update(pydantic.VERSION.encode())
+    hasher.update(schema.encode())
+    return hasher.hexdigest()
+
+
+class ConfigCache:
+    """
+    Validated GameConfig objects, pickled on disk.
+
+    Entries are keyed on the scenario's path and stamped with its mtime,
+    size and the schema version, so a warm load unpickles the model without
+    parsing JSON or running validation, and any change to the file or the
+    models invalidates it. The cache directory is local and trusted, as
+    unpickling runs code from it.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        cache_manager: Optional[CacheManager] = None,
+    ) -> None:
+        if cache_dir is None and cache_manager is not None:
+            cache_dir = cache_manager.path("configs")
+        self.cache_dir = cache_dir or Path.home() / ".swipe_verse" / "config_cache"
+        self.cache_manager = cache_manager
+        self.hits = 0
+        self.misses = 0
+
+    def load(
+        self, path: Path, validate: Callable[[Path], GameConfig]
+    ) -> GameConfig:
+        """
+        Return the cached config for a file, or validate and cache it.
+
+        Args:
+            path: Scenario file
+            validate: Parses and validates the file on a miss
+
+        Returns:
+            GameConfig: The validated configuration
+        """
+        stamp = self._stamp(path)
+        config = self.get(path, stamp)
+        if config is not None:
+            return config
+
+        config = validate(path)
+        self.put(path, config, stamp)
+        return config
+
+    def get(
+        self, path: Path, stamp: Optional[Tuple[int, int, str]] = None
+    ) -> Optional[GameConfig]:
+        """Return the cached config if it matches the file, else None."""
+        stamp = stamp or self._stamp(path)
+        entry_path = self._entry_path(path)
+        try:
+            with open(entry_path, "rb") as f, paused_gc():
+                cached_stamp, config = cast(
+                    Tuple[Tuple[int, int, str], Optional[GameConfig]],
+                    pickle.loads(f.read()),
+                )
+        except FileNotFoundError:
+            config = None
+        except Exception as e:
+            # Unreadable or written by an incompatible version
+            print(f"Discarding cached config {entry_path}: {e}")
+            entry_path.unlink(missing_ok=True)
+            config = None
+        else:
+            if tuple(cached_stamp) != stamp or not isinstance(config, GameConfig):
+                config = None
+
+        if config is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self.cache_manager is not None:
+            self.cache_manager.record_hit("configs", entry_path)
+        return config
+
+    def put(
+        self,
+        path: Path,
+        config: GameConfig,
+        stamp: Optional[Tuple[int, int, str]] = None,
+    ) -> None:
+        """
+        Store a validated config.
+
+        Pass the stamp taken before the file was read, so a file edited
+        while it was being validated is not cached as current.
+        """
+        stamp = stamp or self._stamp(path)
+        entry_path = self._entry_path(path)
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump((stamp, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            # Only an optimisation; the next load validates again
+            print(f"Error caching config {path}: {e}")
+            return
+        if self.cache_manager is not None:
+            self.cache_manager.record_miss("configs", entry_path)
+
+    def _entry_path(self, path: Path) -> Path:
+        key = hashlib.blake2b(
+            os.path.abspath(path).encode(), digest_size=12
+        ).hexdigest()
+        return self.cache_dir / f"{key}.pickle"
+
+    @staticmethod
+    def _stamp(path: Path) -> Tuple[int, int, str]:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size, schema_version()
@@ -1,15 +1,41 @@
-import json
 from pathlib import Path
-from typing import Any, Dict, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, Optional, cast
 
 import aiohttp
+from pydantic_core import from_json
 
 from swipe_verse.models.config import GameConfig
+from swipe_verse.services.card_store import open_scenario
+from swipe_verse.services.config_cache import ConfigCache, paused_gc
+from swipe_verse.services.config_overlay import apply_overlay
+from swipe_verse.services.remote_config import RemoteConfigCache
+from swipe_verse.services.scenario_pack import PACK_SUFFIX, open_pack
+from swipe_verse.services.scenario_watcher import ScenarioWatcher
+
+if TYPE_CHECKING:
+    from swipe_verse.services.game_logic import GameLogic
+
+# Local scenario files at least this large keep their cards on disk
+LAZY_CARDS_BYTES = 64 * 1024 * 1024
 
 
 class ConfigLoader:
-    def __init__(self, base_path: Optional[str] = None):
+    def __init__(
+        self,
+        base_path: Optional[str] = None,
+        config_cache: Optional[ConfigCache] = None,
+        lazy_cards_bytes: Optional[int] = LAZY_CARDS_BYTES,
+        remote_cache: Optional[RemoteConfigCache] = None,
+    ):
         self.base_path = Path(base_path) if base_path else Path.cwd()
+        # Validated configs kept on disk, so unchanged files skip validation
+        self.config_cache = config_cache
+        # Size from which a file's cards are indexed and read as they are
+        # drawn instead of loaded up front (None: always load them)
+        self.lazy_cards_bytes = lazy_cards_bytes
+        # Remote scenarios kept on disk and revalidated with the server
+        # (None: download them on every load)
+        self.remote_cache = remote_cache
 
     async def load_config(self, config_path: str) -> GameConfig:
         """
@@ -20,47 +46,111 @@ class ConfigLoader:
 
         Returns:
             GameConfig: The loaded and validated game configuration
+
+        Raises:
+            FileNotFoundError: If the URL is not cached and the remote cache
+                is offline
+            Exception: If a URL cannot be downloaded (and is not cached) or
+                is not a valid config. Only local files fall back to the
+                bundled kingdom scenario.
         """
+        # Check if it's a URL
+        if config_path.startswith(("http://", "https://")):
+            if self.remote_cache is not None:
+                return self._load_validated(await self.remote_cache.fetch(config_path))
+            config_bytes = await self._load_from_url(config_path)
+            return self._validate_bytes(config_bytes)
+
         try:
-            # Check if it's a URL
-            if config_path.startswith(("http://", "https://")):
-                config_data = await self._load_from_url(config_path)
+            # Try as relative path, then absolute
+            if not Path(config_path).is_absolute():
+                file_path = self.base_path / config_path
             else:
-                # Try as relative path, then absolute
-                if not Path(config_path).is_absolute():
-                    file_path = self.base_path / config_path
-                else:
-                    file_path = Path(config_path)
+                file_path = Path(config_path)
 
-                config_data = self._load_from_file(file_path)
-
-            # Parse using Pydantic for validation
-            # Validate and return as GameConfig
-            return cast(GameConfig, GameConfig.model_validate(config_data))
+            return self._load_validated(file_path)
 
         except Exception as e:
             print(f"Error loading config: {e}")
             # Load kingdom config as fallback from bundled scenarios
             default_path = Path(__file__).parent.parent / "scenarios" / "kingdom_game.json"
-            default_data = self._load_from_file(default_path)
-            return cast(GameConfig, GameConfig.model_validate(default_data))
+            return self._load_validated(default_path)
+
+    def watch(
+        self,
+        config_path: str,
+        config: GameConfig,
+        game_logic: Optional["GameLogic"] = None,
+        **kwargs: Any,
+    ) -> ScenarioWatcher:
+        """
+        Start reloading a local scenario's edits into the running game.
+
+        Args:
+            config_path: Path the config was loaded from, as for load_config
+            config: The loaded config, updated in place on each edit
+            game_logic: Game to refresh after each reload
+            **kwargs: Passed to ScenarioWatcher (interval, on_reload)
+
+        Returns:
+            ScenarioWatcher: The started watcher; call stop() when done
 
-    def _load_from_file(self, file_path: Path) -> Dict[str, Any]:
-        """Load configuration from a local file"""
+        Raises:
+            ValueError: If the path is a URL or the scenario is not held in
+                memory
+        """
+        if config_path.startswith(("http://", "https://")):
+            raise ValueError(f"Only local scenarios can be watched: {config_path}")
+        file_path = Path(config_path)
+        if not file_path.is_absolute():
+            file_path = self.base_path / config_path
+        watcher = ScenarioWatcher(file_path, config, game_logic=game_logic, **kwargs)
+        watcher.start()
+        return watcher
+
+    def _load_validated(self, file_path: Path) -> GameConfig:
+        """Load and validate a local file, through the config cache if any"""
+        if file_path.suffix == PACK_SUFFIX:
+            # Compiled by `swipe-verse pack`; validated when it was written
+            return open_pack(file_path)
+        if (
+            self.lazy_cards_bytes is not None
+            and file_path.stat().st_size >= self.lazy_cards_bytes
+        ):
+            return open_scenario(file_path)
+        if self.config_cache is not None:
+            return self.config_cache.load(file_path, self._validate_file)
+        return self._validate_file(file_path)
+
+    def _validate_file(self, file_path: Path) -> GameConfig:
+        """Parse a local file and validate it as a GameConfig"""
+        return self._validate_bytes(self._load_from_file(file_path))
+
+    def _validate_bytes(self, config_bytes: bytes) -> GameConfig:
+        """Parse raw JSON bytes and validate them as a GameConfig"""
+        # pydantic-core parses the bytes without decoding them to a str and
+        # reuses one object for repeated strings. model_validate_json would
+        # skip the dicts, but it first builds its own JSON tree, which peaks
+        # higher than the dicts for big scenarios (see
+        # tools/benchmark_config_load.py)
+        with paused_gc():
+            config_data = from_json(config_bytes)
+            return cast(GameConfig, GameConfig.model_validate(config_data))
+
+    def _load_from_file(self, file_path: Path) -> bytes:
+        """Read a local configuration file"""
         if not file_path.exists():
             raise FileNotFoundError(f"Config file not found: {file_path}")
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            # json.load returns Any, cast to expected dict
-            return cast(Dict[str, Any], json.load(f))
+        with open(file_path, "rb") as f:
+            return f.read()
 
-    async def _load_from_url(self, url: str) -> Dict[str, Any]:
-        """Load configuration from a URL"""
+    async def _load_from_url(self, url: str) -> bytes:
+        """Download a configuration from a URL"""
         async with aiohttp.ClientSession() as session:
             async with session.get(url) as response:
                 if response.status == 200:
-                    # response.json() returns Any, cast to expected dict
-                    return cast(Dict[str, Any], await response.json())
+                    return await response.read()
                 else:
                     raise Exception(
                         f"Failed to download config from {url}, status {response.status}"
@@ -72,6 +162,9 @@ class ConfigLoader:
         """
         Merge a base config with override values.
 
+        Only the overridden fields are validated; the result shares every
+        other part (such as the cards) with the base config.
+
         Args:
             base_config: Base configuration to start with
             override_config: Dict with values to override in the base config
@@ -79,30 +172,4 @@ class ConfigLoader:
         Returns:
             GameConfig: Merged configuration
         """
-        # Convert base config to dict
-        base_dict = base_config.model_dump()
-
-        # Deep merge the dictionaries
-        merged = self._deep_merge(base_dict, override_config)
-
-        # Validate and return new config
-        # Validate merged config
-        return cast(GameConfig, GameConfig.model_validate(merged))
-
-    def _deep_merge(
-        self, base: Dict[str, Any], override: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Deep merge two dictionaries"""
-        result = base.copy()
-
-        for key, value in override.items():
-            if (
-                key in result
-                and isinstance(result[key], dict)
-                and isinstance(value, dict)
-            ):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
-
-        return result
+        return apply_overlay(base_config, override_config)
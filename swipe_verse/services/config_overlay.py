@@ -0,0 +1,55 @@
+from typing import Any, Dict, Mapping, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def apply_overlay(model: ModelT, overlay: Mapping[str, Any]) -> ModelT:
+    """
+    Return a copy of a model with override values applied.
+
+    Nested dicts in the overlay are merged into sub-models and dict fields,
+    as a deep merge of the dumped model would; other values replace the
+    field. Only the fields the overlay reaches are validated, and every
+    other field (the cards list, an untouched theme) is the same object as
+    in the original, so the cost depends on the overlay and not on the
+    size of the model. The result shares those objects: treat both as
+    read-only.
+
+    Args:
+        model: The model to start from (not modified)
+        overlay: Values to override, shaped like the model's dump
+
+    Returns:
+        The new model
+
+    Raises:
+        pydantic.ValidationError: If an override value is invalid
+    """
+    fields = type(model).model_fields
+    validator = type(model).__pydantic_validator__
+    result = model.model_copy()
+    for name, value in overlay.items():
+        if name not in fields:
+            # Unknown keys are ignored, as when validating a dumped config
+            continue
+        if isinstance(value, Mapping):
+            value = _merge(getattr(model, name), value)
+        # Validates this field alone; model instances are kept, not copied
+        validator.validate_assignment(result, name, value)
+    return result
+
+
+def _merge(current: Any, overlay: Mapping[str, Any]) -> Any:
+    """Merge a nested overlay into a field's current value."""
+    if isinstance(current, BaseModel):
+        return apply_overlay(current, overlay)
+    if not isinstance(current, dict):
+        return overlay
+    merged: Dict[Any, Any] = dict(current)
+    for key, value in overlay.items():
+        if key in merged and isinstance(value, Mapping):
+            value = _merge(merged[key], value)
+        merged[key] = value
+    return merged
@@ -1,8 +1,10 @@
 import re
+import threading
 from typing import Any, Dict, Optional, Tuple
 
 from swipe_verse.models.config import Card, GameConfig
 from swipe_verse.models.game_state import GameState
+from swipe_verse.services.card_store import card_store
 from swipe_verse.services.game_history import GameHistory
 
 
@@ -22,52 +24,59 @@ class GameLogic:
     def __init__(self, game_state: GameState, config: GameConfig):
         self.game_state = game_state
         self.config = config
+        # Cards by id; for very large scenarios they are read from disk
+        # as they are drawn (see LazyCardStore)
+        self.cards = card_store(config)
         # Set up the expression evaluator for popularity formula
         self.formula_pattern = re.compile(r"(resource\d+)")
         # Initialize game history
         self.history = GameHistory()
+        # Held while a choice is processed or a scenario reload is applied,
+        # which happens on the scenario watcher's thread
+        self._lock = threading.RLock()
 
     def process_choice(self, direction: str) -> GameResult:
         """Process player's choice (left or right)"""
-        current_card = self.game_state.current_card
+        with self._lock:
+            current_card = self.game_state.current_card
 
-        if direction not in current_card.choices:
-            return GameResult(False, "Invalid choice")
+            if direction not in current_card.choices:
+                return GameResult(False, "Invalid choice")
 
-        choice = current_card.choices[direction]
+            choice = current_card.choices[direction]
 
-        # Apply effects on resources based on difficulty
-        difficulty_mod = self.game_state.settings.difficulty_modifiers[
-            self.game_state.difficulty
-        ]
+            # Apply effects on resources based on difficulty
+            difficulty_mod = self.game_state.settings.difficulty_modifiers[
+                self.game_state.difficulty
+            ]
 
-        for resource_id, value in choice.effects.items():
-            if resource_id in self.game_state.resources:
-                # Apply difficulty modifier
-                modified_value = int(value * difficulty_mod)
-
-                # Update resource value
-                current_value = self.game_state.resources[resource_id]
-                new_value = max(0, min(100, current_value + modified_value))
-                self.game_state.resources[resource_id] = new_value
-
-        # Increment turn counter
-        self.game_state.turn_count += 1
-
-        # Check for game over conditions
-        game_over, message, won = self._check_game_over()
-        if game_over:
-            # Record game in history
-            game_summary = self.history.record_game(self.game_state, won, message)
-            return GameResult(True, message, game_summary)
-
-        # Find next card
-        if choice.next_card:
-            self._set_next_card(choice.next_card)
-        else:
-            self._set_random_card()
+            for resource_id, value in choice.effects.items():
+                if resource_id in self.game_state.resources:
+                    # Apply difficulty modifier
+                    modified_value = int(value * difficulty_mod)
+
+                    # Update resource value
+                    current_value = self.game_state.resources[resource_id]
+                    new_value = max(0, min(100, current_value + modified_value))
+                    self.game_state.resources[resource_id] = new_value
+
+            # Increment turn counter
+            self.game_state.turn_count += 1
+
+            # Check for game over conditions
+            game_over, message, won = self._check_game_over()
+            if game_over:
+                # Record game in history
+                game_summary = self.history.record_game(self.game_state, won, message)
+                return GameResult(True, message, game_summary)
+
+            # Find next card
+            if choice.next_card:
+                self._set_next_card(choice.next_card)
+            else:
+                self._set_random_card()
 
-        return GameResult(False)
+            return GameResult(False)
 
     def calculate_popularity(self) -> int:
         """Calculate popularity based on the formula in config"""
@@ -105,7 +114,7 @@ class GameLogic:
         # 3. Story progression markers
 
         # For now, implement a basic version based on cards seen
-        total_cards = len(self.config.cards)
+        total_cards = len(self.cards)
         cards_seen = len(self.game_state.seen_cards)
 
         # Avoid division by zero
@@ -155,11 +164,11 @@ class GameLogic:
 
     def _set_next_card(self, card_id: str) -> bool:
         """Set the specified card as the next one to display"""
-        for card in self.config.cards:
-            if card.id == card_id:
-                self.game_state.current_card = card
-                self.game_state.seen_cards.add(card_id)
-                return True
+        card = self.cards.get(card_id)
+        if card is not None:
+            self.game_state.current_card = card
+            self.game_state.seen_cards.add(card_id)
+            return True
 
         # If card not found, fall back to random
         self._set_random_card()
@@ -167,22 +176,18 @@ class GameLogic:
 
     def _set_random_card(self) -> None:
         """Set a random card from the deck as the next one"""
-        import random
+        # Pick among cards whose conditions are met; seen cards are skipped
+        # by id first, so a lazily loaded deck only reads the drawn card
+        next_card = self.cards.random_card(
+            self._card_conditions_met, skip_ids=self.game_state.seen_cards
+        )
 
-        # Filter out cards that require specific conditions
-        available_cards = [
-            card for card in self.config.cards if self._card_conditions_met(card)
-        ]
-
-        if not available_cards:
+        if next_card is None:
             # If no cards available, reset seen cards and try again
             self.game_state.seen_cards.clear()
-            available_cards = [
-                card for card in self.config.cards if self._card_conditions_met(card)
-            ]
+            next_card = self.cards.random_card(self._card_conditions_met)
 
-        if available_cards:
-            next_card = random.choice(available_cards)
+        if next_card is not None:
             self.game_state.current_card = next_card
             self.game_state.seen_cards.add(next_card.id)
         else:
@@ -199,6 +204,28 @@ class GameLogic:
         # For now, just avoid showing recently seen cards
         return card.id not in self.game_state.seen_cards
 
+    def apply_scenario_update(self) -> None:
+        """
+        Pick up changes made to the config while a game is running.
+
+        Called by ScenarioWatcher, on its thread, after it swaps edited
+        cards or sections into the config; a choice being processed is
+        finished first. The game state is kept: the current card is
+        replaced by its edited version if it still exists, and resources
+        added to the scenario start at their initial value.
+        """
+        with self._lock:
+            self.cards = card_store(self.config)
+            current = self.cards.get(self.game_state.current_card.id)
+            if current is not None:
+                self.game_state.current_card = current
+
+            settings = self.config.game_settings
+            self.game_state.settings = settings
+            self.game_state.theme = self.config.theme
+            for resource_id, value in settings.initial_resources.items():
+                self.game_state.resources.setdefault(resource_id, value)
+
     def get_achievements(self) -> list:
         """Get achievements list with unlock status."""
         return self.history.get_achievements()
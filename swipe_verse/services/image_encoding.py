@@ -0,0 +1,133 @@
+import io
+import time
+from pathlib import Path
+from typing import Any, Dict, Sequence, Tuple, TypedDict
+
+from PIL import Image, features
+
+
+class EncodingProfile(TypedDict, total=False):
+    """How processed images are written to the cache."""
+
+    format: str  # "webp", "png" or "source" (keep the source file's format)
+    lossless: bool  # WebP: lossless instead of lossy
+    quality: int  # WebP: quality (lossy) or compression effort (lossless), 0-100
+    method: int  # WebP: encoder effort, 0 (fastest) to 6 (smallest)
+    optimize: bool  # PNG: extra compression pass
+    palette: bool  # PNG: store as 8-bit palette (exact when <= 256 colours)
+
+
+PROFILES: Dict[str, EncodingProfile] = {
+    # Source format with encoder defaults (the original behaviour)
+    "source": {"format": "source"},
+    # Photographic card art and card backs
+    "card_art": {"format": "webp", "quality": 82, "method": 4},
+    # Small illustrated icons: a 256-colour palette keeps edges and alpha
+    # at a fraction of the size of lossless WebP
+    "icon": {"format": "png", "palette": True},
+    # Large backgrounds, shown behind the cards
+    "background": {"format": "webp", "quality": 70, "method": 4},
+    # Few-colour filter outputs; the palette is exact. PNG optimize is left
+    # off as it costs ~4x the encode time for under 10% smaller files.
+    "palette": {"format": "png", "palette": True},
+}
+
+# Used for WebP profiles when Pillow was built without WebP support
+WEBP_FALLBACK: EncodingProfile = {"format": "png", "optimize": True}
+
+# Filters whose output has few colours; their default profile is "palette"
+PALETTE_FILTERS = ("posterize", "pixelate")
+
+
+def default_profile(steps: Sequence[str]) -> str:
+    """Pick the profile for a filter chain when the caller did not choose one."""
+    if steps and steps[-1] in PALETTE_FILTERS:
+        return "palette"
+    return "source"
+
+
+def resolve_profile(name: str) -> EncodingProfile:
+    """
+    Look up a profile by name, substituting PNG if WebP is unavailable.
+
+    Raises:
+        ValueError: If the profile name is unknown
+    """
+    if name not in PROFILES:
+        raise ValueError(f"Unknown encoding profile: {name}")
+    profile = PROFILES[name]
+    if profile.get("format") == "webp" and not features.check("webp"):
+        return WEBP_FALLBACK
+    return profile
+
+
+def output_suffix(profile: EncodingProfile, source_suffix: str) -> str:
+    """File suffix for an output written with this profile."""
+    fmt = profile.get("format", "source")
+    return source_suffix if fmt == "source" else f".{fmt}"
+
+
+def prepare(
+    img: Image.Image, profile: EncodingProfile
+) -> Tuple[Image.Image, Dict[str, Any]]:
+    """
+    Convert an image for a profile and build the encoder arguments.
+
+    Returns:
+        Tuple: The image to save and keyword arguments for Image.save
+    """
+    fmt = profile.get("format", "source")
+    options: Dict[str, Any] = {}
+
+    if fmt == "webp":
+        options["format"] = "WEBP"
+        options["lossless"] = profile.get("lossless", False)
+        options["quality"] = profile.get("quality", 80)
+        options["method"] = profile.get("method", 4)
+    elif fmt == "png":
+        options["format"] = "PNG"
+        options["optimize"] = profile.get("optimize", False)
+        if profile.get("palette") and img.mode not in ("P", "1"):
+            img = _to_palette(img)
+
+    return img, options
+
+
+def save_image(img: Image.Image, path: Path, profile: EncodingProfile) -> None:
+    """Write an image to path using a profile."""
+    img, options = prepare(img, profile)
+    img.save(path, **options)
+
+
+def measure(
+    img: Image.Image, profile: EncodingProfile, source_format: str = "PNG"
+) -> Tuple[int, float]:
+    """
+    Encode an image in memory.
+
+    Args:
+        img: Image to encode
+        profile: Encoding profile
+        source_format: Format used for the "source" profile
+
+    Returns:
+        Tuple: (encoded bytes, encode seconds)
+    """
+    buffer = io.BytesIO()
+    started = time.perf_counter()
+    img, options = prepare(img, profile)
+    options.setdefault("format", source_format)
+    img.save(buffer, **options)
+    return buffer.tell(), time.perf_counter() - started
+
+
+def _to_palette(img: Image.Image) -> Image.Image:
+    """Reduce to an 8-bit palette; lossless when the image has <= 256 colours."""
+    if img.mode == "L":
+        return img
+    if img.mode == "RGBA":
+        return img.quantize(
+            256, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE
+        )
+    return img.convert("RGB").quantize(256, dither=Image.Dither.NONE)
+
@@ -0,0 +1,289 @@
+import asyncio
+import functools
+import heapq
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Lower numbers run first
+PRIORITY_VISIBLE = 0
+PRIORITY_PREFETCH = 10
+
+
+def _timed_call(fn: Callable[..., Any], args: Tuple[Any, ...]) -> Tuple[Any, float]:
+    """Run fn in a worker and report how long it took."""
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+class _Job:
+    __slots__ = ("fn", "args", "future", "enqueued_at", "droppable")
+
+    def __init__(
+        self, fn: Callable[..., Any], args: Tuple[Any, ...], droppable: bool = False
+    ) -> None:
+        self.fn = fn
+        self.args = args
+        self.future: Future = Future()
+        self.enqueued_at = time.perf_counter()
+        # Queued by submit, so it may make way for a newer job
+        self.droppable = droppable
+
+
+class _Latency:
+    """Running count/total/max of a duration in seconds."""
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def as_dict(self) -> Dict[str, float]:
+        avg = self.total / self.count if self.count else 0.0
+        return {"avg_ms": round(avg * 1000, 3), "max_ms": round(self.max * 1000, 3)}
+
+
+class ImageExecutor:
+    """
+    Runs blocking image work (PIL decode/filter/encode) off the event loop.
+
+    Jobs wait in a priority queue and are handed to a thread pool as workers
+    become free, so visible-card work overtakes prefetching. The jobs are
+    methods of the asset manager and image processor, which share caches
+    and locks, so they run in threads rather than processes (batch
+    pre-rendering uses its own process pool, see prerender).
+
+    The queue is bounded: once ``max_pending`` jobs are waiting, ``run``
+    waits for room (backpressure) and ``submit`` drops the oldest submitted
+    job that does not outrank the new one. Cancelling a waiting caller drops
+    its job before it starts. Queue wait and processing time are tracked
+    separately.
+
+    The executor is thread-safe and not tied to a particular event loop.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: int = 64,
+    ) -> None:
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.max_pending = max_pending
+
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._queue: List[Tuple[int, int, _Job]] = []
+        self._sequence = itertools.count()
+        self._running = 0
+        # run() callers waiting for queue space with their jobs, queued in
+        # FIFO order as room frees up
+        self._slot_waiters: List[Tuple[Future, int, _Job]] = []
+
+        self._queue_wait = _Latency()
+        self._processing = _Latency()
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="image-worker"
+            )
+        return self._pool
+
+    def submit(
+        self, fn: Callable[..., T], *args: Any, priority: int = PRIORITY_VISIBLE
+    ) -> "Future[T]":
+        """
+        Queue a job without waiting for space.
+
+        If max_pending jobs are already queued, the oldest submitted job of
+        the lowest priority that does not outrank this one is dropped to make
+        room, or this job itself if there is none. A dropped job's future is
+        cancelled, so callers must treat submitted work as best effort.
+
+        Args:
+            fn: Callable to run in the pool
+            *args: Positional arguments for fn
+            priority: Lower runs first (see PRIORITY_VISIBLE/PRIORITY_PREFETCH)
+
+        Returns:
+            Future: Resolves with fn's result; cancel it to drop a queued job
+        """
+        job = _Job(fn, args, droppable=True)
+        with self._lock:
+            if len(self._queue) < self.max_pending:
+                dropped: Optional[_Job] = None
+                self._push(job, priority)
+            else:
+                dropped = self._pop_droppable(priority) or job
+                if dropped is not job:
+                    self._push(job, priority)
+                self.cancelled += 1
+        if dropped is not None:
+            dropped.future.cancel()
+        self._dispatch()
+        return job.future
+
+    async def run(
+        self, fn: Callable[..., T], *args: Any, priority: int = PRIORITY_VISIBLE
+    ) -> T:
+        """
+        Run fn in the pool and await its result.
+
+        Waits for queue space first if max_pending jobs are already queued.
+        Cancelling the awaiting task cancels the job if it has not started.
+        """
+        job = _Job(fn, args)
+        await self._enqueue(job, priority)
+        try:
+            return await asyncio.wrap_future(job.future)
+        except asyncio.CancelledError:
+            job.future.cancel()
+            raise
+
+    async def _enqueue(self, job: _Job, priority: int) -> None:
+        """Queue a job, waiting for room; the slot is taken under the lock."""
+        with self._lock:
+            if len(self._queue) < self.max_pending and not self._slot_waiters:
+                self._push(job, priority)
+                ticket: Optional[Future] = None
+            else:
+                ticket = Future()
+                self._slot_waiters.append((ticket, priority, job))
+        if ticket is None:
+            self._dispatch()
+            return
+        try:
+            # Resolved once _release_slots has queued the job
+            await asyncio.wrap_future(ticket)
+        except asyncio.CancelledError:
+            with self._lock:
+                self._slot_waiters = [
+                    waiter for waiter in self._slot_waiters if waiter[0] is not ticket
+                ]
+            # Dropped at dispatch if it was queued meanwhile
+            job.future.cancel()
+            raise
+
+    def _push(self, job: _Job, priority: int) -> None:
+        # Caller holds the lock
+        heapq.heappush(self._queue, (priority, next(self._sequence), job))
+
+    def _pop_droppable(self, priority: int) -> Optional[_Job]:
+        """Remove the submitted job that makes way for one of this priority."""
+        # Caller holds the lock. Lowest priority first, then the oldest.
+        candidates = [
+            entry
+            for entry in self._queue
+            if entry[2].droppable and entry[0] >= priority
+        ]
+        if not candidates:
+            return None
+        entry = max(candidates, key=lambda entry: (entry[0], -entry[1]))
+        self._queue.remove(entry)
+        heapq.heapify(self._queue)
+        return entry[2]
+
+    def _dispatch(self) -> None:
+        """Hand queued jobs to the pool while workers are free."""
+        while True:
+            with self._lock:
+                if self._running >= self.max_workers or not self._queue:
+                    self._release_slots()
+                    return
+                _, _, job = heapq.heappop(self._queue)
+                if not job.future.set_running_or_notify_cancel():
+                    # Cancelled while queued
+                    self.cancelled += 1
+                    continue
+                self._running += 1
+                self._queue_wait.add(time.perf_counter() - job.enqueued_at)
+                self._release_slots()
+
+            pool_future = self._get_pool().submit(_timed_call, job.fn, job.args)
+            pool_future.add_done_callback(functools.partial(self._on_done, job))
+
+    def _release_slots(self) -> None:
+        # Caller holds the lock. Waiting jobs are queued here, so a slot
+        # freed for a waiter cannot be taken by another caller first.
+        while len(self._queue) < self.max_pending and self._slot_waiters:
+            ticket, priority, job = self._slot_waiters.pop(0)
+            if ticket.set_running_or_notify_cancel():
+                self._push(job, priority)
+                ticket.set_result(None)
+
+    def _on_done(self, job: _Job, done: Future) -> None:
+        with self._lock:
+            self._running -= 1
+            error: Optional[BaseException]
+            if done.cancelled():
+                # Pool shut down before the job ran
+                error = asyncio.CancelledError()
+                self.cancelled += 1
+            else:
+                error = done.exception()
+            if error is None:
+                result, seconds = done.result()
+                self._processing.add(seconds)
+                self.completed += 1
+            elif not done.cancelled():
+                self.failed += 1
+
+        if error is None:
+            job.future.set_result(result)
+        else:
+            job.future.set_exception(error)
+        self._dispatch()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return job counters and queue-wait/processing latencies."""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "queued": len(self._queue),
+                "running": self._running,
+                "completed": self.completed,
+                "failed": self.failed,
+                "cancelled": self.cancelled,
+                "queue_wait": self._queue_wait.as_dict(),
+                "processing": self._processing.as_dict(),
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Cancel queued and waiting jobs and shut down the worker pool."""
+        with self._lock:
+            queued = [job for _, _, job in self._queue]
+            self._queue.clear()
+            waiters = self._slot_waiters
+            self._slot_waiters = []
+        cancelled = 0
+        for job in queued + [job for _, _, job in waiters]:
+            if job.future.cancel():
+                cancelled += 1
+        for ticket, _, _ in waiters:
+            # The waiting callers then see their job cancelled
+            if ticket.set_running_or_notify_cancel():
+                ticket.set_result(None)
+        with self._lock:
+            self.cancelled += cancelled
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
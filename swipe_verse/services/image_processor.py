@@ -1,7 +1,55 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypedDict
 
-from PIL import Image, ImageEnhance, ImageFilter, ImageOps
+from PIL import Image, ImageFilter, ImageOps, ImageStat
+
+from swipe_verse.services import numpy_filters
+from swipe_verse.services.cache_manager import CacheManager
+from swipe_verse.services.image_encoding import (
+    EncodingProfile,
+    default_profile,
+    output_suffix,
+    resolve_profile,
+    save_image,
+)
+
+# Filter implementations ImageProcessor can use; "auto" picks numpy when installed
+BACKENDS = ("auto", "pil", "numpy")
+
+# Joins the steps of a filter chain, e.g. "grayscale+blur"
+CHAIN_SEPARATOR = "+"
+
+# File name of the persisted (path, mtime, size) -> content digest index
+DIGEST_INDEX_NAME = "digest_index.json"
+# Minimum seconds between digest index writes
+DIGEST_SAVE_INTERVAL = 2.0
+
+
+def split_chain(filter_name: Optional[str]) -> List[str]:
+    """Split a filter name such as "grayscale+blur" into its steps."""
+    if not filter_name:
+        return []
+    return [step for step in filter_name.split(CHAIN_SEPARATOR) if step]
+
+
+class JobStats(TypedDict):
+    """Pixel memory used while rendering one cached variant."""
+
+    source: str
+    source_pixels: int  # width * height of the source file
+    decoded_pixels: int  # width * height after early downscaling
+    peak_bytes: int  # largest total of pixel buffers held at once
+
+
+def image_bytes(img: Image.Image) -> int:
+    """Approximate size of an image's pixel buffer."""
+    return img.width * img.height * len(img.getbands())
 
 
 class ImageProcessor:
@@ -9,7 +57,22 @@ class ImageProcessor:
     Handles various image processing operations for game assets.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        backend: str = "auto",
+        intermediate_budget: int = 64 * 1024 * 1024,
+        cache_manager: Optional[CacheManager] = None,
+        max_pixels: Optional[int] = 16 * 1024 * 1024,
+    ) -> None:
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown image backend: {backend}")
+        if backend == "numpy" and not numpy_filters.HAVE_NUMPY:
+            raise ImportError("The numpy image backend requires numpy to be installed")
+        if backend == "auto":
+            backend = "numpy" if numpy_filters.HAVE_NUMPY else "pil"
+        self.backend = backend
+
         # Map filter names to processing functions
         self.filters: Dict[str, Callable[[Image.Image], Image.Image]] = {
             "grayscale": self._apply_grayscale,
@@ -18,61 +81,640 @@ class ImageProcessor:
             "blur": self._apply_blur,
             "pixelate": self._apply_pixelate,
         }
+        if self.backend == "numpy":
+            for name in numpy_filters.PREFERRED:
+                self.filters[name] = numpy_filters.KERNELS[name]
 
-        # Create a cache directory
-        self.cache_dir = Path.home() / ".swipe_verse" / "image_cache"
+        # Create a cache directory; with a cache manager, outputs are
+        # tracked in its "images" namespace for stats and eviction
+        self.cache_manager = cache_manager
+        if cache_dir is None and cache_manager is not None:
+            cache_dir = cache_manager.path("images")
+        self.cache_dir = cache_dir or Path.home() / ".swipe_verse" / "image_cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+        # In-memory manifest of (source, parameters) -> processed path, so
+        # repeat lookups only check that the file is still there. Worker
+        # threads add to it while the UI thread reads and prunes it.
+        self._manifest: Dict[Tuple[str, str], str] = {}
+        self._manifest_lock = threading.Lock()
+
+        # Persisted source path -> [mtime_ns, size, digest], loaded lazily
+        # for whichever cache_dir is in use
+        self._digests: Dict[str, List] = {}
+        self._digests_dir: Optional[Path] = None
+        self._digests_dirty = False
+        self._digests_saved = 0.0
+
+        # Decoded results of filter chain prefixes, keyed by (source digest,
+        # base size, steps) and bounded to intermediate_budget bytes
+        self.intermediate_budget = intermediate_budget
+        self._intermediates: "OrderedDict[Tuple[str, str, Tuple[str, ...]], Image.Image]" = (
+            OrderedDict()
+        )
+        self._intermediate_bytes = 0
+        self._intermediate_lock = threading.Lock()
+        self.intermediate_hits = 0
+
+        # Sources larger than this are downscaled as they are decoded, so a
+        # single huge image cannot exhaust memory (None disables the guard)
+        self.max_pixels = max_pixels
+        self.downscaled_sources = 0
+
+        # Pixel memory of the job each worker thread last rendered, and the
+        # largest seen by this processor
+        self._jobs = threading.local()
+        self.peak_job_bytes = 0
+
     def process_image(
         self,
         image_path: str,
         filter_name: Optional[str] = None,
         scale: Optional[float] = None,
+        profile: Optional[str] = None,
     ) -> str:
         """
         Process an image with the specified filter and/or scaling.
 
         Args:
             image_path: Path to the image file
-            filter_name: Name of the filter to apply
+            filter_name: Name of the filter to apply, or a chain of filters
+                joined with "+" (e.g. "grayscale+blur")
             scale: Scale factor to resize the image
+            profile: Encoding profile name (see image_encoding.PROFILES)
+
+        Returns:
+            str: Path to the processed image
+        """
+        return self.process_pipeline(
+            image_path, split_chain(filter_name), scale=scale, profile=profile
+        )
+
+    def open_source(
+        self, path: Path, box: Optional[Tuple[int, int]] = None
+    ) -> Image.Image:
+        """
+        Decode a source image and close its file.
+
+        Images over max_pixels are reduced to fit it. JPEGs are reduced
+        while decoding (via draft); other formats are decoded in full and
+        then reduced, so the full-size buffer counts toward the job's peak
+        bytes.
+
+        Args:
+            path: Source image file
+            box: Optional (width, height) the caller will fit the image into;
+                JPEG sources are decoded at the smallest scale that covers it
+
+        Returns:
+            Image.Image: Loaded image with no open file handle
+        """
+        with Image.open(path) as src:
+            source_pixels = src.width * src.height
+            target = None
+            if self.max_pixels is not None and source_pixels > self.max_pixels:
+                ratio = (self.max_pixels / source_pixels) ** 0.5
+                target = (
+                    max(1, int(src.width * ratio)),
+                    max(1, int(src.height * ratio)),
+                )
+            draft_box = box or target
+            if draft_box is not None and src.format == "JPEG":
+                src.draft(src.mode, draft_box)
+
+            if (
+                target is not None
+                and self.max_pixels is not None
+                and src.width * src.height > self.max_pixels
+            ):
+                src.load()
+                img = src.resize(target, Image.Resampling.LANCZOS, reducing_gap=2.0)
+                # The decoded source and its reduced copy are held at once
+                self._track(src, img)
+            else:
+                src.load()
+                img = src
+
+        if target is not None:
+            with self._intermediate_lock:
+                self.downscaled_sources += 1
+        job = getattr(self._jobs, "current", None)
+        if job is not None:
+            job["source_pixels"] = source_pixels
+            job["decoded_pixels"] = img.width * img.height
+        self._track(img)
+        return img
+
+    def last_job(self) -> Optional[JobStats]:
+        """
+        Return stats for the last variant rendered on this thread, or None
+        if the last request was served from the cache.
+
+        Peak bytes count the pixel buffers the pipeline holds at once (the
+        input and output of each step); a filter's own temporaries are
+        not included.
+        """
+        return getattr(self._jobs, "last", None)
+
+    def process_pipeline(
+        self,
+        image_path: str,
+        steps: Sequence[str],
+        scale: Optional[float] = None,
+        profile: Optional[str] = None,
+    ) -> str:
+        """
+        Apply an ordered chain of filters in one decode/encode cycle.
+
+        The output is cached under the whole chain. Intermediate results are
+        kept in memory, so a chain that extends one already rendered (e.g.
+        grayscale+blur after grayscale) starts from the longest cached prefix.
+
+        Args:
+            image_path: Path to the image file
+            steps: Filter names, applied in order (unknown names are skipped)
+            scale: Scale factor applied before the filters
+            profile: Encoding profile name; by default palette PNG for
+                few-colour filters and the source format otherwise
+
+        Returns:
+            str: Path to the processed image
+        """
+        scale_part = str(scale or "no_scale")
+
+        def load(path: Path) -> Image.Image:
+            img = self.open_source(path)
+
+            # Apply scaling if requested (relative to the decoded size, which
+            # only differs from the file's for sources over max_pixels)
+            if scale is not None:
+                width, height = img.size
+                new_width = int(width * scale)
+                new_height = int(height * scale)
+                if self.max_pixels is not None and new_width * new_height > self.max_pixels:
+                    ratio = (self.max_pixels / (new_width * new_height)) ** 0.5
+                    new_width = int(new_width * ratio)
+                    new_height = int(new_height * ratio)
+                img = img.resize(
+                    (max(1, new_width), max(1, new_height)), Image.Resampling.LANCZOS
+                )
+            return img
+
+        return self._cached_variant(
+            image_path,
+            self._chain_params(steps, scale_part),
+            lambda path: self._run_chain(path, scale_part, load, steps),
+            profile=profile or default_profile(steps),
+        )
+
+    def derivative(
+        self,
+        image_path: str,
+        width: float,
+        height: float,
+        density: float = 1.0,
+        filter_name: Optional[str] = None,
+        profile: Optional[str] = None,
+    ) -> str:
+        """
+        Create a copy of an image sized to fit a display box.
+
+        The image is scaled down (never up) to fit within width x height
+        logical pixels at the given pixel density, keeping its aspect ratio.
+        JPEG sources are decoded at reduced resolution via Image.draft and
+        large reductions use Image.reduce before the final resample.
+
+        Args:
+            image_path: Path to the image file
+            width: Display box width in logical pixels
+            height: Display box height in logical pixels
+            density: Device pixels per logical pixel (e.g. 1.0 or 2.0)
+            filter_name: Optional filter (or "+" chain) applied after downscaling
+            profile: Encoding profile name, e.g. "card_art" or "icon"
+
+        Returns:
+            str: Path to the sized image
+        """
+        box = self._display_box(width, height, density)
+        fit_part = f"fit{box[0]}x{box[1]}"
+        steps = split_chain(filter_name)
+
+        def load(path: Path) -> Image.Image:
+            # Let the JPEG decoder do most of the downscaling (no-op for PNG)
+            img = self.open_source(path, box)
+
+            ratio = min(box[0] / img.width, box[1] / img.height)
+            if ratio < 1:
+                target = (max(1, round(img.width * ratio)), max(1, round(img.height * ratio)))
+                # reducing_gap lets PIL shrink by integer factors with reduce()
+                img = img.resize(target, Image.Resampling.LANCZOS, reducing_gap=2.0)
+            return img
+
+        return self._cached_variant(
+            image_path,
+            self._chain_params(steps, fit_part),
+            lambda path: self._run_chain(path, fit_part, load, steps),
+            profile=profile or default_profile(steps),
+        )
+
+    def cached_derivative(
+        self,
+        image_path: str,
+        width: float,
+        height: float,
+        density: float = 1.0,
+        filter_name: Optional[str] = None,
+        profile: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Return the path of an already rendered derivative, without rendering.
+
+        Takes the same arguments as derivative. Only the manifest, the digest
+        index and file metadata are consulted, so it is cheap enough to call
+        while building UI; a source that was never hashed counts as missing.
+
+        Returns:
+            Optional[str]: Path to the sized image, or None if it must be rendered
+        """
+        box = self._display_box(width, height, density)
+        steps = split_chain(filter_name)
+        return self._lookup_variant(
+            image_path,
+            self._chain_params(steps, f"fit{box[0]}x{box[1]}"),
+            profile=profile or default_profile(steps),
+        )
+
+    @staticmethod
+    def _display_box(width: float, height: float, density: float) -> Tuple[int, int]:
+        """Pixel size of a width x height logical box at a pixel density."""
+        return max(1, round(width * density)), max(1, round(height * density))
+
+    def depletion_sprite(
+        self,
+        image_path: str,
+        size: float,
+        frames: int = 21,
+        density: float = 1.0,
+        opacity: float = 0.6,
+        profile: str = "icon",
+    ) -> str:
+        """
+        Create a vertical sprite of an icon at every fill level.
+
+        Frame i (from the top) shows the icon filled to i / (frames - 1):
+        the depleted upper part is darkened as if overlaid with black at the
+        given opacity. A UI can then show any level with one image by
+        offsetting the sprite, instead of compositing a tinted second copy.
+
+        Args:
+            image_path: Path to the icon
+            size: Frame width and height in logical pixels
+            frames: Number of fill levels, including empty and full
+            density: Device pixels per logical pixel
+            opacity: Strength of the darkening on the depleted part
+            profile: Encoding profile name
+
+        Returns:
+            str: Path to the sprite image (size x size * frames)
+        """
+        if frames < 2:
+            raise ValueError("frames must be at least 2")
+        side = max(1, round(size * density))
+
+        def render(path: Path) -> Image.Image:
+            icon = self.open_source(path, (side, side)).convert("RGBA")
+
+            # Fit the icon into a square frame, centred
+            ratio = min(side / icon.width, side / icon.height)
+            icon = icon.resize(
+                (max(1, round(icon.width * ratio)), max(1, round(icon.height * ratio))),
+                Image.Resampling.LANCZOS,
+            )
+            frame = Image.new("RGBA", (side, side), (0, 0, 0, 0))
+            frame.paste(icon, ((side - icon.width) // 2, (side - icon.height) // 2))
+
+            # Darkened copy: colour scaled towards black, alpha unchanged
+            keep = 1 - opacity
+            *colour, alpha = frame.split()
+            dark = Image.merge(
+                "RGBA", [band.point(lambda v: round(v * keep)) for band in colour] + [alpha]
+            )
+
+            sprite = Image.new("RGBA", (side, side * frames), (0, 0, 0, 0))
+            for index in range(frames):
+                top = index * side
+                sprite.paste(frame, (0, top))
+                depleted = round((1 - index / (frames - 1)) * side)
+                if depleted:
+                    sprite.paste(dark.crop((0, 0, side, depleted)), (0, top))
+            self._track(frame, dark, sprite)
+            return sprite
+
+        return self._cached_variant(
+            image_path, f"sprite{frames}_{side}px_{opacity}", render, profile=profile
+        )
+
+    def cached_depletion_sprite(
+        self,
+        image_path: str,
+        size: float,
+        frames: int = 21,
+        density: float = 1.0,
+        opacity: float = 0.6,
+        profile: str = "icon",
+    ) -> Optional[str]:
+        """
+        Return the path of an already rendered fill-level sprite, without rendering.
+
+        Takes the same arguments as depletion_sprite (see cached_derivative).
+
+        Returns:
+            Optional[str]: Path to the sprite image, or None if it must be rendered
+        """
+        side = max(1, round(size * density))
+        return self._lookup_variant(
+            image_path, f"sprite{frames}_{side}px_{opacity}", profile=profile
+        )
+
+    def _chain_params(self, steps: Sequence[str], base_part: str) -> str:
+        """Cache file parameters for a chain, e.g. "grayscale+blur_no_scale"."""
+        filter_part = CHAIN_SEPARATOR.join(steps) or "no_filter"
+        # Distinguish cached outputs of NumPy kernels from the PIL filters
+        backend_part = ""
+        if self.backend == "numpy" and any(
+            step in numpy_filters.PREFERRED for step in steps
+        ):
+            backend_part = "_np"
+        return f"{filter_part}_{base_part}{backend_part}"
+
+    def _run_chain(
+        self,
+        path: Path,
+        base_part: str,
+        load: Callable[[Path], Image.Image],
+        steps: Sequence[str],
+    ) -> Image.Image:
+        """
+        Run load followed by each step, resuming from the longest prefix of
+        the chain held in memory and remembering every new intermediate.
+        """
+        digest = self.source_digest(path)
+        steps = tuple(steps)
+
+        img: Optional[Image.Image] = None
+        done = len(steps)
+        while done >= 0:
+            img = self._get_intermediate((digest, base_part, steps[:done]))
+            if img is not None:
+                break
+            done -= 1
+
+        if img is None:
+            img = load(path)
+            img.load()
+            done = 0
+            self._put_intermediate((digest, base_part, ()), img)
+
+        for index in range(done, len(steps)):
+            step = steps[index]
+            if step in self.filters:
+                result = self.filters[step](img)
+                self._track(img, result)
+                img = result
+            self._put_intermediate((digest, base_part, steps[: index + 1]), img)
+        return img
+
+    def _get_intermediate(
+        self, key: Tuple[str, str, Tuple[str, ...]]
+    ) -> Optional[Image.Image]:
+        with self._intermediate_lock:
+            img = self._intermediates.get(key)
+            if img is not None:
+                self._intermediates.move_to_end(key)
+                self.intermediate_hits += 1
+            return img
+
+    def _put_intermediate(
+        self, key: Tuple[str, str, Tuple[str, ...]], img: Image.Image
+    ) -> None:
+        # Filters return new images, so cached intermediates are never mutated
+        size = image_bytes(img)
+        if size > self.intermediate_budget:
+            return
+        with self._intermediate_lock:
+            previous = self._intermediates.pop(key, None)
+            if previous is not None:
+                self._intermediate_bytes -= image_bytes(previous)
+            self._intermediates[key] = img
+            self._intermediate_bytes += size
+            while self._intermediate_bytes > self.intermediate_budget:
+                _, evicted = self._intermediates.popitem(last=False)
+                self._intermediate_bytes -= image_bytes(evicted)
+
+    def _track(self, *images: Image.Image) -> None:
+        """Record pixel buffers held at once by the current job."""
+        job = getattr(self._jobs, "current", None)
+        if job is not None:
+            job["peak_bytes"] = max(
+                job["peak_bytes"], sum(image_bytes(img) for img in images)
+            )
+
+    def _cached_variant(
+        self,
+        image_path: str,
+        params: str,
+        render: Callable[[Path], Image.Image],
+        profile: str = "source",
+    ) -> str:
+        """
+        Return the cached output for (image, params), rendering it if needed.
+
+        Args:
+            image_path: Path to the source image
+            params: Processing parameters, used in the cache file name
+            render: Produces the processed image from the source path
+            profile: Encoding profile used to write the output
 
         Returns:
             str: Path to the processed image
         """
+        self._load_digest_index()
+
+        encoding = resolve_profile(profile)
+        if profile != "source":
+            params = f"{params}_{profile}"
+
         path = Path(image_path)
+        manifest_key = (os.path.abspath(path), params)
+
+        with self._manifest_lock:
+            processed = self._manifest.get(manifest_key)
+        # The cache manager's gc may have evicted the file since
+        if processed is not None and os.path.exists(processed):
+            self._jobs.last = None
+            if self.cache_manager is not None:
+                self.cache_manager.record_hit("images", Path(processed))
+            return processed
 
         if not path.exists():
             raise FileNotFoundError(f"Image not found: {image_path}")
 
-        # Create a cache key based on the parameters
-        filter_part = filter_name or "no_filter"
-        scale_part = scale or "no_scale"
-        cache_key = f"{path.stem}_{filter_part}_{scale_part}{path.suffix}"
-        cache_path = self.cache_dir / cache_key
+        # Key on the source content, so same-named files from different
+        # themes never collide, plus the processing parameters
+        digest = self.source_digest(path)
+        cache_path = self._variant_path(digest, params, encoding, path)
 
         # Return cached version if available
-        if cache_path.exists():
-            return str(cache_path)
+        self._jobs.last = None
+        if not cache_path.exists():
+            self._jobs.current = JobStats(
+                source=str(path), source_pixels=0, decoded_pixels=0, peak_bytes=0
+            )
+            try:
+                img = render(path)
+                save_image(img, cache_path, encoding)
+                del img
+            finally:
+                job = self._jobs.current
+                self._jobs.current = None
+            self._jobs.last = job
+            with self._intermediate_lock:
+                self.peak_job_bytes = max(self.peak_job_bytes, job["peak_bytes"])
+            if self.cache_manager is not None:
+                self.cache_manager.record_miss("images", cache_path)
+        elif self.cache_manager is not None:
+            self.cache_manager.record_hit("images", cache_path)
+
+        with self._manifest_lock:
+            self._manifest[manifest_key] = str(cache_path)
+        return str(cache_path)
+
+    def _lookup_variant(
+        self, image_path: str, params: str, profile: str = "source"
+    ) -> Optional[str]:
+        """
+        Return the cached output for (image, params) if it exists, never rendering.
+
+        Unlike _cached_variant the source is not hashed: its digest must
+        already be in the index for the (mtime, size) the file has now.
+        """
+        self._load_digest_index()
 
-        # Process the image
-        img: Image.Image = Image.open(path)
+        encoding = resolve_profile(profile)
+        if profile != "source":
+            params = f"{params}_{profile}"
 
-        # Apply scaling if requested
-        if scale is not None:
-            width, height = img.size
-            new_width = int(width * scale)
-            new_height = int(height * scale)
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        path = Path(image_path)
+        manifest_key = (os.path.abspath(path), params)
+
+        with self._manifest_lock:
+            processed = self._manifest.get(manifest_key)
+        if processed is not None and os.path.exists(processed):
+            if self.cache_manager is not None:
+                self.cache_manager.record_hit("images", Path(processed))
+            return processed
 
-        # Apply filter if requested
-        if filter_name and filter_name in self.filters:
-            img = self.filters[filter_name](img)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        entry = self._digests.get(manifest_key[0])
+        if not entry or entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+            return None
+        cache_path = self._variant_path(str(entry[2]), params, encoding, path)
+        if not cache_path.exists():
+            return None
 
-        # Save the processed image
-        img.save(cache_path)
+        if self.cache_manager is not None:
+            self.cache_manager.record_hit("images", cache_path)
+        with self._manifest_lock:
+            self._manifest[manifest_key] = str(cache_path)
         return str(cache_path)
 
+    def _variant_path(
+        self, digest: str, params: str, encoding: EncodingProfile, source: Path
+    ) -> Path:
+        """Cache file for a processed variant of a source."""
+        return self.cache_dir / f"{digest}_{params}{output_suffix(encoding, source.suffix)}"
+
+    def source_digest(self, path: Path) -> str:
+        """
+        Return a content digest for a source image.
+
+        Digests are remembered per (path, mtime, size) in an index persisted
+        in the cache directory, so files are only re-hashed when they change.
+
+        Args:
+            path: Path to the source image
+
+        Returns:
+            str: Hex digest of the file contents
+        """
+        key = os.path.abspath(path)
+        st = os.stat(path)
+        entry = self._digests.get(key)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return str(entry[2])
+
+        digest = self._hash_file(path)
+        self._digests[key] = [st.st_mtime_ns, st.st_size, digest]
+        # Saves are spaced out so a batch of new sources is not quadratic in
+        # index writes; entries lost on exit are simply re-hashed next time
+        self._digests_dirty = True
+        if time.monotonic() - self._digests_saved >= DIGEST_SAVE_INTERVAL:
+            self._save_digest_index()
+        return digest
+
+    def flush(self) -> None:
+        """Write the digest index if it has unsaved entries."""
+        if self._digests_dirty:
+            self._save_digest_index()
+
+    def forget(self, image_path: str) -> None:
+        """Drop manifest entries for a source image (e.g. after it changed)."""
+        source = os.path.abspath(image_path)
+        with self._manifest_lock:
+            for key in [key for key in self._manifest if key[0] == source]:
+                del self._manifest[key]
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        hasher = hashlib.blake2b(digest_size=12)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def _load_digest_index(self) -> None:
+        # Cheap when the cache directory is unchanged: no filesystem access
+        if self._digests_dir == self.cache_dir:
+            return
+        self._digests_dir = self.cache_dir
+        with self._manifest_lock:
+            self._manifest.clear()
+        try:
+            with open(self.cache_dir / DIGEST_INDEX_NAME, "r") as f:
+                self._digests = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self._digests = {}
+
+    def _save_digest_index(self) -> None:
+        self._digests_dirty = False
+        self._digests_saved = time.monotonic()
+        index_path = self.cache_dir / DIGEST_INDEX_NAME
+        tmp_path = index_path.with_name(
+            f"{index_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            # Copy first: worker threads may add entries while this runs
+            data = json.dumps(dict(self._digests))
+            with open(tmp_path, "w") as f:
+                f.write(data)
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            # The index is only an optimisation; files are re-hashed without it
+            print(f"Error saving digest index: {e}")
+
     def _apply_grayscale(self, img: Image.Image) -> Image.Image:
         """Convert an image to grayscale"""
         return ImageOps.grayscale(img)
@@ -82,16 +724,15 @@ class ImageProcessor:
         # Convert to RGB mode if not already
         img_rgb = img.convert("RGB")
 
-        # Edge detection for outlines
+        # Edge detection for outlines, and simplified colors (quantize to
+        # fewer colors); the RGB copy is released before the next buffers
         edges = img_rgb.filter(ImageFilter.FIND_EDGES)
-        edges = ImageEnhance.Contrast(edges).enhance(2.0)
-
-        # Simplify colors (quantize to fewer colors)
-        quantized = img_rgb.quantize(colors=32).convert("RGB")
+        quantized = img_rgb.quantize(colors=32)
+        del img_rgb
+        edges = _enhance_contrast(edges, 2.0)
 
         # Combine edges with the quantized image
-        result = Image.blend(quantized, edges, 0.3)
-        return result
+        return Image.blend(quantized.convert("RGB"), edges, 0.3)
 
     def _apply_posterize(self, img: Image.Image) -> Image.Image:
         """Apply posterize effect (reduced color palette)"""
@@ -118,3 +759,18 @@ class ImageProcessor:
     def _apply_blur(self, img: Image.Image) -> Image.Image:
         """Apply a blur effect to an image"""
         return img.filter(ImageFilter.GaussianBlur(radius=2))
+
+
+def _enhance_contrast(img: Image.Image, factor: float) -> Image.Image:
+    """
+    Same result as ImageEnhance.Contrast(img).enhance(factor), via a lookup
+    table instead of blending with a full-size grey image.
+    """
+    mean = int(ImageStat.Stat(img.convert("L")).mean[0] + 0.5)
+
+    def adjust(value: int) -> int:
+        # Image.blend truncates towards zero and clips to 0..255
+        out = mean + factor * (value - mean)
+        return 0 if out <= 0 else 255 if out >= 255 else int(out)
+
+    return img.point([adjust(value) for value in range(256)] * len(img.getbands()))
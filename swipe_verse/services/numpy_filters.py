@@ -0,0 +1,147 @@
+"""
+NumPy implementations of the ImageProcessor filters.
+
+Each kernel decodes the image into a single array and works on it in place,
+instead of chaining PIL operations that each allocate a full-size image.
+NumPy is optional (``pip install swipe-verse[fast]``); when it is missing
+HAVE_NUMPY is False and ImageProcessor keeps using its PIL filters.
+"""
+
+from typing import Callable, Dict, cast
+
+from PIL import Image
+
+try:
+    import numpy as np
+
+    HAVE_NUMPY = True
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None  # type: ignore[assignment]
+    HAVE_NUMPY = False
+
+# Per-channel levels used by the cartoon colour reduction (4**3 = 64 colours)
+CARTOON_LEVELS = 4
+
+
+def grayscale(img: Image.Image) -> Image.Image:
+    """Convert to grayscale using PIL's fixed-point ITU-R 601-2 luma weights."""
+    if img.mode == "L":
+        return img.copy()
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGB")
+
+    rgb = np.asarray(img)
+    luma = np.multiply(rgb[..., 0], 19595, dtype=np.uint32)
+    scratch = np.multiply(rgb[..., 1], 38470, dtype=np.uint32)
+    luma += scratch
+    np.multiply(rgb[..., 2], 7471, out=scratch, dtype=np.uint32)
+    luma += scratch
+    luma += 0x8000
+    luma >>= 16
+    return Image.fromarray(luma.astype(np.uint8), "L")
+
+
+def posterize(img: Image.Image, bits: int = 2) -> Image.Image:
+    """Keep the top ``bits`` bits of each RGB channel."""
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+
+    pixels = np.array(img)
+    np.bitwise_and(pixels, (0xFF << (8 - bits)) & 0xFF, out=pixels)
+    return Image.fromarray(pixels, "RGB")
+
+
+def pixelate(img: Image.Image) -> Image.Image:
+    """
+    Pixelate with the same block size and nearest-neighbour sampling as the
+    PIL filter, as a single gather instead of a downscale and upscale.
+    """
+    if img.mode not in ("L", "RGB", "RGBA"):
+        img = img.convert("RGBA")
+
+    width, height = img.size
+    factor = max(1, min(width, height) // 50)
+    rows = _nearest_block_indices(height, height // factor)
+    cols = _nearest_block_indices(width, width // factor)
+
+    # Two 1-D takes are much cheaper than a 2-D fancy-index gather
+    pixels = np.take(np.asarray(img), rows, axis=0)
+    return Image.fromarray(np.take(pixels, cols, axis=1), img.mode)
+
+
+def cartoon(img: Image.Image) -> Image.Image:
+    """
+    Cartoon effect: edge outlines blended over a colour-reduced image.
+
+    Matches the PIL filter's FIND_EDGES kernel, 2x contrast and 30% blend,
+    but reduces colours to CARTOON_LEVELS uniform levels per channel instead
+    of an adaptive median-cut palette, which is what made the PIL path slow.
+    All arithmetic is done in int16 buffers that are updated in place.
+    """
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+
+    pixels = np.array(img, dtype=np.int16)
+
+    # FIND_EDGES: 8 * centre - neighbours == 9 * centre - 3x3 box sum
+    padded = np.pad(pixels, ((1, 1), (1, 1), (0, 0)), mode="edge")
+    rows = padded[:, :-2] + padded[:, 1:-1]
+    rows += padded[:, 2:]
+    del padded
+    edges = rows[:-2] + rows[1:-1]
+    edges += rows[2:]
+    del rows
+    np.negative(edges, out=edges)
+    edges += pixels * 9
+    np.clip(edges, 0, 255, out=edges)
+
+    # ImageEnhance.Contrast(2.0) around the mean grey level
+    mean = int(
+        (
+            edges[..., 0].mean() * 0.299
+            + edges[..., 1].mean() * 0.587
+            + edges[..., 2].mean() * 0.114
+        )
+        + 0.5
+    )
+    edges -= mean
+    edges *= 2
+    edges += mean
+    np.clip(edges, 0, 255, out=edges)
+
+    # Uniform colour reduction, reusing the decoded buffer
+    step = 256 // CARTOON_LEVELS
+    quantized = pixels
+    quantized //= step
+    quantized *= step
+    quantized += step // 2
+
+    # Image.blend(quantized, edges, 0.3) in fixed point
+    quantized *= 7
+    edges *= 3
+    quantized += edges
+    quantized += 5
+    quantized //= 10
+    return Image.fromarray(quantized.astype(np.uint8), "RGB")
+
+
+def _nearest_block_indices(size: int, reduced: int) -> "np.ndarray":
+    """Source index for each output pixel of a NEAREST down- then up-scale."""
+    reduced = max(1, reduced)
+    small = np.floor((np.arange(size) + 0.5) * (reduced / size)).astype(np.intp)
+    source = np.floor((small + 0.5) * (size / reduced)).astype(np.intp)
+    return cast("np.ndarray", np.minimum(source, size - 1))
+
+
+# Filters with a NumPy kernel; the others stay on PIL
+KERNELS: Dict[str, Callable[[Image.Image], Image.Image]] = {
+    "grayscale": grayscale,
+    "cartoon": cartoon,
+    "posterize": posterize,
+    "pixelate": pixelate,
+}
+
+# Kernels ImageProcessor swaps in. PIL's grayscale, posterize and pixelate are
+# single C passes that beat the image <-> array round-trip on their own
+# (see tools/benchmark_filters.py), so only cartoon is replaced by default.
+PREFERRED = ("cartoon",)
@@ -0,0 +1,176 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from swipe_verse.models.config import GameConfig
+from swipe_verse.services.asset_manager import AssetManager
+from swipe_verse.services.image_processor import ImageProcessor
+
+MANIFEST_NAME = "prerender_manifest.json"
+
+# One ImageProcessor per worker process, keyed by cache directory
+_worker_processors: Dict[str, ImageProcessor] = {}
+
+
+def _render_variant(
+    image_path: str,
+    filter_name: Optional[str],
+    scale: Optional[float],
+    cache_dir: str,
+) -> Tuple[str, Optional[str], Optional[float], str, float, int]:
+    """Render one (asset, filter, scale) variant inside a worker process."""
+    processor = _worker_processors.get(cache_dir)
+    if processor is None:
+        processor = ImageProcessor(cache_dir=Path(cache_dir))
+        _worker_processors[cache_dir] = processor
+
+    started = time.perf_counter()
+    output = processor.process_image(image_path, filter_name=filter_name, scale=scale)
+    seconds = time.perf_counter() - started
+    job = processor.last_job()
+    return image_path, filter_name, scale, output, seconds, job["peak_bytes"] if job else 0
+
+
+def collect_theme_images(config: GameConfig, asset_manager: AssetManager) -> List[Path]:
+    """
+    Collect every local image a scenario displays (card back, background,
+    resource icons and card art), resolved the same way the app resolves them.
+
+    Remote URLs are skipped since they are downloaded on demand.
+    """
+    references: List[str] = [str(config.theme.card_back)]
+    if config.theme.background:
+        references.append(str(config.theme.background))
+    references.extend(str(icon) for icon in config.theme.resource_icons.values())
+    references.extend(str(card.image) for card in config.cards)
+
+    images: List[Path] = []
+    seen = set()
+    for reference in references:
+        path = asset_manager.resolve_local_path(reference)
+        if path is None or not path.exists() or path in seen:
+            continue
+        seen.add(path)
+        images.append(path)
+    return images
+
+
+def prerender(
+    images: Sequence[Path],
+    filters: Iterable[Optional[str]],
+    scales: Iterable[Optional[float]] = (None,),
+    cache_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+    scenario: str = "",
+) -> Dict[str, Any]:
+    """
+    Render every (image, filter, scale) combination across a process pool.
+
+    Outputs land in the ImageProcessor cache so the running app finds them
+    pre-rendered, and a manifest of all variants is written alongside.
+
+    Args:
+        images: Local source images
+        filters: Filter names (None renders the unfiltered variant)
+        scales: Scale factors (None keeps the original size)
+        cache_dir: ImageProcessor cache directory (default ~/.swipe_verse/image_cache)
+        workers: Number of worker processes (default: CPU count)
+        scenario: Scenario name recorded in the manifest
+
+    Returns:
+        Dict: Report with the manifest path, throughput and per-filter timings
+            and peak pixel memory (see ImageProcessor.last_job)
+    """
+    cache_dir = cache_dir or ImageProcessor().cache_dir
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    filters = list(filters)
+    scales = list(scales)
+
+    jobs = [
+        (str(image), filter_name, scale, str(cache_dir))
+        for image in images
+        for filter_name in filters
+        for scale in scales
+    ]
+
+    variants: List[Dict[str, Any]] = []
+    per_filter: Dict[str, Dict[str, float]] = {}
+    errors: List[str] = []
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = [pool.submit(_render_variant, *job) for job in jobs]
+        for future in as_completed(futures):
+            try:
+                source, filter_name, scale, output, seconds, peak = future.result()
+            except Exception as e:
+                errors.append(str(e))
+                continue
+
+            variants.append(
+                {
+                    "source": source,
+                    "filter": filter_name,
+                    "scale": scale,
+                    "output": output,
+                }
+            )
+            timing = per_filter.setdefault(
+                filter_name or "none",
+                {"count": 0, "total_s": 0.0, "max_s": 0.0, "peak_bytes": 0},
+            )
+            timing["count"] += 1
+            timing["total_s"] += seconds
+            timing["max_s"] = max(timing["max_s"], seconds)
+            timing["peak_bytes"] = max(timing["peak_bytes"], peak)
+    elapsed = time.perf_counter() - started
+
+    variants.sort(key=lambda v: (v["source"], v["filter"] or "", v["scale"] or 0))
+    manifest_path = cache_dir / MANIFEST_NAME
+    manifest = {
+        "scenario": scenario,
+        "created": datetime.now().isoformat(),
+        "variants": variants,
+    }
+    tmp_path = manifest_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+    return {
+        "manifest": str(manifest_path),
+        "images": len(images),
+        "variants": len(variants),
+        "errors": errors,
+        "elapsed_s": elapsed,
+        "variants_per_s": len(variants) / elapsed if elapsed > 0 else 0.0,
+        "per_filter": per_filter,
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render a prerender report as human-readable text."""
+    lines = [
+        f"Rendered {report['variants']} variants of {report['images']} images "
+        f"in {report['elapsed_s']:.2f}s ({report['variants_per_s']:.1f} variants/s)",
+        "",
+        f"{'filter':<12} {'count':>6} {'avg ms':>9} {'max ms':>9} {'peak MiB':>9}",
+    ]
+    for filter_name, timing in sorted(report["per_filter"].items()):
+        avg_ms = timing["total_s"] / timing["count"] * 1000 if timing["count"] else 0
+        lines.append(
+            f"{filter_name:<12} {timing['count']:>6} {avg_ms:>9.1f} "
+            f"{timing['max_s'] * 1000:>9.1f} "
+            f"{timing.get('peak_bytes', 0) / (1024 * 1024):>9.1f}"
+        )
+    if report["errors"]:
+        lines.append("")
+        lines.append(f"{len(report['errors'])} variants failed:")
+        lines.extend(f"  {error}" for error in report["errors"])
+    lines.append("")
+    lines.append(f"Manifest: {report['manifest']}")
+    return "\n".join(lines)
@@ -0,0 +1,203 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+from pydantic_core import from_json
+
+from swipe_verse.services.cache_manager import CacheManager
+
+# revalidate: ask the server on every load, using the cached copy when it
+#             answers 304 Not Modified or cannot be reached
+# stale:      start from the cached copy at once and revalidate it in the
+#             background for the next load (stale-while-revalidate)
+# offline:    never touch the network; only cached scenarios load
+MODES = ("revalidate", "stale", "offline")
+
+
+class RemoteConfigCache:
+    """
+    Remote scenario files kept on disk and revalidated over HTTP.
+
+    Each URL's body is stored as ``<key>.json`` next to ``<key>.meta.json``,
+    which holds the ETag and Last-Modified the server sent. Later loads send
+    them back as If-None-Match / If-Modified-Since, so an unchanged scenario
+    costs a 304 instead of a download, and the stored file goes through the
+    same config cache as local scenarios.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        cache_manager: Optional[CacheManager] = None,
+        mode: str = "revalidate",
+        timeout: float = 10.0,
+    ) -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode {mode!r}, expected one of {MODES}")
+        if cache_dir is None and cache_manager is not None:
+            cache_dir = cache_manager.path("downloads")
+        self.cache_dir = cache_dir or Path.home() / ".swipe_verse" / "cache"
+        self.cache_manager = cache_manager
+        self.mode = mode
+        self.timeout = timeout
+        # Loads served from disk, full downloads, and 304 answers
+        self.hits = 0
+        self.downloads = 0
+        self.not_modified = 0
+        self._lock = threading.Lock()
+        self._revalidations: Dict[str, threading.Thread] = {}
+
+    async def fetch(self, url: str) -> Path:
+        """
+        Return the path of an up-to-date (or, if need be, cached) copy of a URL.
+
+        Args:
+            url: Scenario URL
+
+        Returns:
+            Path: The stored scenario file
+
+        Raises:
+            FileNotFoundError: In offline mode, if the URL was never cached
+            Exception: If the download fails and nothing is cached
+        """
+        cached = self.cached(url)
+        if self.mode == "offline":
+            if cached is None:
+                raise FileNotFoundError(f"Not cached for offline use: {url}")
+            self._record_hit(cached)
+            return cached
+
+        if cached is not None and self.mode == "stale":
+            self._record_hit(cached)
+            self.revalidate_in_background(url)
+            return cached
+
+        try:
+            return await self._revalidate(url)
+        except Exception as e:
+            if cached is None:
+                raise
+            print(f"Could not revalidate {url}, using cached copy: {e}")
+            self._record_hit(cached)
+            return cached
+
+    def cached(self, url: str) -> Optional[Path]:
+        """Return the stored copy of a URL, or None."""
+        body_path, _ = self._paths(url)
+        return body_path if body_path.exists() else None
+
+    def revalidate_in_background(self, url: str) -> None:
+        """
+        Refresh a URL's stored copy on a worker thread.
+
+        The thread runs its own event loop, so it outlives the caller's loop
+        (the app runs each screen's coroutine with a short-lived one).
+        """
+
+        def run() -> None:
+            try:
+                asyncio.run(self._revalidate(url))
+            except Exception as e:
+                print(f"Could not revalidate {url}: {e}")
+            finally:
+                with self._lock:
+                    self._revalidations.pop(url, None)
+
+        with self._lock:
+            if url in self._revalidations:
+                return
+            thread = threading.Thread(target=run, daemon=True)
+            self._revalidations[url] = thread
+        thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Block until background revalidations have finished."""
+        with self._lock:
+            threads: List[threading.Thread] = list(self._revalidations.values())
+        for thread in threads:
+            thread.join(timeout)
+
+    async def _revalidate(self, url: str) -> Path:
+        """Download a URL unless the server confirms the stored copy."""
+        body_path, meta_path = self._paths(url)
+        meta = self._read_meta(meta_path, body_path)
+        headers = {}
+        if meta is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304 and meta is not None:
+                    with self._lock:
+                        self.not_modified += 1
+                    self._record_hit(body_path)
+                    return body_path
+                if response.status != 200:
+                    raise Exception(
+                        f"Failed to download config from {url}, status {response.status}"
+                    )
+                body = await response.read()
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+
+        # Never replace a good copy with an error page or a cut-off body
+        try:
+            from_json(body)
+        except ValueError as e:
+            raise Exception(f"Downloaded config from {url} is not valid JSON: {e}") from e
+
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "size": len(body),
+        }
+        # Body first: a meta file always describes the body next to it
+        self._write(body_path, body)
+        self._write(meta_path, json.dumps(meta).encode("utf-8"))
+        with self._lock:
+            self.downloads += 1
+        if self.cache_manager is not None:
+            self.cache_manager.record_miss("downloads", body_path)
+        return body_path
+
+    def _paths(self, url: str) -> Tuple[Path, Path]:
+        key = hashlib.blake2b(url.encode(), digest_size=12).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.meta.json"
+
+    @staticmethod
+    def _read_meta(meta_path: Path, body_path: Path) -> Optional[Dict[str, Any]]:
+        """Return the validators of the stored copy, if they describe it."""
+        try:
+            with open(meta_path, "rb") as f:
+                meta = from_json(f.read())
+            if meta["size"] != body_path.stat().st_size:
+                return None
+            return dict(meta)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write(self, path: Path, data: bytes) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(
+            f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _record_hit(self, path: Path) -> None:
+        with self._lock:
+            self.hits += 1
+        if self.cache_manager is not None:
+            self.cache_manager.record_hit("downloads", path)
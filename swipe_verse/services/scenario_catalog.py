@@ -0,0 +1,196 @@
+import asyncio
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from pydantic_core import from_json
+
+from swipe_verse.models.config import GameInfo, ScenarioManifest, ThemeSummary
+from swipe_verse.services.cache_manager import CacheManager
+
+# Bundled scenarios
+SCENARIOS_DIR = Path(__file__).parent.parent / "scenarios"
+
+# Bump when the manifest fields change, so older cached manifests are rebuilt
+MANIFEST_VERSION = 1
+
+
+def build_manifest(path: Path) -> ScenarioManifest:
+    """
+    Read a scenario file's header.
+
+    Only game_info and the theme summary are validated; the cards are
+    counted but not validated, which is most of the work of a full load.
+
+    Args:
+        path: Scenario file
+
+    Returns:
+        ScenarioManifest: The scenario's header
+
+    Raises:
+        ValueError: If the file is not valid JSON or the header is invalid
+    """
+    with open(path, "rb") as f:
+        data = from_json(f.read())
+    if not isinstance(data, dict):
+        raise ValueError(f"Scenario is not a JSON object: {path}")
+    settings = data.get("game_settings") or {}
+    return ScenarioManifest(
+        path=str(path),
+        game_info=GameInfo.model_validate(data.get("game_info")),
+        theme=ThemeSummary.model_validate(data.get("theme")),
+        card_count=len(data.get("cards") or []),
+        resource_count=len(settings.get("initial_resources") or {}),
+    )
+
+
+class ScenarioCatalog:
+    """
+    Lists the scenarios in a directory from their headers.
+
+    Manifests are built concurrently in worker threads and cached on disk,
+    one small JSON file per scenario stamped with its mtime and size, so
+    listing hundreds of unchanged scenarios reads a few KiB each. Full
+    configs are loaded by ConfigLoader only once a scenario is chosen.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        cache_dir: Optional[Path] = None,
+        cache_manager: Optional[CacheManager] = None,
+        max_concurrency: int = 4,
+    ) -> None:
+        self.directory = Path(directory) if directory else SCENARIOS_DIR
+        if cache_dir is None and cache_manager is not None:
+            cache_dir = cache_manager.path("configs")
+        self.cache_dir = cache_dir or Path.home() / ".swipe_verse" / "config_cache"
+        self.cache_manager = cache_manager
+        self.max_concurrency = max_concurrency
+        self.hits = 0
+        self.misses = 0
+
+    async def scan(self) -> List[ScenarioManifest]:
+        """
+        Return the manifests of every ``*_game.json`` in the directory.
+
+        Scenarios that cannot be read are skipped (and reported).
+
+        Returns:
+            List[ScenarioManifest]: Manifests, sorted by file name
+        """
+        paths = sorted(self.directory.glob("*_game.json"))
+        # One worker call per batch rather than per file: most manifests are
+        # cache hits that take less time to read than a thread hand-off
+        batches = [
+            paths[start :: self.max_concurrency]
+            for start in range(min(self.max_concurrency, len(paths)))
+        ]
+
+        def load(batch: List[Path]) -> List[Optional[ScenarioManifest]]:
+            return [self.manifest(path) for path in batch]
+
+        results = await asyncio.gather(
+            *(asyncio.to_thread(load, batch) for batch in batches)
+        )
+        by_path = {
+            path: manifest
+            for batch, manifests in zip(batches, results)
+            for path, manifest in zip(batch, manifests)
+        }
+        return [manifest for path in paths if (manifest := by_path[path]) is not None]
+
+    def manifest(self, path: Path) -> Optional[ScenarioManifest]:
+        """
+        Return a scenario's manifest, from the cache when the file is unchanged.
+
+        Args:
+            path: Scenario file
+
+        Returns:
+            Optional[ScenarioManifest]: The manifest, or None if the file
+                cannot be read
+        """
+        try:
+            stamp = self._stamp(path)
+        except OSError as e:
+            print(f"Error reading scenario {path}: {e}")
+            return None
+
+        cached = self.get(path, stamp)
+        if cached is not None:
+            return cached
+
+        try:
+            manifest = build_manifest(path)
+        except Exception as e:
+            print(f"Error reading scenario {path}: {e}")
+            return None
+        self.put(path, manifest, stamp)
+        return manifest
+
+    def get(
+        self, path: Path, stamp: Optional[Tuple[int, int, int]] = None
+    ) -> Optional[ScenarioManifest]:
+        """Return the cached manifest if it matches the file, else None."""
+        stamp = stamp or self._stamp(path)
+        entry_path = self._entry_path(path)
+        manifest = None
+        try:
+            with open(entry_path, "rb") as f:
+                entry = from_json(f.read())
+            if tuple(entry["stamp"]) == stamp:
+                manifest = ScenarioManifest.model_validate(entry["manifest"])
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            # Unreadable or written by an incompatible version
+            print(f"Discarding cached manifest {entry_path}: {e}")
+            entry_path.unlink(missing_ok=True)
+
+        if manifest is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self.cache_manager is not None:
+            self.cache_manager.record_hit("configs", entry_path)
+        return manifest
+
+    def put(
+        self,
+        path: Path,
+        manifest: ScenarioManifest,
+        stamp: Optional[Tuple[int, int, int]] = None,
+    ) -> None:
+        """Store a manifest, stamped with the file state it was built from."""
+        stamp = stamp or self._stamp(path)
+        entry_path = self._entry_path(path)
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        entry = json.dumps(
+            {"stamp": list(stamp), "manifest": manifest.model_dump(mode="json")}
+        )
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(entry)
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            # Only an optimisation; the next scan reads the file again
+            print(f"Error caching manifest {path}: {e}")
+            return
+        if self.cache_manager is not None:
+            self.cache_manager.record_miss("configs", entry_path)
+
+    def _entry_path(self, path: Path) -> Path:
+        key = hashlib.blake2b(
+            os.path.abspath(path).encode(), digest_size=12
+        ).hexdigest()
+        return self.cache_dir / f"{key}.manifest.json"
+
+    @staticmethod
+    def _stamp(path: Path) -> Tuple[int, int, int]:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size, MANIFEST_VERSION
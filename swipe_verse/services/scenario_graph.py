@@ -0,0 +1,227 @@
+from typing import Dict, Iterable, List, Optional, Sequence, TypedDict
+
+from swipe_verse.models.config import Card
+
+
+class DanglingLink(TypedDict):
+    card: str
+    direction: str
+    target: str
+
+
+class GraphReport(TypedDict):
+    """Findings of ScenarioGraph.analyze, as stored in scenario packs."""
+
+    cards: int
+    links: int
+    # Choices whose next_card is not in the deck (played as a random draw)
+    dangling: List[DanglingLink]
+    # Cards without choices: the player cannot swipe past them
+    dead_ends: List[str]
+    # Groups of cards linked in a loop (strongly connected components)
+    cycles: List[List[str]]
+    # Loops no choice leaves: once entered, no random card is drawn again
+    forced_cycles: List[List[str]]
+    # Cards no play from the start can reach
+    unreachable: List[str]
+
+
+class ScenarioGraph:
+    """
+    The graph of a scenario's cards, linked by their choices' next_card.
+
+    A choice without a next_card, or whose next_card is not in the deck,
+    draws a random card, as does the start of a game; the graph records
+    such choices as draws rather than edges. Links are resolved to card
+    positions once, and every analysis is linear in cards plus choices.
+    """
+
+    def __init__(
+        self, ids: Sequence[str], links: Sequence[Dict[str, Optional[str]]]
+    ) -> None:
+        """
+        Args:
+            ids: Card ids, in deck order
+            links: For each card, its choices' next_card by direction
+        """
+        self.ids = list(ids)
+        self.index: Dict[str, int] = {}
+        for position, card_id in enumerate(self.ids):
+            # The first card wins when ids repeat, as in CardStore.get
+            self.index.setdefault(card_id, position)
+
+        self.successors: List[List[int]] = []
+        self.draws: List[bool] = []
+        self.choices: List[int] = []
+        self.dangling: List[DanglingLink] = []
+        for card_id, card_links in zip(self.ids, links):
+            successors: List[int] = []
+            draws = False
+            for direction, target in card_links.items():
+                successor = self.index.get(target) if target else None
+                if successor is None:
+                    draws = True
+                    if target:
+                        self.dangling.append(
+                            {"card": card_id, "direction": direction, "target": target}
+                        )
+                elif successor not in successors:
+                    successors.append(successor)
+            self.successors.append(successors)
+            self.draws.append(draws)
+            self.choices.append(len(card_links))
+
+    @classmethod
+    def from_cards(cls, cards: Iterable[Card]) -> "ScenarioGraph":
+        """Build the graph of a deck (a list or any CardStore)."""
+        ids: List[str] = []
+        links: List[Dict[str, Optional[str]]] = []
+        for card in cards:
+            ids.append(card.id)
+            links.append(
+                {direction: choice.next_card for direction, choice in card.choices.items()}
+            )
+        return cls(ids, links)
+
+    def components(self) -> List[List[int]]:
+        """
+        Return the strongly connected components of the link graph.
+
+        Uses an iterative version of Tarjan's algorithm, so long chains of
+        linked cards do not hit the recursion limit.
+
+        Returns:
+            List[List[int]]: Card positions per component, in reverse
+                topological order (a component's links lead only to itself
+                or to components listed before it)
+        """
+        count = len(self.ids)
+        order = [-1] * count
+        lowlink = [0] * count
+        on_stack = [False] * count
+        stack: List[int] = []
+        components: List[List[int]] = []
+        counter = 0
+
+        for root in range(count):
+            if order[root] != -1:
+                continue
+            # (node, index of the next successor to visit)
+            work = [(root, 0)]
+            while work:
+                node, child = work.pop()
+                if child == 0:
+                    order[node] = lowlink[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                successors = self.successors[node]
+                while child < len(successors):
+                    successor = successors[child]
+                    child += 1
+                    if order[successor] == -1:
+                        work.append((node, child))
+                        work.append((successor, 0))
+                        break
+                    if on_stack[successor]:
+                        lowlink[node] = min(lowlink[node], order[successor])
+                else:
+                    if lowlink[node] == order[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+        return components
+
+    def reachable(self, start: Optional[str] = None) -> List[bool]:
+        """
+        Mark the cards a player can reach.
+
+        Args:
+            start: Id of the first card, or None for a random first card
+
+        Returns:
+            List[bool]: For each card position, whether it can be reached
+
+        Raises:
+            ValueError: If the start card is not in the deck
+        """
+        if start is None:
+            # A random draw can turn up any card
+            return [True] * len(self.ids)
+        position = self.index.get(start)
+        if position is None:
+            raise ValueError(f"Unknown start card: {start}")
+
+        seen = [False] * len(self.ids)
+        seen[position] = True
+        pending = [position]
+        while pending:
+            node = pending.pop()
+            if self.draws[node]:
+                return [True] * len(self.ids)
+            for successor in self.successors[node]:
+                if not seen[successor]:
+                    seen[successor] = True
+                    pending.append(successor)
+        return seen
+
+    def analyze(self, start: Optional[str] = None) -> GraphReport:
+        """
+        Check the scenario for broken or inescapable links.
+
+        Args:
+            start: Id of the first card, or None for a random first card
+
+        Returns:
+            GraphReport: The findings, with cards named by id
+        """
+        ids = self.ids
+        cycles: List[List[str]] = []
+        forced: List[List[str]] = []
+        # Listed in deck order, by each loop's first card
+        for component in sorted(self.components(), key=min):
+            members = set(component)
+            node = component[0]
+            if len(component) == 1 and node not in self.successors[node]:
+                continue
+            names = [ids[position] for position in sorted(component)]
+            cycles.append(names)
+            if not any(self.draws[position] for position in component) and all(
+                successor in members
+                for position in component
+                for successor in self.successors[position]
+            ):
+                forced.append(names)
+
+        reachable = self.reachable(start)
+        return {
+            "cards": len(ids),
+            "links": sum(len(successors) for successors in self.successors),
+            "dangling": list(self.dangling),
+            "dead_ends": [
+                card_id for card_id, choices in zip(ids, self.choices) if not choices
+            ],
+            "cycles": cycles,
+            "forced_cycles": forced,
+            "unreachable": [
+                card_id for card_id, seen in zip(ids, reachable) if not seen
+            ],
+        }
+
+
+def has_errors(report: GraphReport) -> bool:
+    """Return True if a report has findings that break play."""
+    return bool(
+        report["dangling"]
+        or report["dead_ends"]
+        or report["forced_cycles"]
+        or report["unreachable"]
+    )
@@ -0,0 +1,437 @@
+import json
+import mmap
+import os
+import random
+import struct
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Optional,
+    Union,
+    cast,
+    overload,
+)
+
+from swipe_verse.models.config import Card, CardChoice, GameConfig
+from swipe_verse.services.card_store import CardStore
+from swipe_verse.services.scenario_graph import GraphReport, ScenarioGraph
+
+# Binary scenario packs, written by ``swipe-verse pack``.
+#
+# Layout (little-endian, sections 8-byte aligned):
+#   header        HEADER
+#   meta          UTF-8 JSON: game_info, theme, game_settings, the choice
+#                 directions and effect resources of the records, and the
+#                 scenario graph's report (see ScenarioGraph.analyze)
+#   string index  u64 offsets into the string data, one more than strings
+#   string data   UTF-8 strings, each stored once
+#   records       one fixed-width record per card (see _record_struct)
+#   id index      u32 card indices, sorted by card id
+#
+# A card record holds string indices for id, title, text and image, then
+# for each direction: choice text, next_card (string), next card index,
+# a bitmask of the resources the choice affects and one i32 per resource.
+PACK_MAGIC = b"SVPACK\x00\x01"
+PACK_VERSION = 1
+PACK_SUFFIX = ".svpack"
+
+HEADER = struct.Struct("<8sHHIIII6Q")
+
+# String index for an absent value; card index for a next_card not in the deck
+NO_STRING = 0xFFFFFFFF
+NO_CARD = -1
+
+# Effects per choice are flagged in a 64-bit mask
+MAX_RESOURCES = 64
+
+_INT32 = (-(2**31), 2**31 - 1)
+
+
+def _record_struct(directions: int, resources: int) -> struct.Struct:
+    return struct.Struct("<4I" + ("IIiQ" + "i" * resources) * directions)
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def write_pack(config: GameConfig, path: Path) -> Dict[str, int]:
+    """
+    Compile a validated config into a pack file.
+
+    The file is written to a temporary name and renamed into place, so
+    processes that have the old pack mapped keep reading it safely.
+
+    Args:
+        config: The validated configuration
+        path: Pack file to write
+
+    Returns:
+        Dict[str, int]: Number of cards and strings, and the file size
+
+    Raises:
+        ValueError: If choices affect more than 64 resources or an effect
+            does not fit in 32 bits
+    """
+    cards = list(config.cards)
+    directions: List[str] = []
+    resources: List[str] = list(config.game_settings.initial_resources)
+    for card in cards:
+        for direction, card_choice in card.choices.items():
+            if direction not in directions:
+                directions.append(direction)
+            for resource in card_choice.effects:
+                if resource not in resources:
+                    resources.append(resource)
+    if len(resources) > MAX_RESOURCES:
+        raise ValueError(
+            f"Packs support at most {MAX_RESOURCES} resources, got {len(resources)}"
+        )
+
+    strings: Dict[str, int] = {}
+
+    def intern(value: Optional[str]) -> int:
+        if value is None:
+            return NO_STRING
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    index_by_id: Dict[str, int] = {}
+    for index, card in enumerate(cards):
+        index_by_id.setdefault(card.id, index)
+
+    record = _record_struct(len(directions), len(resources))
+    records = bytearray(record.size * len(cards))
+    for index, card in enumerate(cards):
+        fields: List[int] = [
+            intern(card.id),
+            intern(card.title),
+            intern(card.text),
+            intern(str(card.image)),
+        ]
+        for direction in directions:
+            choice = card.choices.get(direction)
+            if choice is None:
+                fields.extend([NO_STRING, NO_STRING, NO_CARD, 0])
+                fields.extend([0] * len(resources))
+                continue
+            mask = 0
+            values = [0] * len(resources)
+            for resource, value in choice.effects.items():
+                if not _INT32[0] <= value <= _INT32[1]:
+                    raise ValueError(
+                        f"Effect {resource}={value} of card {card.id} does not fit in 32 bits"
+                    )
+                slot = resources.index(resource)
+                mask |= 1 << slot
+                values[slot] = value
+            next_index = (
+                index_by_id.get(choice.next_card, NO_CARD)
+                if choice.next_card is not None
+                else NO_CARD
+            )
+            fields.extend([intern(choice.text), intern(choice.next_card), next_index, mask])
+            fields.extend(values)
+        record.pack_into(records, index * record.size, *fields)
+
+    meta = json.dumps(
+        {
+            "game_info": config.game_info.model_dump(mode="json"),
+            "theme": config.theme.model_dump(mode="json"),
+            "game_settings": config.game_settings.model_dump(mode="json"),
+            "directions": directions,
+            "resources": resources,
+            "graph": ScenarioGraph.from_cards(cards).analyze(),
+        }
+    ).encode("utf-8")
+
+    encoded = [value.encode("utf-8") for value in strings]
+    string_offsets = [0]
+    for data in encoded:
+        string_offsets.append(string_offsets[-1] + len(data))
+    string_index = struct.pack(f"<{len(string_offsets)}Q", *string_offsets)
+    string_data = b"".join(encoded)
+
+    id_order = sorted(range(len(cards)), key=lambda i: (encoded[strings[cards[i].id]], i))
+    id_index = struct.pack(f"<{len(id_order)}I", *id_order)
+
+    sections = [meta, string_index, string_data, bytes(records), id_index]
+    offsets = []
+    position = _align(HEADER.size)
+    for section in sections:
+        offsets.append(position)
+        position = _align(position + len(section))
+
+    header = HEADER.pack(
+        PACK_MAGIC,
+        PACK_VERSION,
+        len(directions),
+        len(resources),
+        len(cards),
+        len(strings),
+        len(meta),
+        *offsets,
+        position,
+    )
+
+    tmp_path = Path(path).with_name(f"{Path(path).name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        for offset, section in zip(offsets, sections):
+            f.write(b"\x00" * (offset - f.tell()))
+            f.write(section)
+        f.write(b"\x00" * (position - f.tell()))
+    os.replace(tmp_path, path)
+    return {"cards": len(cards), "strings": len(strings), "bytes": position}
+
+
+class PackedCardStore(CardStore):
+    """
+    Cards read straight from a memory-mapped pack.
+
+    Records are decoded in place when a card is used; nothing is parsed or
+    validated at load time, and the mapped pages are shared by every
+    process that opens the same pack.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_header()
+        except Exception:
+            self._buffer.close()
+            raise
+
+    def _read_header(self) -> None:
+        if len(self._buffer) < HEADER.size:
+            raise ValueError(f"Not a scenario pack: {self.path}")
+        magic: bytes
+        version: int
+        directions: int
+        resources: int
+        self._count: int
+        self._string_count: int
+        meta_size: int
+        meta_offset: int
+        self._string_index: int
+        self._string_data: int
+        self._records: int
+        self._id_index: int
+        file_size: int
+        (
+            magic,
+            version,
+            directions,
+            resources,
+            self._count,
+            self._string_count,
+            meta_size,
+            meta_offset,
+            self._string_index,
+            self._string_data,
+            self._records,
+            self._id_index,
+            file_size,
+        ) = HEADER.unpack_from(self._buffer, 0)
+        if magic != PACK_MAGIC:
+            raise ValueError(f"Not a scenario pack: {self.path}")
+        if version != PACK_VERSION:
+            raise ValueError(f"Unsupported pack version {version}: {self.path}")
+        if file_size != len(self._buffer):
+            raise ValueError(f"Truncated scenario pack: {self.path}")
+
+        self.meta: Dict[str, Any] = json.loads(
+            self._buffer[meta_offset : meta_offset + meta_size]
+        )
+        self.directions: List[str] = self.meta["directions"]
+        self.resources: List[str] = self.meta["resources"]
+        if (len(self.directions), len(self.resources)) != (directions, resources):
+            raise ValueError(f"Corrupt scenario pack: {self.path}")
+        self._record = _record_struct(directions, resources)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> Card: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Card]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Card, List[Card]]:
+        if isinstance(index, slice):
+            return [self.card(i) for i in range(*index.indices(self._count))]
+        position = index + self._count if index < 0 else index
+        if not 0 <= position < self._count:
+            raise IndexError("card index out of range")
+        return self.card(position)
+
+    def ids(self) -> List[str]:
+        return [self.card_id(index) for index in range(self._count)]
+
+    def get(self, card_id: str) -> Optional[Card]:
+        index = self.index_of(card_id)
+        return None if index is None else self.card(index)
+
+    def random_card(
+        self,
+        condition: Optional[Callable[[Card], bool]] = None,
+        skip_ids: Collection[str] = (),
+    ) -> Optional[Card]:
+        # As LazyCardStore: a few random draws, then a shuffled scan
+        for _ in range(8):
+            if not self._count:
+                return None
+            index = random.randrange(self._count)
+            if self.card_id(index) in skip_ids:
+                continue
+            card = self.card(index)
+            if condition is None or condition(card):
+                return card
+
+        candidates = [
+            index for index in range(self._count) if self.card_id(index) not in skip_ids
+        ]
+        random.shuffle(candidates)
+        for index in candidates:
+            card = self.card(index)
+            if condition is None or condition(card):
+                return card
+        return None
+
+    def graph_report(self) -> GraphReport:
+        """Return the graph analysis stored when the pack was written."""
+        return cast(GraphReport, self.meta["graph"])
+
+    def close(self) -> None:
+        """Unmap the pack."""
+        self._buffer.close()
+
+    def string(self, index: int) -> Optional[str]:
+        """Decode an entry of the string table (None for NO_STRING)."""
+        if index == NO_STRING:
+            return None
+        return str(self._string_bytes(index), "utf-8")
+
+    def card_id(self, index: int) -> str:
+        """Return the id of the card at an index, without decoding the rest."""
+        return str(self._id_bytes(index), "utf-8")
+
+    def _string_bytes(self, index: int) -> bytes:
+        start, end = struct.unpack_from(
+            "<2Q", self._buffer, self._string_index + 8 * index
+        )
+        return self._buffer[self._string_data + start : self._string_data + end]
+
+    def _id_bytes(self, index: int) -> bytes:
+        (string,) = struct.unpack_from(
+            "<I", self._buffer, self._records + index * self._record.size
+        )
+        return self._string_bytes(string)
+
+    def index_of(self, card_id: str) -> Optional[int]:
+        """Find the first card with an id, by binary search of the id index."""
+        key = card_id.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            (index,) = struct.unpack_from(
+                "<I", self._buffer, self._id_index + 4 * middle
+            )
+            if self._id_bytes(index) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count:
+            (index,) = struct.unpack_from("<I", self._buffer, self._id_index + 4 * low)
+            if self._id_bytes(index) == key:
+                return cast(int, index)
+        return None
+
+    def next_index(self, index: int, direction: str) -> Optional[int]:
+        """Index of the card a choice leads to, if it is in the deck."""
+        fields = self._record.unpack_from(
+            self._buffer, self._records + index * self._record.size
+        )
+        slot = 4 + self.directions.index(direction) * (4 + len(self.resources))
+        return None if fields[slot + 2] == NO_CARD else fields[slot + 2]
+
+    def card(self, index: int) -> Card:
+        """Decode the card record at an index."""
+        fields = self._record.unpack_from(
+            self._buffer, self._records + index * self._record.size
+        )
+        string = self.string
+        choices: Dict[str, CardChoice] = {}
+        position = 4
+        for direction in self.directions:
+            text, next_card, _, mask = fields[position : position + 4]
+            values = fields[position + 4 : position + 4 + len(self.resources)]
+            position += 4 + len(self.resources)
+            if text == NO_STRING:
+                continue
+            choices[direction] = CardChoice.model_construct(
+                text=string(text),
+                effects={
+                    resource: values[slot]
+                    for slot, resource in enumerate(self.resources)
+                    if mask >> slot & 1
+                },
+                next_card=string(next_card),
+            )
+        # Validated when the pack was written
+        return Card.model_construct(
+            id=string(fields[0]),
+            title=string(fields[1]),
+            text=string(fields[2]),
+            image=string(fields[3]),
+            choices=choices,
+        )
+
+
+def is_pack(path: Path) -> bool:
+    """Return True if a file starts with the pack magic."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(PACK_MAGIC)) == PACK_MAGIC
+    except OSError:
+        return False
+
+
+def open_pack(path: Path) -> GameConfig:
+    """
+    Load a scenario pack.
+
+    game_info, theme and game_settings come from the pack's metadata;
+    ``config.cards`` is a PackedCardStore reading the mapped file. As with
+    open_scenario, the config is for playing, not for pickling or dumping.
+
+    Args:
+        path: Pack file
+
+    Returns:
+        GameConfig: The configuration
+
+    Raises:
+        ValueError: If the file is not a valid pack
+    """
+    cards = PackedCardStore(path)
+    meta = cards.meta
+    config = GameConfig.model_validate(
+        {
+            "game_info": meta["game_info"],
+            "theme": meta["theme"],
+            "game_settings": meta["game_settings"],
+            "cards": [],
+        }
+    )
+    config.cards = cast(List[Card], cards)
+    return config
@@ -0,0 +1,199 @@
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, TypedDict
+
+from pydantic_core import from_json
+
+from swipe_verse.models.config import Card, GameConfig
+from swipe_verse.services.config_cache import paused_gc
+
+if TYPE_CHECKING:
+    from swipe_verse.services.game_logic import GameLogic
+
+# Top-level scenario sections other than the cards
+SECTIONS = ("game_info", "theme", "game_settings")
+
+
+class ScenarioUpdate(TypedDict):
+    """What a reload changed in the live config."""
+
+    sections: List[str]
+    added: List[str]
+    changed: List[str]
+    removed: List[str]
+    seconds: float
+
+
+class ScenarioWatcher:
+    """
+    Reloads a scenario into the running game when its file is edited.
+
+    The file is polled for changes to its mtime and size. On a change it is
+    parsed and compared with the previous version card by card; only new
+    and edited cards are validated, unchanged cards keep their objects, and
+    the result is swapped into the live GameConfig (and GameLogic) without
+    touching the game state. An edit that does not parse or validate, such
+    as a half-saved file, is reported and the game keeps the last good
+    version. The parsed file is kept to compare the next edit against.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        config: GameConfig,
+        game_logic: Optional["GameLogic"] = None,
+        interval: float = 0.5,
+        on_reload: Optional[Callable[[ScenarioUpdate], None]] = None,
+    ) -> None:
+        """
+        Args:
+            path: Scenario file the config was loaded from
+            config: The live config, updated in place
+            game_logic: Game to refresh after a reload (may be replaced, e.g.
+                when a new game starts)
+            interval: Seconds between polls
+            on_reload: Called with each update, on the watcher thread
+
+        Raises:
+            ValueError: If the config's cards are not held in memory (lazily
+                loaded scenarios and packs cannot be watched)
+        """
+        if not isinstance(config.cards, list):
+            raise ValueError("Only scenarios loaded in memory can be watched")
+        self.path = Path(path)
+        self.config = config
+        self.game_logic = game_logic
+        self.interval = interval
+        self.on_reload = on_reload
+        self.reloads = 0
+        self._stamp = self._read_stamp()
+        self._raw = self._read_raw()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start polling on a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def check(self) -> Optional[ScenarioUpdate]:
+        """
+        Poll the file once, reloading it if it changed.
+
+        Returns:
+            Optional[ScenarioUpdate]: The update, or None if the file is
+                unchanged or the edit could not be loaded
+        """
+        try:
+            stamp = self._read_stamp()
+        except OSError as e:
+            print(f"Error watching scenario {self.path}: {e}")
+            return None
+        if stamp == self._stamp:
+            return None
+        # Not retried until the file changes again
+        self._stamp = stamp
+
+        try:
+            update = self.reload()
+        except Exception as e:
+            print(f"Error reloading scenario {self.path}: {e}")
+            return None
+        if self.on_reload is not None:
+            self.on_reload(update)
+        return update
+
+    def reload(self) -> ScenarioUpdate:
+        """
+        Load the file's changes into the live config.
+
+        Returns:
+            ScenarioUpdate: The changed sections and card ids
+
+        Raises:
+            ValueError: If the file is not valid JSON or has no cards list
+            pydantic.ValidationError: If a changed section or card is invalid
+        """
+        started = time.perf_counter()
+        with paused_gc():
+            return self._reload(started)
+
+    def _reload(self, started: float) -> ScenarioUpdate:
+        raw = self._read_raw()
+        raw_cards = raw.get("cards")
+        if not isinstance(raw_cards, list):
+            raise ValueError(f"Scenario has no cards list: {self.path}")
+
+        # Validate everything first, so a bad edit changes nothing
+        staged = self.config.model_copy()
+        validator = GameConfig.__pydantic_validator__
+        sections = [key for key in SECTIONS if raw.get(key) != self._raw.get(key)]
+        for key in sections:
+            validator.validate_assignment(staged, key, raw.get(key))
+
+        old_raw: Dict[Any, Any] = {}
+        for card in self._raw.get("cards") or []:
+            if isinstance(card, dict):
+                old_raw.setdefault(card.get("id"), card)
+        old_cards: Dict[str, Card] = {}
+        for card in self.config.cards:
+            old_cards.setdefault(card.id, card)
+
+        cards: List[Card] = []
+        added: List[str] = []
+        changed: List[str] = []
+        for card_raw in raw_cards:
+            card_id = card_raw.get("id") if isinstance(card_raw, dict) else None
+            if card_id in old_cards and old_raw.get(card_id) == card_raw:
+                cards.append(old_cards[card_id])
+                continue
+            card = Card.model_validate(card_raw)
+            cards.append(card)
+            (changed if card.id in old_cards else added).append(card.id)
+        new_ids = {card.id for card in cards}
+        removed = [card_id for card_id in old_cards if card_id not in new_ids]
+
+        # Swap in: each assignment replaces a reference, so readers on other
+        # threads see either the old or the new value of a field
+        for key in sections:
+            setattr(self.config, key, getattr(staged, key))
+        self.config.cards = cards
+        self._raw = raw
+        self.reloads += 1
+        if self.game_logic is not None and self.game_logic.config is self.config:
+            self.game_logic.apply_scenario_update()
+
+        return {
+            "sections": sections,
+            "added": added,
+            "changed": changed,
+            "removed": removed,
+            "seconds": time.perf_counter() - started,
+        }
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def _read_stamp(self) -> Tuple[int, int]:
+        st = os.stat(self.path)
+        return st.st_mtime_ns, st.st_size
+
+    def _read_raw(self) -> Dict[str, Any]:
+        with open(self.path, "rb") as f:
+            raw = from_json(f.read())
+        if not isinstance(raw, dict):
+            raise ValueError(f"Scenario is not a JSON object: {self.path}")
+        return raw
@@ -5,16 +5,25 @@ from typing import Any, Dict, Optional
 
 import flet as ft
 
-
-# Schedule an async coroutine on a separate thread (for web backend compatibility)
-def _schedule(coro):
-    threading.Thread(target=lambda: asyncio.run(coro), daemon=True).start()
-
+from swipe_verse.models.config import GameConfig
 from swipe_verse.models.game_state import GameState
 from swipe_verse.services.asset_manager import AssetManager
+from swipe_verse.services.cache_manager import CacheManager
+from swipe_verse.services.config_cache import ConfigCache
 from swipe_verse.services.config_loader import ConfigLoader
 from swipe_verse.services.game_logic import GameLogic
-from swipe_verse.services.image_processor import ImageProcessor
+from swipe_verse.services.image_executor import PRIORITY_PREFETCH
+from swipe_verse.services.image_processor import CHAIN_SEPARATOR, ImageProcessor
+from swipe_verse.services.remote_config import RemoteConfigCache
+from swipe_verse.services.scenario_catalog import SCENARIOS_DIR, ScenarioCatalog
+from swipe_verse.services.scenario_watcher import ScenarioUpdate, ScenarioWatcher
+from swipe_verse.ui.components.card_display import card_image_box
+from swipe_verse.ui.components.resource_bar import FILL_FRAMES, ICON_SIZE
+
+
+# Schedule an async coroutine on a separate thread (for web backend compatibility)
+def _schedule(coro):
+    threading.Thread(target=lambda: asyncio.run(coro), daemon=True).start()
 
 
 # Note: For Flet 0.27.x compatibility
@@ -25,9 +34,14 @@ class SwipeVerseApp:
         page: ft.Page,
         config_path: Optional[str] = None,
         assets_path: Optional[str] = None,
+        offline: bool = False,
+        watch_scenario: bool = False,
     ) -> None:
         self.page = page
         self.config_path = config_path
+        # Reload edits to the scenario file into the running game
+        self.watch_scenario = watch_scenario
+        self.scenario_watcher: Optional[ScenarioWatcher] = None
 
         # Set up base paths
         package_dir = Path(__file__).parent.parent
@@ -35,12 +49,27 @@ class SwipeVerseApp:
         self.default_assets_path = package_dir / "assets" / "default"
 
         # Initialize services
-        self.config_loader = ConfigLoader(base_path=str(self.base_path))
+        self.cache_manager = CacheManager()
+        self.config_loader = ConfigLoader(
+            base_path=str(self.base_path),
+            config_cache=ConfigCache(cache_manager=self.cache_manager),
+            # Start remote scenarios from their cached copy and refresh it
+            # in the background, or use only cached copies when offline
+            remote_cache=RemoteConfigCache(
+                cache_manager=self.cache_manager,
+                mode="offline" if offline else "stale",
+            ),
+        )
+        self.scenario_catalog = ScenarioCatalog(cache_manager=self.cache_manager)
+        self.image_processor = ImageProcessor(cache_manager=self.cache_manager)
         self.asset_manager = AssetManager(
             base_path=str(self.base_path),
             default_assets_path=str(self.default_assets_path),
+            image_processor=self.image_processor,
+            cache_manager=self.cache_manager,
         )
-        self.image_processor = ImageProcessor()
+        # Keep the on-disk caches within budget, off the UI thread
+        threading.Thread(target=self.cache_manager.gc, daemon=True).start()
 
         # Game state
         self.game_state: Optional[GameState] = None
@@ -64,6 +93,13 @@ class SwipeVerseApp:
         # Set up responsive design
         self.is_mobile = self.page.width is not None and self.page.width < 600
         self.page.on_window_event = self._handle_window_event
+        # Release worker pools when the session ends
+        self.page.on_close = self._handle_close
+
+        # In web mode, small images are sent inline rather than fetched
+        # from the asset server one request at a time
+        if getattr(self.page, "web", False) is True:
+            self.asset_manager.enable_inline_images()
 
         # Add a loading indicator
         self.loading = ft.ProgressRing()
@@ -87,13 +123,24 @@ class SwipeVerseApp:
         elif e.data == "blur":
             # Could pause game, save state, etc.
             pass
+        elif e.data == "close":
+            self.close()
+
+    def _handle_close(self, e: ft.ControlEvent) -> None:
+        """Handle the end of the page session"""
+        self.close()
+
+    def close(self) -> None:
+        """Stop background work: queued image jobs are dropped and the pool shut down"""
+        self.asset_manager.executor.shutdown(wait=False)
+        if self.scenario_watcher is not None:
+            self.scenario_watcher.stop()
+            self.scenario_watcher = None
 
     async def load_config(self, config_path: Optional[str] = None) -> bool:
         """Load a game configuration"""
         if not config_path:
-            config_path = self.config_path or str(
-                Path(__file__).parent.parent / "config" / "kingdom_game.json"
-            )
+            config_path = self.config_path or str(SCENARIOS_DIR / "kingdom_game.json")
 
         self.loading.visible = True
         self.page.update()
@@ -106,6 +153,8 @@ class SwipeVerseApp:
             self.game_state = GameState.new_game(config)
             if self.game_state:  # Extra safety check
                 self.game_logic = GameLogic(self.game_state, config)
+                if self.watch_scenario:
+                    self._watch(config_path, config)
 
                 # Set current filter from game state if it exists
                 if (
@@ -130,22 +179,75 @@ class SwipeVerseApp:
             self.loading.visible = False
             self.page.update()
 
+    def _watch(self, config_path: str, config: GameConfig) -> None:
+        """Reload edits to the scenario file into the running game"""
+        if self.scenario_watcher is not None:
+            self.scenario_watcher.stop()
+            self.scenario_watcher = None
+        try:
+            self.scenario_watcher = self.config_loader.watch(
+                config_path,
+                config,
+                game_logic=self.game_logic,
+                on_reload=self._handle_scenario_reload,
+            )
+        except Exception as e:
+            print(f"Not watching scenario {config_path}: {e}")
+
+    def _handle_scenario_reload(self, update: ScenarioUpdate) -> None:
+        """Show a reloaded scenario (called on the watcher thread)"""
+        from swipe_verse.ui.game_screen import GameScreen
+
+        print(
+            f"Reloaded scenario in {update['seconds'] * 1000:.1f} ms: "
+            f"{len(update['changed'])} changed, {len(update['added'])} added, "
+            f"{len(update['removed'])} removed cards"
+        )
+        if isinstance(self.current_screen, GameScreen):
+            # Rebuild the game screen from the (kept) game state
+            _schedule(self.navigate_to("game"))
+
     async def _preload_assets(self) -> None:
         """Preload commonly used assets"""
         if not self.game_state:
             return
 
         # Preload card back with current filter if any
+        filter_type = self._filter_type()
         await self.asset_manager.get_image(
-            str(self.game_state.theme.card_back), filter_type=self.current_filter
+            str(self.game_state.theme.card_back),
+            filter_type=filter_type,
+            priority=PRIORITY_PREFETCH,
         )
 
         # Preload resource icons with current filter if any
         for icon_path in self.game_state.theme.resource_icons.values():
             await self.asset_manager.get_image(
-                str(icon_path), filter_type=self.current_filter
+                str(icon_path),
+                filter_type=filter_type,
+                priority=PRIORITY_PREFETCH,
+            )
+            # Warm the fill-level sprite the resource bar will ask for
+            await self.asset_manager.prepare_sprite_source(
+                str(icon_path), ICON_SIZE, FILL_FRAMES
             )
 
+        # ...and the art of the first card
+        image_width, image_height = card_image_box(self.page.width or 300)
+        await self.asset_manager.prepare_display_source(
+            str(self.game_state.current_card.image),
+            image_width,
+            image_height,
+            profile="card_art",
+        )
+
+    def _filter_type(self) -> Optional[str]:
+        """Resolve the selected filter or theme look to a filter chain name."""
+        if not self.game_state:
+            return self.current_filter
+        steps = self.game_state.theme.filter_chain(self.current_filter)
+        return CHAIN_SEPARATOR.join(steps) or None
+
     async def navigate_to(self, screen_name: str, **kwargs: Any) -> None:
         """Navigate to a specific screen"""
         # Import screens here to avoid circular imports
@@ -168,6 +270,8 @@ class SwipeVerseApp:
                 on_load_config=self._handle_load_config,
                 on_settings=lambda: _schedule(self.navigate_to("settings")),
                 backstory=backstory,
+                asset_manager=self.asset_manager,
+                scenario_catalog=self.scenario_catalog,
             )
         elif screen_name == "game":
             if not self.game_state:
@@ -179,9 +283,7 @@ class SwipeVerseApp:
                 self.page.snack_bar.open = True
                 self.page.update()
 
-                default_config_path = str(
-                    Path(__file__).parent.parent / "config" / "kingdom_game.json"
-                )
+                default_config_path = str(SCENARIOS_DIR / "kingdom_game.json")
                 success = await self.load_config(default_config_path)
                 if not success:
                     await self.navigate_to("title")
@@ -194,6 +296,7 @@ class SwipeVerseApp:
                     game_logic=self.game_logic,
                     on_new_game=lambda: _schedule(self.new_game()),
                     on_main_menu=lambda: _schedule(self.navigate_to("title")),
+                    asset_manager=self.asset_manager,
                 )
         elif screen_name == "settings":
             self.current_screen = SettingsScreen(
@@ -217,6 +320,8 @@ class SwipeVerseApp:
                 on_load_config=self._handle_load_config,
                 on_settings=lambda: self.page.run_async(self.navigate_to("settings")),
                 backstory=backstory,
+                asset_manager=self.asset_manager,
+                scenario_catalog=self.scenario_catalog,
             )
 
         # Render the new screen
@@ -255,6 +360,8 @@ class SwipeVerseApp:
             )
             if self.game_state:  # Safety check
                 self.game_logic = GameLogic(self.game_state, config)
+                if self.scenario_watcher is not None:
+                    self.scenario_watcher.game_logic = self.game_logic
                 await self.navigate_to("game")
 
     def _handle_save_settings(self, settings: Dict[str, Any]) -> None:
@@ -357,6 +464,7 @@ class SwipeVerseApp:
             "difficulty": self.game_state.difficulty,
             "filter": self.current_filter or "none",
             "game": current_game,
+            "looks": list(self.game_state.theme.looks()),
         }
 
     def build(self) -> ft.Container:
@@ -387,6 +495,13 @@ class SwipeVerseApp:
         return container._build_add_commands(indent, index=index, added_controls=added_controls)
 
 
-def main(page: ft.Page) -> None:
-    app = SwipeVerseApp(page)
+def main(
+    page: ft.Page,
+    config_path: Optional[str] = None,
+    offline: bool = False,
+    watch_scenario: bool = False,
+) -> None:
+    app = SwipeVerseApp(
+        page, config_path=config_path, offline=offline, watch_scenario=watch_scenario
+    )
     page.add(app.build())
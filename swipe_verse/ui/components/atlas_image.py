@@ -0,0 +1,50 @@
+from typing import Any, Dict, Tuple
+
+import flet as ft
+
+from swipe_verse.services.atlas import AtlasRegion
+
+
+class AtlasImage(ft.Container):
+    """
+    Shows one region of an atlas page, scaled to fit a width x height box.
+
+    The page image is scaled so the region fits the box (like
+    ft.ImageFit.CONTAIN), offset so the region sits at the origin, and
+    clipped by a Stack the size of the region.
+    """
+
+    def __init__(
+        self,
+        page_source: Dict[str, str],
+        page_size: Tuple[int, int],
+        region: AtlasRegion,
+        width: float,
+        height: float,
+        **kwargs: Any,
+    ) -> None:
+        self.region = region
+        scale = min(width / region["w"], height / region["h"])
+
+        self.page_image = ft.Image(
+            **page_source,
+            width=page_size[0] * scale,
+            height=page_size[1] * scale,
+            fit=ft.ImageFit.FILL,
+            left=-region["x"] * scale,
+            top=-region["y"] * scale,
+        )
+        clip = ft.Stack(
+            controls=[self.page_image],
+            width=region["w"] * scale,
+            height=region["h"] * scale,
+            clip_behavior=ft.ClipBehavior.HARD_EDGE,
+        )
+
+        super().__init__(
+            content=clip,
+            width=width,
+            height=height,
+            alignment=ft.alignment.center,
+            **kwargs,
+        )
@@ -1,8 +1,20 @@
-from typing import Any, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple
 
 import flet as ft
 
 from swipe_verse.models.card import Card
+from swipe_verse.ui.components.display_image import set_image_source, show_display_image
+from swipe_verse.ui.render_scheduler import RenderScheduler
+
+if TYPE_CHECKING:
+    from swipe_verse.services.asset_manager import AssetManager
+
+
+def card_image_box(page_width: float) -> Tuple[float, float]:
+    """Width and height of the card art box for a given page width."""
+    container_width = min(350, page_width * 0.8)
+    image_width = container_width * 0.85  # Leave space for borders
+    return image_width, image_width * 0.8  # 250x200 aspect ratio for artwork
 
 
 # Note: For Flet 0.27.x compatibility, we extend GestureDetector instead of UserControl
@@ -12,9 +24,13 @@ class CardDisplay(ft.GestureDetector):
         card: Card,
         on_swipe_left: Optional[Callable[[ft.DragEndEvent], None]] = None,
         on_swipe_right: Optional[Callable[[ft.DragEndEvent], None]] = None,
+        asset_manager: Optional["AssetManager"] = None,
         **kwargs: Any,
     ) -> None:
         self.card = card
+        # Used to request card art sized for the image box
+        self.asset_manager = asset_manager
+        self.image_box: Tuple[float, float] = (0, 0)
         self.on_swipe_left = on_swipe_left
         self.on_swipe_right = on_swipe_right
         self.swipe_threshold = 50  # Minimum distance to count as a swipe
@@ -26,6 +42,8 @@ class CardDisplay(ft.GestureDetector):
         self.choice_overlay_stack: Optional[ft.Stack] = None  # Renamed for clarity
         self.left_choice_text: Optional[ft.Text] = None  # Text for left choice
         self.right_choice_text: Optional[ft.Text] = None # Text for right choice
+        # Drag updates are sent at most once per frame
+        self.render = RenderScheduler(lambda: self.update())
 
         super().__init__(
             on_pan_start=self._on_pan_start,
@@ -44,8 +62,8 @@ class CardDisplay(ft.GestureDetector):
         container_height = container_width * 1.5  # 3:2 aspect ratio
 
         # Calculate inner content dimensions
-        image_width = container_width * 0.85  # Leave space for borders
-        image_height = image_width * 0.8  # 250x200 aspect ratio for artwork
+        image_width, image_height = card_image_box(page_width)
+        self.image_box = (image_width, image_height)
         title_height = container_height * 0.1
         text_height = container_height * 0.25
 
@@ -79,6 +97,7 @@ class CardDisplay(ft.GestureDetector):
             fit=ft.ImageFit.CONTAIN,
             error_content=ft.Text("Image?"), # Simpler error
         )
+        self._show_art(self.card_image, image_path)
 
         # Card text
         card_text = ft.Container(
@@ -190,6 +209,16 @@ class CardDisplay(ft.GestureDetector):
             # clip_behavior=ft.ClipBehavior.NONE, # Removing clip behavior, let Stack manage children
         )
 
+    def _show_art(self, image: ft.Image, image_path: str) -> None:
+        """Show card art sized to the image box, once it has been rendered."""
+        if self.asset_manager is None or not all(self.image_box):
+            set_image_source(image, {"src": image_path})
+            return
+        width, height = self.image_box
+        show_display_image(
+            image, self.asset_manager, image_path, width, height, profile="card_art"
+        )
+
     def _on_pan_start(self, e: ft.DragStartEvent) -> None:
         self.is_swiping = True
         self.start_x = e.local_x
@@ -230,7 +259,7 @@ class CardDisplay(ft.GestureDetector):
             self.right_choice_text.visible = False
             self.right_choice_text.opacity = 0
 
-        self.update()
+        self.render.request()
 
     def _on_pan_end(self, e: ft.DragEndEvent) -> None:
         if not self.is_swiping or not self.card_container or not self.left_choice_text or not self.right_choice_text:
@@ -249,7 +278,7 @@ class CardDisplay(ft.GestureDetector):
         self.right_choice_text.visible = False
         self.right_choice_text.opacity = 0
 
-        self.update() # Update UI immediately
+        self.render.flush() # Update UI immediately, replacing any pending frame
 
         # Trigger swipe action if threshold met
         if abs(delta_x) > self.swipe_threshold:
@@ -279,7 +308,7 @@ class CardDisplay(ft.GestureDetector):
                 image_path = getattr(card, 'image', None)
                 if not isinstance(image_path, str) or not image_path:
                     image_path = "assets/default/card_fronts/event.png"
-                image_control.src = image_path
+                self._show_art(image_control, image_path)
 
             if isinstance(text_container, ft.Container) and isinstance(text_container.content, ft.Text):
                 text_container.content.value = card.text
@@ -298,4 +327,4 @@ class CardDisplay(ft.GestureDetector):
         self.right_choice_text.visible = False
         self.right_choice_text.opacity = 0
 
-        self.update()
+        self.render.flush()
@@ -0,0 +1,66 @@
+import threading
+import weakref
+from typing import TYPE_CHECKING, Dict, Optional
+
+import flet as ft
+
+if TYPE_CHECKING:
+    from swipe_verse.services.asset_manager import AssetManager
+
+# Latest display request per image, so a late swap for an earlier image path
+# (e.g. the previous card) is ignored
+_requests: "weakref.WeakKeyDictionary[ft.Image, object]" = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def set_image_source(image: ft.Image, source: Dict[str, str]) -> None:
+    """Apply ft.Image source arguments ({"src": ...} or {"src_base64": ...})."""
+    image.src = source.get("src")
+    image.src_base64 = source.get("src_base64")
+
+
+def show_display_image(
+    image: ft.Image,
+    asset_manager: "AssetManager",
+    image_path: str,
+    width: float,
+    height: float,
+    profile: Optional[str] = None,
+) -> None:
+    """
+    Point an image at a display-sized copy of image_path without blocking.
+
+    If the copy has not been rendered yet, the image shows image_path itself
+    and the copy is swapped in (and the image updated, if it is on a page)
+    once the image executor has made it. A later call for the same image
+    supersedes a swap still pending from an earlier one.
+
+    Args:
+        image: The control to update
+        asset_manager: Provides the display-sized copies
+        image_path: Path to the image as referenced by the scenario
+        width: Display box width in logical pixels
+        height: Display box height in logical pixels
+        profile: Encoding profile for the use, e.g. "card_art" or "icon"
+    """
+    request = object()
+    state = {"swapped": False}
+    with _lock:
+        _requests[image] = request
+
+    def ready(source: Dict[str, str]) -> None:
+        with _lock:
+            if _requests.get(image) is not request:
+                return
+            state["swapped"] = True
+            set_image_source(image, source)
+        if image.page is not None:
+            image.update()
+
+    source = asset_manager.display_source(
+        image_path, width, height, profile, on_ready=ready
+    )
+    with _lock:
+        # The swap may already have happened on a worker thread
+        if not state["swapped"]:
+            set_image_source(image, source)
@@ -1,12 +1,63 @@
 import asyncio
-from pathlib import Path
-from typing import Any, Callable, Coroutine, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import flet as ft
 from pydantic import HttpUrl
 
-from swipe_verse.models.config import GameConfig
-from swipe_verse.services.config_loader import ConfigLoader
+from swipe_verse.models.config import GameConfig, ScenarioManifest
+from swipe_verse.services.atlas import Atlas
+from swipe_verse.services.scenario_catalog import ScenarioCatalog
+from swipe_verse.ui.components.atlas_image import AtlasImage
+from swipe_verse.ui.components.display_image import show_display_image
+
+if TYPE_CHECKING:
+    from swipe_verse.services.asset_manager import AssetManager
+
+# Resource icons previewed on each game card, and their size
+PREVIEW_ICONS = 4
+PREVIEW_ICON_SIZE = 30
+
+
+def card_atlas_images(
+    config: Union[GameConfig, ScenarioManifest],
+    prefix: str = "",
+    width: float = 280,
+    height: float = 380,
+) -> Dict[str, Tuple[str, Tuple[float, float]]]:
+    """
+    List the images a GameCard shows, for packing into an atlas.
+
+    Args:
+        config: The game's configuration or manifest
+        prefix: Key prefix, so several games can share one atlas
+        width: Card width, as passed to GameCard
+        height: Card height, as passed to GameCard
+
+    Returns:
+        Dict: (image path, display box) by atlas key
+    """
+    images = {
+        f"{prefix}card_back": (str(config.theme.card_back), (width * 0.8, height * 0.6))
+    }
+    if config.theme and config.theme.resource_icons:
+        for resource_name, icon_path in list(config.theme.resource_icons.items())[
+            :PREVIEW_ICONS
+        ]:
+            images[f"{prefix}icon:{resource_name}"] = (
+                str(icon_path),
+                (PREVIEW_ICON_SIZE, PREVIEW_ICON_SIZE),
+            )
+    return images
 
 
 class GameCard(ft.Container):
@@ -15,52 +66,105 @@ class GameCard(ft.Container):
     def __init__(
         self,
         config_path: str,
-        config: GameConfig,
+        config: Union[GameConfig, ScenarioManifest],
         card_back_path: Union[str, HttpUrl],
         on_select: Callable[[str], Any],
         width: float = 280,
         height: float = 380,
+        asset_manager: Optional["AssetManager"] = None,
+        atlas: Optional[Atlas] = None,
+        atlas_prefix: str = "",
     ):
         self.config_path = config_path
         self.config = config
         # Ensure card_back_path is always a string
         self.card_back_path: str = str(card_back_path)
         self.on_select = on_select
+        self.asset_manager = asset_manager
+        self.atlas_prefix = atlas_prefix
+        # Plain images that an atlas region may replace: (key, parent
+        # controls, index, box width, box height, extra image arguments)
+        self._atlas_slots: List[
+            Tuple[str, List[ft.Control], int, float, float, Dict[str, Any]]
+        ] = []
+
+        def image_control(
+            key: str,
+            path: str,
+            box_width: float,
+            box_height: float,
+            profile: str,
+            **kwargs: Any,
+        ) -> ft.Control:
+            # Prefer a region of the shared atlas over a file per image
+            if atlas is not None:
+                atlas_image = self._atlas_image(
+                    atlas, key, box_width, box_height, **kwargs
+                )
+                if atlas_image is not None:
+                    return atlas_image
+            image = ft.Image(
+                src=path,
+                width=box_width,
+                height=box_height,
+                fit=ft.ImageFit.CONTAIN,
+                **kwargs,
+            )
+            if asset_manager is not None:
+                show_display_image(
+                    image, asset_manager, path, box_width, box_height, profile
+                )
+            return image
 
         # Create card content
-        card_image = ft.Image(
-            src=self.card_back_path,
-            width=width * 0.8,
-            height=height * 0.6,
-            fit=ft.ImageFit.CONTAIN,
-            border_radius=ft.border_radius.all(10),
+        card_image_args: Dict[str, Any] = {"border_radius": ft.border_radius.all(10)}
+        card_image = image_control(
+            "card_back",
+            self.card_back_path,
+            width * 0.8,
+            height * 0.6,
+            "card_art",
+            **card_image_args,
         )
 
         # Get resource icons for preview
         resource_previews = []
         if config.theme and config.theme.resource_icons:
             for resource_name, icon_path in list(config.theme.resource_icons.items())[
-                :4
-            ]:  # Limit to 4 icons
+                :PREVIEW_ICONS
+            ]:
+                icon_column = ft.Column(
+                    [
+                        image_control(
+                            f"icon:{resource_name}",
+                            str(icon_path),
+                            PREVIEW_ICON_SIZE,
+                            PREVIEW_ICON_SIZE,
+                            "icon",
+                        ),
+                        ft.Text(
+                            resource_name.capitalize(),
+                            size=10,
+                            text_align=ft.TextAlign.CENTER,
+                        ),
+                    ],
+                    horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                    spacing=2,
+                )
+                if isinstance(icon_column.controls[0], ft.Image):
+                    self._atlas_slots.append(
+                        (
+                            f"icon:{resource_name}",
+                            icon_column.controls,
+                            0,
+                            PREVIEW_ICON_SIZE,
+                            PREVIEW_ICON_SIZE,
+                            {},
+                        )
+                    )
                 resource_previews.append(
                     ft.Container(
-                        content=ft.Column(
-                            [
-                                ft.Image(
-                                    src=str(icon_path),
-                                    width=30,
-                                    height=30,
-                                    fit=ft.ImageFit.CONTAIN,
-                                ),
-                                ft.Text(
-                                    resource_name.capitalize(),
-                                    size=10,
-                                    text_align=ft.TextAlign.CENTER,
-                                ),
-                            ],
-                            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                            spacing=2,
-                        ),
+                        content=icon_column,
                         width=60,
                         height=60,
                         padding=2,
@@ -133,6 +237,17 @@ class GameCard(ft.Container):
             alignment=ft.MainAxisAlignment.START,
             spacing=5,
         )
+        if isinstance(card_image, ft.Image):
+            self._atlas_slots.append(
+                (
+                    "card_back",
+                    card_content.controls,
+                    1,
+                    width * 0.8,
+                    height * 0.6,
+                    card_image_args,
+                )
+            )
 
         # Main container styling
         super().__init__(
@@ -152,6 +267,53 @@ class GameCard(ft.Container):
             ),
         )
 
+    def use_atlas(self, atlas: Atlas) -> bool:
+        """
+        Swap the card's plain images for regions of an atlas built later.
+
+        Args:
+            atlas: The carousel's shared atlas
+
+        Returns:
+            bool: True if any image was swapped
+        """
+        swapped = False
+        remaining = []
+        for slot in self._atlas_slots:
+            key, controls, index, box_width, box_height, kwargs = slot
+            atlas_image = self._atlas_image(atlas, key, box_width, box_height, **kwargs)
+            if atlas_image is None:
+                remaining.append(slot)
+                continue
+            controls[index] = atlas_image
+            swapped = True
+        self._atlas_slots = remaining
+        return swapped
+
+    def _atlas_image(
+        self,
+        atlas: Atlas,
+        key: str,
+        box_width: float,
+        box_height: float,
+        **kwargs: Any,
+    ) -> Optional[AtlasImage]:
+        """Return an atlas region as a control, or None if it has none."""
+        region = atlas.region(self.atlas_prefix + key)
+        if region is None or self.asset_manager is None:
+            return None
+        page_source = self.asset_manager.atlas_page_source(atlas, region["page"])
+        if page_source is None:
+            return None
+        return AtlasImage(
+            page_source,
+            atlas.page_sizes[region["page"]],
+            region,
+            width=box_width,
+            height=box_height,
+            **kwargs,
+        )
+
 
 class GameSelector(ft.Row):
     """Horizontal carousel of game options."""
@@ -162,11 +324,16 @@ class GameSelector(ft.Row):
             Callable[[str], None], Callable[[str], Coroutine[Any, Any, None]]
         ],
         width: float = 800,
+        asset_manager: Optional["AssetManager"] = None,
+        catalog: Optional[ScenarioCatalog] = None,
     ):
         # Store callback; width will be passed to parent
         self.on_select_game = on_select_game
+        self.asset_manager = asset_manager
         self.game_cards: List[GameCard] = []
-        self.config_loader = ConfigLoader()
+        # Lists scenarios from cached headers; the chosen scenario's full
+        # config is loaded by the app when its card is selected
+        self.catalog = catalog or ScenarioCatalog()
 
         # Create scroll buttons
         self.left_button = ft.IconButton(
@@ -209,31 +376,28 @@ class GameSelector(ft.Row):
 
     async def load_games(self, page: Optional[ft.Page] = None) -> None:
         """Load and display available games."""
-        # Get the config directory
-        config_dir = Path(__file__).parent.parent.parent / "config"
-
-        # Find all game JSON files
-        game_files = list(config_dir.glob("*_game.json"))
+        # Read the scenario headers (concurrently, cached per file)
+        manifests = await self.catalog.scan()
 
         # Clear existing cards
         if isinstance(self.scroll_container.content, ft.Row):
             self.scroll_container.content.controls.clear()
             self.game_cards.clear()
 
-        # Load configs and create cards
-        for game_file in game_files:
+        # Create cards with their own images, so the carousel shows at once
+        for index, manifest in enumerate(manifests):
             try:
-                config = await self.config_loader.load_config(str(game_file))
-
                 # Get the card back path (ensure it's a string)
-                card_back_path = str(config.theme.card_back)
+                card_back_path = str(manifest.theme.card_back)
 
                 # Create a game card
                 game_card = GameCard(
-                    config_path=str(game_file),
-                    config=config,
+                    config_path=manifest.path,
+                    config=manifest,
                     card_back_path=card_back_path,
                     on_select=self.on_select_game,
+                    asset_manager=self.asset_manager,
+                    atlas_prefix=f"{index}/",
                 )
 
                 # Add to the container
@@ -241,7 +405,7 @@ class GameSelector(ft.Row):
                     self.scroll_container.content.controls.append(game_card)
                     self.game_cards.append(game_card)
             except Exception as e:
-                print(f"Error loading game {game_file}: {e}")
+                print(f"Error loading game {manifest.path}: {e}")
 
         # Add Multi-Verse Portal placeholder card
         self._add_multiverse_card()
@@ -253,6 +417,23 @@ class GameSelector(ft.Row):
         if page:
             page.update()
 
+        # Then pack every card's images into one atlas, so the carousel holds
+        # a page or two instead of a file per card back and icon
+        if self.asset_manager is None or not manifests:
+            return
+        images: Dict[str, Tuple[str, Tuple[float, float]]] = {}
+        for index, manifest in enumerate(manifests):
+            images.update(card_atlas_images(manifest, prefix=f"{index}/"))
+        atlas = await self.asset_manager.prepare_atlas(images)
+        if atlas is None:
+            return
+        swapped = False
+        for card in self.game_cards:
+            if isinstance(card, GameCard) and card.use_atlas(atlas):
+                swapped = True
+        if swapped and page:
+            page.update()
+
     def _scroll_left(self, _event: Any) -> None:
         """Scroll the carousel left."""
         if isinstance(self.scroll_container.content, ft.Row):
@@ -1,7 +1,18 @@
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import flet as ft
 
+from swipe_verse.ui.components.display_image import show_display_image
+
+if TYPE_CHECKING:
+    from swipe_verse.services.asset_manager import AssetManager
+
+# Width and height of each resource icon, in logical pixels
+ICON_SIZE = 50
+
+# Fill levels in a pre-tinted icon sprite (0%, 5%, ... 100%)
+FILL_FRAMES = 21
+
 
 # Note: For Flet 0.27.x compatibility
 # We're using a standard class instead of UserControl which is only in newer Flet versions
@@ -16,12 +27,16 @@ class ResourceBar:
         resources: Dict[str, int],
         resource_icons: Dict[str, str],
         max_resources: Dict[str, int], # Add max_resources parameter
+        asset_manager: Optional["AssetManager"] = None,
         **kwargs: Any,
     ) -> None:
         self.resources = resources
         self.resource_icons = resource_icons
         self.max_resources = max_resources
+        self.asset_manager = asset_manager
         self.resource_controls: Dict[str, ft.Tooltip] = {}
+        # Sprite images by resource, when icons are rendered from a sprite
+        self.sprites: Dict[str, ft.Image] = {}
 
     def build(self) -> ft.Row:
         """Build the resource bar with all the resource indicators"""
@@ -44,24 +59,42 @@ class ResourceBar:
         """
         icon_path = self.resource_icons[resource_id]
 
+        # Prefer a single pre-tinted sprite over a tinted overlay image; a
+        # sprite that is still being rendered replaces the overlay when ready
+        if self.asset_manager is not None:
+            sprite_source = self.asset_manager.sprite_source(
+                icon_path,
+                ICON_SIZE,
+                FILL_FRAMES,
+                on_ready=lambda source: self._swap_in_sprite(resource_id, source),
+            )
+            if sprite_source is not None:
+                return self._create_sprite_icon(resource_id, value, sprite_source)
+
         # The filled (colored) version
         filled_icon = ft.Image(
-            src=icon_path, width=50, height=50, fit=ft.ImageFit.CONTAIN
+            src=icon_path, width=ICON_SIZE, height=ICON_SIZE, fit=ft.ImageFit.CONTAIN
+        )
+        tinted_icon = ft.Image(
+            src=icon_path,
+            width=ICON_SIZE,
+            height=ICON_SIZE,
+            color=ft.colors.BLACK, # Use black tint
+            color_blend_mode=ft.BlendMode.DARKEN, # Blend mode to apply tint
+            opacity=0.6, # Adjust opacity for tint effect
+            fit=ft.ImageFit.CONTAIN,
         )
+        if self.asset_manager is not None:
+            for image in (filled_icon, tinted_icon):
+                show_display_image(
+                    image, self.asset_manager, icon_path, ICON_SIZE, ICON_SIZE, "icon"
+                )
 
         # The dark-tint depletion overlay - positioned at the top
         # and clipped based on the depleted amount
-        depletion_height = (self.max_resources[resource_id] - value) / self.max_resources[resource_id] * 50
+        depletion_height = (self.max_resources[resource_id] - value) / self.max_resources[resource_id] * ICON_SIZE
         depletion_overlay = ft.Container(
-            content=ft.Image(
-                src=icon_path,
-                width=50,
-                height=50,
-                color=ft.colors.BLACK, # Use black tint
-                color_blend_mode=ft.BlendMode.DARKEN, # Blend mode to apply tint
-                opacity=0.6, # Adjust opacity for tint effect
-                fit=ft.ImageFit.CONTAIN,
-            ),
+            content=tinted_icon,
             clip_behavior=ft.ClipBehavior.HARD_EDGE,
             # Clip from the bottom based on the depleted amount
             height=depletion_height,
@@ -70,12 +103,64 @@ class ResourceBar:
 
         # Stack the filled version and the depletion overlay
         icon_stack = ft.Stack(
-            controls=[filled_icon, depletion_overlay], width=50, height=50
+            controls=[filled_icon, depletion_overlay], width=ICON_SIZE, height=ICON_SIZE
         )
 
         # Add a tooltip showing the resource name
         return ft.Tooltip(message=resource_id.capitalize(), content=icon_stack)
 
+    def _create_sprite_icon(
+        self, resource_id: str, value: int, source: Dict[str, str]
+    ) -> ft.Tooltip:
+        """
+        Create a resource indicator from a vertical sprite of fill levels.
+
+        The stack clips to one frame and the level is chosen by the sprite's
+        top offset, so a change in value only updates one property.
+        """
+        return ft.Tooltip(
+            message=resource_id.capitalize(),
+            content=self._sprite_stack(resource_id, value, source),
+        )
+
+    def _swap_in_sprite(self, resource_id: str, source: Dict[str, str]) -> None:
+        """Replace an overlay-style indicator with its sprite once rendered."""
+        tooltip = self.resource_controls.get(resource_id)
+        if tooltip is None or resource_id in self.sprites:
+            # Not built yet (the next build finds the sprite ready) or already a sprite
+            return
+        tooltip.content = self._sprite_stack(
+            resource_id, self.resources[resource_id], source
+        )
+        if tooltip.page is not None:
+            tooltip.update()
+
+    def _sprite_stack(
+        self, resource_id: str, value: int, source: Dict[str, str]
+    ) -> ft.Stack:
+        """Clip a vertical sprite of fill levels to the frame for value."""
+        sprite = ft.Image(
+            **source,
+            width=ICON_SIZE,
+            height=ICON_SIZE * FILL_FRAMES,
+            fit=ft.ImageFit.FILL,
+            left=0,
+            top=self._frame_top(resource_id, value),
+        )
+        self.sprites[resource_id] = sprite
+
+        return ft.Stack(
+            controls=[sprite],
+            width=ICON_SIZE,
+            height=ICON_SIZE,
+            clip_behavior=ft.ClipBehavior.HARD_EDGE,
+        )
+
+    def _frame_top(self, resource_id: str, value: int) -> float:
+        """Sprite offset showing the frame nearest to the resource's fill level."""
+        level = max(0.0, min(1.0, value / self.max_resources[resource_id]))
+        return -round(level * (FILL_FRAMES - 1)) * ICON_SIZE
+
     def update_resource(self, resource_id: str, new_value: int) -> None:
         """Update a specific resource with a new value"""
         if resource_id not in self.resource_controls:
@@ -84,12 +169,18 @@ class ResourceBar:
         # Update the stored value
         self.resources[resource_id] = new_value
 
+        sprite = self.sprites.get(resource_id)
+        if sprite is not None:
+            sprite.top = self._frame_top(resource_id, new_value)
+            sprite.update()
+            return
+
         # Get the stack
         stack = self.resource_controls[resource_id].content
 
         # Update the depletion overlay height
         depletion_container = stack.controls[1] # Assuming depletion_overlay is still the second control in the stack
-        depletion_container.height = (self.max_resources[resource_id] - new_value) / self.max_resources[resource_id] * 50
+        depletion_container.height = (self.max_resources[resource_id] - new_value) / self.max_resources[resource_id] * ICON_SIZE
 
         # Update the control
         stack.update()
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 import flet as ft
 
@@ -8,6 +8,9 @@ from swipe_verse.ui.achievements_screen import AchievementsScreen
 from swipe_verse.ui.components.card_display import CardDisplay
 from swipe_verse.ui.components.resource_bar import ResourceBar
 
+if TYPE_CHECKING:
+    from swipe_verse.services.asset_manager import AssetManager
+
 
 # Note: For Flet 0.27.x compatibility
 # We're using a standard class instead of UserControl which is only in newer Flet versions
@@ -18,11 +21,13 @@ class GameScreen:
         game_logic: GameLogic,
         on_new_game: Optional[Callable[[], Any]] = None,
         on_main_menu: Optional[Callable[[], Any]] = None,
+        asset_manager: Optional["AssetManager"] = None,
     ) -> None:
         self.game_state = game_state
         self.game_logic = game_logic
         self.on_new_game = on_new_game
         self.on_main_menu = on_main_menu
+        self.asset_manager = asset_manager
         self.card_display: Optional[CardDisplay] = None
         self.resource_bar: Optional[ResourceBar] = None
         self.page: Optional[ft.Page] = None
@@ -40,6 +45,7 @@ class GameScreen:
             resources=self.game_state.resources,
             resource_icons=resource_icons_str,
             max_resources=self.game_state.settings.initial_resources,
+            asset_manager=self.asset_manager,
         )
 
         # Card Display (handles title, text, image, and swipe overlays)
@@ -68,6 +74,7 @@ class GameScreen:
             current_card,
             on_swipe_left=self._handle_swipe_left,
             on_swipe_right=self._handle_swipe_right,
+            asset_manager=self.asset_manager,
         )
 
         # Game Stats Section
@@ -0,0 +1,168 @@
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from functools import partial
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+# Default time between UI updates while dragging (30 frames per second)
+FRAME_BUDGET = 1 / 30
+
+
+class _FrameTimer:
+    """
+    One daemon thread that runs the end-of-frame flushes of every scheduler.
+
+    A threading.Timer per coalesced frame would start a thread 30 times a
+    second per dragged control; this thread is started once and sleeps on a
+    condition until the earliest scheduled call is due.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._heap: List[Tuple[float, int, Callable[[], None]]] = []
+        self._seq = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> None:
+        """Run callback on the timer thread after delay seconds."""
+        with self._cond:
+            due = time.monotonic() + delay
+            heapq.heappush(self._heap, (due, next(self._seq), callback))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="render-frame-timer", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                remaining = self._heap[0][0] - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                _, _, callback = heapq.heappop(self._heap)
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error in scheduled render: {e}")
+
+
+_frame_timer = _FrameTimer()
+
+
+class RenderScheduler:
+    """
+    Coalesces UI updates to at most one per frame.
+
+    Drag handlers fire far more often than a frame, and each update() sends
+    a diff of the changed controls to the client; over the web backend that
+    floods the websocket. Handlers change offset, rotation and opacity as
+    often as they like and call request(); the first request in a frame is
+    flushed at once and later ones are folded into a single flush at the
+    end of the frame, which sends the latest values. flush() sends the
+    final state (e.g. when a swipe ends) immediately.
+    """
+
+    def __init__(
+        self,
+        update: Callable[[], None],
+        frame_budget: float = FRAME_BUDGET,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            update: Sends the pending changes, e.g. a control's update
+            frame_budget: Minimum seconds between flushes
+            clock: Monotonic time source (for tests)
+        """
+        self._update = update
+        self.frame_budget = frame_budget
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Held while deciding on and sending a flush, so a scheduled flush
+        # never sends after (or alongside) a direct one that replaced it
+        self._send_lock = threading.RLock()
+        # Token of the scheduled flush, or None; a timer callback whose
+        # token is no longer current has been replaced or cancelled
+        self._pending: Optional[int] = None
+        self._tokens = itertools.count()
+        self._last_flush = float("-inf")
+        # Flush times within the last second, for messages_per_second
+        self._recent: Deque[float] = deque()
+        self.requests = 0
+        self.flushes = 0
+        # Requests folded into an already scheduled flush
+        self.coalesced = 0
+
+    def request(self) -> None:
+        """Ask for the current state to be sent within one frame."""
+        with self._lock:
+            self.requests += 1
+            if self._pending is not None:
+                # A flush is already scheduled and will send these changes
+                self.coalesced += 1
+                return
+            wait = self._last_flush + self.frame_budget - self._clock()
+            if wait > 0:
+                token = next(self._tokens)
+                self._pending = token
+                _frame_timer.call_later(wait, partial(self._flush_pending, token))
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        """Send the current state now, replacing any scheduled flush."""
+        with self._send_lock:
+            with self._lock:
+                self._record_flush()
+            self._update()
+
+    def cancel(self) -> None:
+        """Drop a scheduled flush (e.g. when the control is removed)."""
+        with self._lock:
+            self._pending = None
+
+    def messages_per_second(self) -> int:
+        """Return the number of flushes during the last second."""
+        with self._lock:
+            self._trim(self._clock())
+            return len(self._recent)
+
+    def stats(self) -> Dict[str, float]:
+        """Return request and flush counts and the current message rate."""
+        rate = self.messages_per_second()
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "flushes": self.flushes,
+                "coalesced": self.coalesced,
+                "messages_per_second": rate,
+            }
+
+    def _flush_pending(self, token: int) -> None:
+        with self._send_lock:
+            with self._lock:
+                if self._pending != token:
+                    return
+                self._record_flush()
+            self._update()
+
+    def _record_flush(self) -> None:
+        # Caller holds _lock; clears the scheduled flush in the same step
+        self._pending = None
+        now = self._clock()
+        self._last_flush = now
+        self.flushes += 1
+        self._recent.append(now)
+        self._trim(now)
+
+    def _trim(self, now: float) -> None:
+        while self._recent and self._recent[0] <= now - 1.0:
+            self._recent.popleft()
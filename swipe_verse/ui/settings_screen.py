@@ -68,6 +68,11 @@ class SettingsScreen:
                 ft.dropdown.Option("posterize", "Posterize"),
                 ft.dropdown.Option("blur", "Blur"),
                 ft.dropdown.Option("grayscale", "Grayscale"),
+            ]
+            # Named filter chains defined by the current theme
+            + [
+                ft.dropdown.Option(look, look.replace("_", " ").title())
+                for look in self.settings.get("looks", [])
             ],
             value=self.settings.get("filter", "none"),
         )
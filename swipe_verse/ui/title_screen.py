@@ -1,9 +1,13 @@
-from typing import Any, Callable, Coroutine, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Optional, Union
 
 import flet as ft
 
 from swipe_verse.ui.components.game_selector import GameSelector
 
+if TYPE_CHECKING:
+    from swipe_verse.services.asset_manager import AssetManager
+    from swipe_verse.services.scenario_catalog import ScenarioCatalog
+
 
 # Note: For Flet 0.27.x compatibility
 # We're using a standard class instead of UserControl which is only in newer Flet versions
@@ -16,11 +20,15 @@ class TitleScreen:
         ],
         on_settings: Callable[[], Any],
         backstory: Optional[str] = None,
+        asset_manager: Optional["AssetManager"] = None,
+        scenario_catalog: Optional["ScenarioCatalog"] = None,
     ) -> None:
         self.on_start_game = on_start_game
         self.on_load_config = on_load_config
         self.on_settings = on_settings
         self.backstory = backstory
+        self.asset_manager = asset_manager
+        self.scenario_catalog = scenario_catalog
         self.page: Optional[ft.Page] = None
         self.game_selector: Optional[GameSelector] = None
 
@@ -112,6 +120,8 @@ class TitleScreen:
         self.game_selector = GameSelector(
             on_select_game=self.on_load_config,
             width=page_width - (padding_value * 2),
+            asset_manager=self.asset_manager,
+            catalog=self.scenario_catalog,
         )
 
         # Layout for mobile or desktop
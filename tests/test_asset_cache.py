@@ -0,0 +1,159 @@
+import base64
+import os
+
+import pytest
+
+from swipe_verse.services.asset_cache import AssetCache, InlineImageStore, file_stamp
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    path = tmp_path / "icon.png"
+    path.write_bytes(b"original")
+    return path
+
+
+def test_get_miss_and_hit(source_file):
+    # Arrange
+    cache = AssetCache(capacity=4)
+
+    # Act
+    miss = cache.get("icon")
+    cache.put("icon", str(source_file), sources=[source_file])
+    hit = cache.get("icon")
+
+    # Assert
+    assert miss is None
+    assert hit == str(source_file)
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_eviction_order():
+    # Arrange
+    cache = AssetCache(capacity=2)
+    cache.put("a", "a.png")
+    cache.put("b", "b.png")
+
+    # Act - touch "a" so "b" becomes least recently used
+    cache.get("a")
+    cache.put("c", "c.png")
+
+    # Assert
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.stats()["evictions"] == 1
+    assert len(cache) == 2
+
+
+def test_invalidated_when_source_changes(source_file):
+    # Arrange
+    cache = AssetCache()
+    cache.put("icon", str(source_file), sources=[source_file])
+
+    # Act - rewrite the file with a different size and mtime
+    source_file.write_bytes(b"changed contents")
+    stat = source_file.stat()
+    os.utime(source_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    # Assert
+    assert cache.get("icon") is None
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_invalidated_when_missing_source_appears(tmp_path):
+    # Arrange
+    missing = tmp_path / "later.png"
+    cache = AssetCache()
+    cache.put("later", "fallback.png", sources=[missing])
+    assert cache.get("later") == "fallback.png"
+
+    # Act
+    missing.write_bytes(b"now here")
+
+    # Assert
+    assert cache.get("later") is None
+
+
+def test_failure_entries_expire():
+    # Arrange
+    clock = FakeClock()
+    cache = AssetCache(failure_ttl=10.0, clock=clock)
+    cache.put_failure("broken", "card_back.png")
+
+    # Act & Assert
+    clock.now = 9.0
+    assert cache.get("broken") == "card_back.png"
+    clock.now = 10.0
+    assert cache.get("broken") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_file_stamp_missing(tmp_path):
+    assert file_stamp(tmp_path / "nope.png") is None
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        AssetCache(capacity=0)
+
+
+def test_inline_store_encodes_small_files(source_file):
+    """Test that small files are returned as base64 and then served from memory"""
+    store = InlineImageStore()
+
+    first = store.get(source_file)
+    second = store.get(source_file)
+
+    assert base64.b64decode(first) == b"original"
+    assert second == first
+    assert store.stats()["hits"] == 1
+
+
+def test_inline_store_skips_large_and_missing_files(source_file, tmp_path):
+    """Test that oversized or missing files are not inlined"""
+    store = InlineImageStore(max_item_bytes=4)
+
+    assert store.get(source_file) is None
+    assert store.get(tmp_path / "missing.png") is None
+    assert len(store) == 0
+    assert store.stats()["skipped"] == 2
+
+
+def test_inline_store_reloads_changed_files(source_file):
+    """Test that an edited file is re-read instead of served stale"""
+    store = InlineImageStore()
+    store.get(source_file)
+
+    source_file.write_bytes(b"changed!")
+    os.utime(source_file, ns=(0, 0))
+
+    assert base64.b64decode(store.get(source_file)) == b"changed!"
+
+
+def test_inline_store_evicts_to_budget(tmp_path):
+    """Test least recently used entries are evicted beyond the byte budget"""
+    # Each 6-byte file is 8 base64 characters
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.png"
+        path.write_bytes(b"pixels")
+        paths.append(path)
+    store = InlineImageStore(budget=20)
+
+    for path in paths:
+        store.get(path)
+
+    assert paths[0] not in store
+    assert paths[2] in store
+    assert store.stats()["bytes"] == 16
+    assert store.stats()["evictions"] == 1
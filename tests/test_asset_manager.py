@@ -1,12 +1,17 @@
+import base64
 import os
 import tempfile
+import threading
+from contextlib import asynccontextmanager
 from pathlib import Path
 from unittest.mock import AsyncMock
 
 import pytest
+from aiohttp import web
 from PIL import Image
 
 from swipe_verse.services.asset_manager import AssetManager
+from swipe_verse.services.image_processor import ImageProcessor
 
 
 @pytest.fixture
@@ -133,28 +138,282 @@ async def test_apply_filter(asset_manager, sample_image):
     # Assert
     assert "grayscale" in result
     assert result in asset_manager.cache.values()
+    assert asset_manager.executor.stats()["completed"] == 1
+
+
+LARGE_BODY = bytes(range(256)) * (8 * 1024 * 4)  # 8 MiB
+
+
+@asynccontextmanager
+async def serve(routes):
+    """Run a local aiohttp server for the duration of the block"""
+    app = web.Application()
+    app.add_routes(routes)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        await runner.cleanup()
+
+
+def make_ranged_handler(body, content_type="image/png", fail_first_at=None, etag='"v1"'):
+    """Serve body with Range support, optionally cutting the first transfer short
+
+    Range requests are honoured only while If-Range matches the current ETag,
+    and If-None-Match with the current ETag is answered 304; change
+    state["body"] and state["etag"] to simulate the remote file changing.
+    """
+    state = {"requests": [], "if_range": [], "body": body, "etag": etag}
+
+    async def handler(request):
+        body = state["body"]
+        state["requests"].append(request.headers.get("Range"))
+        state["if_range"].append(request.headers.get("If-Range"))
+        if state["etag"] and request.headers.get("If-None-Match") == state["etag"]:
+            return web.Response(status=304, headers={"ETag": state["etag"]})
+        start = 0
+        status = 200
+        range_header = request.headers.get("Range")
+        if range_header and request.headers.get("If-Range") == state["etag"]:
+            start = int(range_header.split("=")[1].split("-")[0])
+            status = 206
+
+        response = web.StreamResponse(status=status)
+        response.content_type = content_type
+        if state["etag"]:
+            response.headers["ETag"] = state["etag"]
+        response.content_length = len(body) - start
+        if status == 206:
+            response.headers["Content-Range"] = (
+                f"bytes {start}-{len(body) - 1}/{len(body)}"
+            )
+        await response.prepare(request)
+
+        if fail_first_at is not None and len(state["requests"]) == 1:
+            await response.write(body[start:fail_first_at])
+            request.transport.close()
+            return response
+
+        for i in range(start, len(body), 256 * 1024):
+            await response.write(body[i : i + 256 * 1024])
+        await response.write_eof()
+        return response
+
+    return handler, state
 
 
-@pytest.mark.skip(
-    reason="Testing URL downloading requires complex mocking of async context managers"
-)
 @pytest.mark.asyncio
-async def test_download_image():
-    """Test downloading an image from a URL"""
-    # This test is skipped because testing URL downloading requires complex mocking
-    # of async context managers which is difficult to do with standard unittest.mock.
-    pass
+async def test_download_image(asset_manager, tmp_path):
+    """Test streaming a large image from a local server"""
+    # Arrange
+    asset_manager.download_dir = tmp_path
+    handler, _ = make_ranged_handler(LARGE_BODY)
+
+    async with serve([web.get("/big.png", handler)]) as base_url:
+        # Act
+        result = await asset_manager._download_image(f"{base_url}/big.png")
+
+    # Assert
+    assert result.parent == tmp_path and result.suffix == ".png"
+    assert result.read_bytes() == LARGE_BODY
+    assert not result.with_name(result.name + ".part").exists()
 
 
-@pytest.mark.skip(
-    reason="Testing URL downloading requires complex mocking of async context managers"
-)
 @pytest.mark.asyncio
-async def test_download_image_failure():
+async def test_download_image_failure(asset_manager, tmp_path):
     """Test handling a failed download"""
-    # This test is skipped because testing URL downloading requires complex mocking
-    # of async context managers which is difficult to do with standard unittest.mock.
-    pass
+    # Arrange
+    asset_manager.download_dir = tmp_path
+
+    async def not_found(request):
+        return web.Response(status=404)
+
+    async with serve([web.get("/missing.png", not_found)]) as base_url:
+        # Act & Assert
+        with pytest.raises(Exception, match="status 404"):
+            await asset_manager._download_image(f"{base_url}/missing.png")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_download_image_resumes_interrupted_transfer(asset_manager, tmp_path):
+    """Test that an interrupted download resumes with a Range request"""
+    # Arrange
+    asset_manager.download_dir = tmp_path
+    cut = len(LARGE_BODY) // 3
+    handler, state = make_ranged_handler(LARGE_BODY, fail_first_at=cut)
+
+    async with serve([web.get("/big.png", handler)]) as base_url:
+        url = f"{base_url}/big.png"
+
+        # Act
+        with pytest.raises(Exception):
+            await asset_manager._download_image(url)
+        part_path = asset_manager._download_path(url).with_suffix(".png.part")
+        partial_size = part_path.stat().st_size
+        result = await asset_manager._download_image(url)
+
+    # Assert
+    assert 0 < partial_size <= cut
+    assert state["requests"] == [None, f"bytes={partial_size}-"]
+    assert result.read_bytes() == LARGE_BODY
+    assert state["if_range"] == [None, '"v1"']
+    assert not part_path.with_name(part_path.name + ".validator").exists()
+
+
+@pytest.mark.asyncio
+async def test_download_image_restarts_when_remote_file_changed(asset_manager, tmp_path):
+    """Test that a partial file is not stitched onto a changed remote file"""
+    # Arrange
+    asset_manager.download_dir = tmp_path
+    cut = len(LARGE_BODY) // 3
+    handler, state = make_ranged_handler(LARGE_BODY, fail_first_at=cut)
+    changed = bytes(reversed(LARGE_BODY))
+
+    async with serve([web.get("/big.png", handler)]) as base_url:
+        url = f"{base_url}/big.png"
+
+        # Act
+        with pytest.raises(Exception):
+            await asset_manager._download_image(url)
+        state["body"], state["etag"] = changed, '"v2"'
+        result = await asset_manager._download_image(url)
+
+    # Assert: the stale validator was sent, and the server's full 200 body kept
+    assert state["if_range"] == [None, '"v1"']
+    assert result.read_bytes() == changed
+
+
+@pytest.mark.asyncio
+async def test_download_image_without_validator_is_not_resumed(asset_manager, tmp_path):
+    """Test that a partial file is discarded when it cannot be validated"""
+    # Arrange
+    asset_manager.download_dir = tmp_path
+    cut = len(LARGE_BODY) // 3
+    handler, state = make_ranged_handler(LARGE_BODY, fail_first_at=cut, etag=None)
+
+    async with serve([web.get("/big.png", handler)]) as base_url:
+        url = f"{base_url}/big.png"
+
+        # Act
+        with pytest.raises(Exception):
+            await asset_manager._download_image(url)
+        result = await asset_manager._download_image(url)
+
+    # Assert
+    assert state["requests"] == [None, None]
+    assert result.read_bytes() == LARGE_BODY
+
+
+@pytest.mark.asyncio
+async def test_download_image_keeps_urls_with_the_same_name_apart(asset_manager, tmp_path):
+    """Test that URLs differing only in host or query get their own files"""
+    # Arrange
+    asset_manager.download_dir = tmp_path
+    first, _ = make_ranged_handler(b"first", etag='"a"')
+    second, _ = make_ranged_handler(b"second", etag='"b"')
+    routes = [web.get("/art.png", first), web.get("/other/art.png", second)]
+
+    async with serve(routes) as base_url:
+        # Act
+        results = [
+            await asset_manager._download_image(f"{base_url}/art.png?id=1"),
+            await asset_manager._download_image(f"{base_url}/other/art.png"),
+            await asset_manager._download_image(f"{base_url}/art.png?id=2"),
+        ]
+
+    # Assert
+    assert len(set(results)) == 3
+    assert [path.read_bytes() for path in results] == [b"first", b"second", b"first"]
+
+
+@pytest.mark.asyncio
+async def test_download_image_revalidates_earlier_download(asset_manager, tmp_path):
+    """Test that a completed download is reused only once the server confirms it"""
+    # Arrange
+    asset_manager.download_dir = tmp_path
+    handler, state = make_ranged_handler(b"v1 body")
+
+    async with serve([web.get("/art.png", handler)]) as base_url:
+        url = f"{base_url}/art.png"
+        first = await asset_manager._download_image(url)
+
+        # Act: unchanged, then changed on the server
+        unchanged = await asset_manager._download_image(url)
+        state["body"], state["etag"] = b"v2 body", '"v2"'
+        changed = await asset_manager._download_image(url)
+
+    # Assert
+    assert first == unchanged == changed
+    assert len(state["requests"]) == 3
+    assert changed.read_bytes() == b"v2 body"
+
+
+@pytest.mark.asyncio
+async def test_download_without_validators_is_downloaded_again(asset_manager, tmp_path):
+    """Test that a file with no validators to check is never served as fresh"""
+    # Arrange
+    asset_manager.download_dir = tmp_path
+    handler, state = make_ranged_handler(b"body", etag=None)
+
+    async with serve([web.get("/art.png", handler)]) as base_url:
+        url = f"{base_url}/art.png"
+        await asset_manager._download_image(url)
+        state["body"] = b"new body"
+
+        # Act
+        result = await asset_manager._download_image(url)
+
+    # Assert
+    assert result.read_bytes() == b"new body"
+
+
+@pytest.mark.asyncio
+async def test_download_image_rejects_oversized_body(asset_manager, tmp_path):
+    """Test the max-size guard, both from Content-Length and while streaming"""
+    # Arrange
+    asset_manager.download_dir = tmp_path
+    asset_manager.max_download_bytes = 1024 * 1024
+    handler, _ = make_ranged_handler(LARGE_BODY)
+
+    async def chunked(request):
+        response = web.StreamResponse()
+        response.content_type = "image/png"
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        await response.write(LARGE_BODY)
+        await response.write_eof()
+        return response
+
+    routes = [web.get("/big.png", handler), web.get("/chunked.png", chunked)]
+    async with serve(routes) as base_url:
+        # Act & Assert
+        with pytest.raises(Exception, match="exceeds limit"):
+            await asset_manager._download_image(f"{base_url}/big.png")
+        with pytest.raises(Exception, match="exceeded limit"):
+            await asset_manager._download_image(f"{base_url}/chunked.png")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_download_image_rejects_non_image(asset_manager, tmp_path):
+    """Test that responses which are not images are refused"""
+    # Arrange
+    asset_manager.download_dir = tmp_path
+    handler, _ = make_ranged_handler(b"<html></html>", content_type="text/html")
+
+    async with serve([web.get("/page.png", handler)]) as base_url:
+        # Act & Assert
+        with pytest.raises(Exception, match="content type"):
+            await asset_manager._download_image(f"{base_url}/page.png")
+
+    assert not asset_manager._download_path(f"{base_url}/page.png").exists()
 
 
 @pytest.mark.asyncio
@@ -199,3 +458,192 @@ async def test_get_default_asset_for_type(asset_manager):
         asset_manager._get_default_asset_for_type("unknown.png")
         == "card_fronts/card1.png"
     )
+
+
+@pytest.mark.asyncio
+async def test_get_image_missing_file_picked_up_once_created(asset_manager):
+    """Test that a fallback entry is dropped when the requested file appears"""
+    # Arrange
+    relative_path = "late_image.png"
+    first = await asset_manager.get_image(relative_path)
+
+    # Act
+    absolute_path = asset_manager.base_path / relative_path
+    Image.new("RGB", (10, 10), color=(1, 2, 3)).save(absolute_path)
+    second = await asset_manager.get_image(relative_path)
+
+    # Assert
+    assert "card_fronts/card1.png" in first
+    assert second == str(absolute_path)
+
+
+@pytest.mark.asyncio
+async def test_get_image_error_fallback_is_retried(asset_manager):
+    """Test that fallbacks from errors are only cached for failure_ttl"""
+    # Arrange
+    url = "https://example.com/flaky.png"
+    mock_path = Path("/tmp/flaky.png")
+    download_mock = AsyncMock(side_effect=[Exception("boom"), mock_path])
+    asset_manager._download_image = download_mock
+    asset_manager.cache.failure_ttl = 0
+
+    # Act
+    first = await asset_manager.get_image(url)
+    second = await asset_manager.get_image(url)
+
+    # Assert
+    assert first.endswith("card_back.png")
+    assert second == str(mock_path)
+    assert download_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_image_cache_is_bounded(sample_image):
+    """Test that the asset cache never grows beyond its capacity"""
+    # Arrange
+    with tempfile.TemporaryDirectory() as base_path:
+        manager = AssetManager(base_path, base_path, cache_size=2)
+
+        # Act
+        for i in range(5):
+            await manager.get_image(sample_image, filter_type=None if i == 0 else f"f{i}")
+
+        # Assert
+        assert len(manager.cache) == 2
+        assert manager.cache.stats()["evictions"] == 3
+
+
+@pytest.mark.asyncio
+async def test_filtered_image_refreshed_when_source_changes(asset_manager):
+    """Test that editing a source image invalidates its filtered variant"""
+    # Arrange
+    source = asset_manager.base_path / "theme_icon.png"
+    Image.new("RGB", (30, 30), color=(10, 20, 30)).save(source)
+    first = await asset_manager.get_image(str(source), filter_type="grayscale")
+
+    # Act
+    Image.new("RGB", (40, 40), color=(200, 100, 50)).save(source)
+    second = await asset_manager.get_image(str(source), filter_type="grayscale")
+
+    # Assert
+    assert second != first
+    assert Image.open(second).size == (40, 40)
+
+
+def test_display_image_returns_sized_copy(asset_manager, tmp_path):
+    """Test that display images are scaled to the box at the display density"""
+    # Arrange
+    asset_manager.image_processor = ImageProcessor(cache_dir=tmp_path)
+    source = tmp_path / "art.png"
+    Image.new("RGB", (800, 800), color=(0, 0, 255)).save(source)
+    ready = threading.Event()
+    rendered = []
+
+    def on_ready(path):
+        rendered.append(path)
+        ready.set()
+
+    # Act: the first request only queues the copy and returns the source
+    first = asset_manager.display_image(str(source), 50, 50, on_ready=on_ready)
+    assert ready.wait(5)
+    second = asset_manager.display_image(str(source), 50, 50)
+
+    # Assert
+    assert first == str(source)
+    assert second == rendered[0]
+    with Image.open(second) as img:
+        assert img.size == (100, 100)
+
+
+def test_display_image_does_not_render_on_the_calling_thread(asset_manager, tmp_path):
+    """Test that a missing derivative is rendered by the executor, once per image"""
+    # Arrange
+    asset_manager.image_processor = ImageProcessor(cache_dir=tmp_path)
+    source = tmp_path / "art.png"
+    Image.new("RGB", (800, 800), color=(0, 0, 255)).save(source)
+    derivative = asset_manager.image_processor.derivative
+    threads = []
+
+    def spy(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return derivative(*args, **kwargs)
+
+    asset_manager.image_processor.derivative = spy
+    ready = threading.Event()
+
+    # Act
+    asset_manager.display_image(str(source), 50, 50)
+    asset_manager.display_image(str(source), 50, 50, on_ready=lambda path: ready.set())
+
+    # Assert
+    assert ready.wait(5)
+    assert len(threads) == 1
+    assert threads[0] is not threading.current_thread()
+
+
+def test_display_image_leaves_urls_alone(asset_manager):
+    """Test that remote images are passed through unchanged"""
+    url = "https://example.com/image.png"
+
+    assert asset_manager.display_image(url, 50, 50) == url
+
+
+@pytest.mark.asyncio
+async def test_display_source_inlines_small_images(asset_manager, tmp_path):
+    """Test that display images are passed inline once inline images are enabled"""
+    # Arrange
+    asset_manager.image_processor = ImageProcessor(cache_dir=tmp_path)
+    source = tmp_path / "icon.png"
+    Image.new("RGBA", (200, 200), color=(0, 0, 255, 255)).save(source)
+
+    # Act
+    by_path = await asset_manager.prepare_display_source(str(source), 50, 50, profile="icon")
+    asset_manager.enable_inline_images()
+    inline = asset_manager.display_source(str(source), 50, 50, profile="icon")
+
+    # Assert
+    assert set(by_path) == {"src"}
+    assert set(inline) == {"src_base64"}
+    assert base64.b64decode(inline["src_base64"]) == Path(by_path["src"]).read_bytes()
+
+
+@pytest.mark.asyncio
+async def test_display_source_in_web_mode_never_points_into_the_cache(
+    asset_manager, tmp_path
+):
+    """Test that derivatives too large to inline fall back to the scenario's own path"""
+    # Arrange
+    asset_manager.image_processor = ImageProcessor(cache_dir=tmp_path)
+    asset_manager.enable_inline_images(max_item_bytes=1)
+    source = tmp_path / "art.png"
+    Image.new("RGB", (800, 800), color=(0, 0, 255)).save(source)
+
+    # Act
+    prepared = await asset_manager.prepare_display_source(str(source), 200, 200)
+    cached = asset_manager.display_source(str(source), 200, 200)
+
+    # Assert
+    assert prepared == cached == {"src": str(source)}
+
+
+def test_atlas_for_packs_local_images(asset_manager, tmp_path):
+    """Test that local images are packed and remote ones are left out"""
+    # Arrange
+    asset_manager.image_processor = ImageProcessor(cache_dir=tmp_path)
+    icon = tmp_path / "icon.png"
+    Image.new("RGBA", (64, 64), color=(0, 255, 0, 255)).save(icon)
+
+    # Act
+    atlas = asset_manager.atlas_for(
+        {
+            "icon": (str(icon), (30, 30)),
+            "remote": ("https://example.com/icon.png", (30, 30)),
+        }
+    )
+
+    # Assert
+    assert atlas is not None
+    assert atlas.region("icon")["w"] == 60
+    assert atlas.region("remote") is None
+    assert asset_manager.atlas_page_source(atlas, 0) == {"src": atlas.pages[0]}
+    assert asset_manager.atlas_for({"remote": ("https://example.com/a.png", (30, 30))}) is None
@@ -0,0 +1,129 @@
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from swipe_verse.services.atlas import Atlas, build_atlas, pack_shelves
+from swipe_verse.services.image_processor import ImageProcessor
+
+
+@pytest.fixture
+def processor(tmp_path):
+    """Create an ImageProcessor with a temporary cache"""
+    return ImageProcessor(cache_dir=tmp_path / "cache")
+
+
+@pytest.fixture
+def theme_images(tmp_path):
+    """Create a card back and three coloured icons"""
+    images = {}
+    back = tmp_path / "card_back.png"
+    Image.new("RGB", (400, 600), color=(20, 40, 200)).save(back)
+    images["card_back"] = (back, (100, 150))
+    for name, color in [("red", (255, 0, 0)), ("green", (0, 255, 0)), ("white", (255, 255, 255))]:
+        icon = tmp_path / f"{name}.png"
+        Image.new("RGBA", (120, 120), color=color + (255,)).save(icon)
+        images[f"icon:{name}"] = (icon, (30, 30))
+    return images
+
+
+def _overlaps(a, b):
+    return not (
+        a["x"] + a["w"] <= b["x"]
+        or b["x"] + b["w"] <= a["x"]
+        or a["y"] + a["h"] <= b["y"]
+        or b["y"] + b["h"] <= a["y"]
+    )
+
+
+def test_pack_shelves_without_overlap():
+    """Test that packed rectangles stay on their page and do not overlap"""
+    # Arrange
+    sizes = {f"r{i}": (10 + i * 7 % 40, 10 + i * 13 % 50) for i in range(40)}
+
+    # Act
+    regions, pages = pack_shelves(sizes, max_side=256, padding=2)
+
+    # Assert
+    assert set(regions) == set(sizes)
+    for key, region in regions.items():
+        assert (region["w"], region["h"]) == sizes[key]
+        page_width, page_height = pages[region["page"]]
+        assert region["x"] + region["w"] <= page_width <= 256
+        assert region["y"] + region["h"] <= page_height <= 256
+    keys = list(regions)
+    for i, a in enumerate(keys):
+        for b in keys[i + 1 :]:
+            if regions[a]["page"] == regions[b]["page"]:
+                assert not _overlaps(regions[a], regions[b])
+
+
+def test_pack_shelves_opens_new_pages():
+    """Test that rectangles spill onto further pages when a page is full"""
+    regions, pages = pack_shelves({f"r{i}": (60, 60) for i in range(5)}, max_side=128)
+
+    assert len(pages) == 2
+    assert sorted(region["page"] for region in regions.values()) == [0, 0, 0, 0, 1]
+
+
+def test_pack_shelves_rejects_oversized_images():
+    """Test that an image larger than a page is rejected"""
+    with pytest.raises(ValueError):
+        pack_shelves({"huge": (300, 10)}, max_side=256)
+
+
+def test_build_atlas_regions_hold_images(processor, theme_images):
+    """Test that each region shows its image, scaled to fit its box"""
+    # Act
+    atlas = build_atlas(theme_images, processor, density=2.0, profile="icon")
+
+    # Assert
+    assert len(atlas.pages) == 1
+    back = atlas.region("card_back")
+    assert (back["w"], back["h"]) == (200, 300)
+    assert (atlas.region("icon:red")["w"], atlas.region("icon:red")["h"]) == (60, 60)
+    with Image.open(atlas.pages[0]) as page:
+        page = page.convert("RGB")
+        assert page.size == tuple(atlas.page_sizes[0])
+        for key, color in [("icon:red", (255, 0, 0)), ("icon:green", (0, 255, 0))]:
+            region = atlas.region(key)
+            center = (region["x"] + region["w"] // 2, region["y"] + region["h"] // 2)
+            assert page.getpixel(center) == color
+
+
+def test_build_atlas_is_cached(processor, theme_images):
+    """Test that an unchanged image set reuses the cached pages and index"""
+    # Arrange
+    first = build_atlas(theme_images, processor)
+    mtime = [p.stat().st_mtime_ns for p in processor.cache_dir.glob("atlas_*")]
+
+    # Act
+    second = build_atlas(theme_images, processor)
+
+    # Assert
+    assert second.pages == first.pages
+    assert second.regions == first.regions
+    assert [p.stat().st_mtime_ns for p in processor.cache_dir.glob("atlas_*")] == mtime
+
+
+def test_build_atlas_rebuilds_when_a_source_changes(processor, theme_images):
+    """Test that editing a source image produces a new atlas"""
+    first = build_atlas(theme_images, processor)
+
+    path, _ = theme_images["icon:red"]
+    Image.new("RGBA", (120, 120), color=(0, 0, 0, 255)).save(path)
+    processor.forget(str(path))
+    second = build_atlas(theme_images, processor)
+
+    assert second.pages != first.pages
+
+
+def test_load_rejects_missing_pages(processor, theme_images):
+    """Test that an index whose pages were deleted is treated as missing"""
+    atlas = build_atlas(theme_images, processor)
+    index_path = next(processor.cache_dir.glob("atlas_*.json"))
+
+    assert Atlas.load(index_path) is not None
+    for page in atlas.pages:
+        Path(page).unlink()
+    assert Atlas.load(index_path) is None
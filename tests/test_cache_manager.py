@@ -0,0 +1,182 @@
+import os
+import time
+
+import pytest
+from PIL import Image
+
+from swipe_verse.cli import run
+from swipe_verse.services.cache_manager import INDEX_NAME, CacheManager
+from swipe_verse.services.image_processor import DIGEST_INDEX_NAME, ImageProcessor
+from swipe_verse.services.prerender import MANIFEST_NAME
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Create a CacheManager rooted in a temporary directory"""
+    return CacheManager(root=tmp_path / "cache_root", budget=10_000)
+
+
+def _write(path, size, accessed):
+    path.write_bytes(b"x" * size)
+    os.utime(path, (accessed, accessed))
+    return path
+
+
+def test_namespaces_map_to_directories(manager):
+    """Test that namespaces keep the existing directory names"""
+    assert manager.path("downloads") == manager.root / "cache"
+    assert manager.path("images") == manager.root / "image_cache"
+    with pytest.raises(ValueError):
+        manager.path("filtered")
+
+
+def test_stats_count_files_and_hits(manager):
+    """Test that stats report disk usage and hit rates per namespace"""
+    # Arrange
+    image = _write(manager.path("images") / "a.png", 100, 1000)
+    manager.record_miss("images", image)
+    manager.record_hit("images", image)
+    manager.record_hit("images", image)
+    _write(manager.path("images") / DIGEST_INDEX_NAME, 50, 1000)
+
+    # Act
+    stats = manager.stats()
+
+    # Assert
+    images = stats["namespaces"]["images"]
+    assert (images["files"], images["bytes"]) == (1, 100)
+    assert (images["hits"], images["misses"]) == (2, 1)
+    assert images["hit_rate"] == pytest.approx(2 / 3)
+    assert stats["namespaces"]["downloads"]["files"] == 0
+
+
+def test_lookup_records_hits_and_misses(manager):
+    """Test that lookup reports whether a cached file exists"""
+    path = _write(manager.path("downloads") / "art.png", 10, 1000)
+
+    assert manager.lookup("downloads", path)
+    assert not manager.lookup("downloads", path.with_name("other.png"))
+    counts = manager.stats()["namespaces"]["downloads"]
+    assert (counts["hits"], counts["misses"]) == (1, 1)
+
+
+def test_gc_evicts_expired_then_least_recently_used(manager):
+    """Test that gc removes files past max_age and then the oldest over budget"""
+    # Arrange
+    images = manager.path("images")
+    expired = _write(images / "expired.png", 1000, 100)
+    old = _write(images / "old.png", 4000, 5000)
+    recent = _write(images / "recent.png", 4000, 6000)
+    used = _write(manager.path("downloads") / "used.png", 4000, 4000)
+    manager.scan()
+    manager.record_hit("downloads", used)
+
+    # Act
+    removed = manager.gc(budget=10_000, max_age=1000, now=5500)
+
+    # Assert
+    assert not expired.exists()
+    assert not old.exists()
+    assert recent.exists() and used.exists()
+    assert removed == {"files": 2, "bytes": 5000}
+
+
+def test_gc_keeps_bookkeeping_files(manager):
+    """Test that the digest index and pre-render manifest are never evicted"""
+    # Arrange
+    images = manager.path("images")
+    digests = _write(images / DIGEST_INDEX_NAME, 100, 100)
+    manifest = _write(images / MANIFEST_NAME, 100, 100)
+
+    # Act
+    removed = manager.gc(budget=0, max_age=0)
+
+    # Assert
+    assert digests.exists() and manifest.exists()
+    assert removed == {"files": 0, "bytes": 0}
+
+
+def test_gc_removes_legacy_filtered_dir(manager):
+    """Test that the unused filtered/ directory is removed"""
+    legacy = manager.root / "filtered"
+    legacy.mkdir(parents=True)
+    _write(legacy / "card_grayscale.png", 300, 1000)
+
+    removed = manager.gc()
+
+    assert not legacy.exists()
+    assert removed == {"files": 1, "bytes": 300}
+
+
+def test_clear_namespace(manager):
+    """Test that clear removes one namespace and resets its counters"""
+    image = _write(manager.path("images") / "a.png", 100, 1000)
+    download = _write(manager.path("downloads") / "b.png", 100, 1000)
+    manager.record_hit("images", image)
+
+    manager.clear("images")
+
+    assert not image.exists() and download.exists()
+    assert manager.stats()["namespaces"]["images"]["hits"] == 0
+    with pytest.raises(ValueError):
+        manager.clear("filtered")
+
+
+def test_index_persists_access_times(manager):
+    """Test that a new manager reads the saved index"""
+    # Arrange
+    images = manager.path("images")
+    first = _write(images / "first.png", 6000, 1000)
+    second = _write(images / "second.png", 6000, 2000)
+    manager.scan()
+    manager.record_hit("images", first)
+    manager.save()
+    assert (manager.root / INDEX_NAME).exists()
+
+    # Act
+    reloaded = CacheManager(root=manager.root, budget=10_000)
+    reloaded.gc(max_age=10**9)
+
+    # Assert: first was used more recently, so second is evicted
+    assert first.exists() and not second.exists()
+    assert reloaded.stats()["namespaces"]["images"]["hits"] == 1
+
+
+def test_image_processor_reports_to_manager(manager, tmp_path):
+    """Test that processed images are tracked in the images namespace"""
+    # Arrange
+    source = tmp_path / "art.png"
+    Image.new("RGB", (40, 40), color=(10, 20, 30)).save(source)
+    processor = ImageProcessor(cache_manager=manager)
+
+    # Act
+    first = processor.process_image(str(source), "grayscale")
+    processor.process_image(str(source), "grayscale")
+
+    # Assert
+    assert processor.cache_dir == manager.path("images")
+    counts = manager.stats()["namespaces"]["images"]
+    assert (counts["hits"], counts["misses"]) == (1, 1)
+    assert counts["files"] == 1
+    assert first.startswith(str(manager.root))
+
+
+def test_cli_cache(manager, capsys):
+    """Test the cache stats, gc and clear commands"""
+    # Arrange
+    root = str(manager.root)
+    now = time.time()
+    _write(manager.path("images") / "a.png", 2048, now - 60)
+    _write(manager.path("downloads") / "b.png", 1024, now)
+
+    # Act / Assert
+    assert run(["cache", "stats", "--root", root]) == 0
+    out = capsys.readouterr().out
+    assert "2 files" in out and "images" in out and "downloads" in out
+
+    assert run(["cache", "gc", "--root", root, "--budget", "0.0015"]) == 0
+    assert "Removed 1 files (2.0 KiB)" in capsys.readouterr().out
+
+    assert run(["cache", "clear", "--root", root]) == 0
+    assert "Removed 1 files" in capsys.readouterr().out
+    assert not any(manager.path("downloads").iterdir())
@@ -0,0 +1,152 @@
+import json
+
+import pytest
+
+from swipe_verse.models.config import Card, GameConfig
+from swipe_verse.models.game_state import GameState
+from swipe_verse.services.card_store import (
+    CardStore,
+    LazyCardStore,
+    card_store,
+    index_cards,
+    open_scenario,
+)
+from swipe_verse.services.config_loader import ConfigLoader
+from swipe_verse.services.game_logic import GameLogic
+from swipe_verse.services.scenario_catalog import SCENARIOS_DIR
+
+
+def make_scenario(cards):
+    with open(SCENARIOS_DIR / "kingdom_game.json", "r", encoding="utf-8") as f:
+        scenario = json.load(f)
+    templates = scenario["cards"]
+    scenario["cards"] = []
+    for index in range(cards):
+        card = json.loads(json.dumps(templates[index % len(templates)]))
+        card["id"] = f"card_{index:04d}"
+        for choice in card["choices"].values():
+            choice["next_card"] = f"card_{(index + 1) % cards:04d}"
+        scenario["cards"].append(card)
+    return scenario
+
+
+@pytest.fixture
+def scenario_file(tmp_path):
+    scenario = make_scenario(50)
+    # Non-ASCII text, escapes and a card that is not valid until validated
+    scenario["cards"][3]["id"] = "carte_é_☺"
+    scenario["cards"][4]["title"] = 'Le "roi" \\ est mort é'
+    path = tmp_path / "large_game.json"
+    path.write_text(json.dumps(scenario, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("chunk_size", [7, 64, 1024 * 1024])
+def test_index_cards_finds_every_card(scenario_file, chunk_size):
+    data = scenario_file.read_bytes()
+    expected = json.loads(data)
+
+    header, spans, ids = index_cards(data, chunk_size=chunk_size)
+
+    assert header == {k: v for k, v in expected.items() if k != "cards"}
+    assert ids == [card["id"] for card in expected["cards"]]
+    for card in expected["cards"]:
+        start, end = spans[card["id"]]
+        assert json.loads(data[start:end]) == card
+
+
+def test_open_scenario_matches_full_load(scenario_file):
+    full = GameConfig.model_validate_json(scenario_file.read_bytes())
+
+    config = open_scenario(scenario_file)
+
+    assert isinstance(config.cards, LazyCardStore)
+    assert config.game_info == full.game_info
+    assert config.theme == full.theme
+    assert config.game_settings == full.game_settings
+    assert len(config.cards) == len(full.cards)
+    assert list(config.cards) == full.cards
+    assert config.cards.get("carte_é_☺") == full.cards[3]
+    assert config.cards.get("missing") is None
+
+
+def test_lazy_store_keeps_few_cards_in_memory(scenario_file):
+    config = open_scenario(scenario_file, cache_size=2)
+    cards = config.cards
+
+    first = cards.get("card_0000")
+    cards.get("card_0001")
+    assert cards.get("card_0000") is first
+    assert cards.loads == 2
+
+    cards.get("card_0002")
+    # card_0001 was the least recently used
+    assert cards.get("card_0000") is first
+    cards.get("card_0001")
+    assert cards.loads == 4
+
+
+def test_random_card_honours_skip_ids_and_condition(scenario_file):
+    cards = open_scenario(scenario_file).cards
+    ids = cards.ids()
+    skip = set(ids[:-2])
+
+    picked = {
+        cards.random_card(lambda card: card.id != ids[-1], skip_ids=skip).id
+        for _ in range(20)
+    }
+
+    assert picked == {ids[-2]}
+    assert cards.random_card(skip_ids=set(ids)) is None
+
+
+def test_card_store_wraps_plain_list():
+    config = GameConfig.model_validate(make_scenario(3))
+
+    cards = card_store(config)
+
+    assert isinstance(cards, CardStore)
+    assert cards.ids() == ["card_0000", "card_0001", "card_0002"]
+    assert cards.get("card_0001") is config.cards[1]
+    assert cards[2] is config.cards[2]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b'{"game_info": {}}',
+        b'{"cards": [{"title": "no id"}]}',
+        b'{"cards": [{"id": "a"}',
+        b'[]',
+    ],
+)
+def test_index_cards_rejects_invalid_scenarios(content):
+    with pytest.raises(ValueError):
+        index_cards(content)
+
+
+@pytest.mark.asyncio
+async def test_loader_streams_large_files_and_game_plays(scenario_file):
+    loader = ConfigLoader(lazy_cards_bytes=1)
+
+    config = await loader.load_config(str(scenario_file))
+    game_state = GameState.new_game(config)
+    game_logic = GameLogic(game_state, config)
+    game_state.current_card = config.cards.get("card_0010")
+    for _ in range(5):
+        game_logic.process_choice("left")
+    game_logic._set_random_card()
+
+    assert isinstance(config.cards, LazyCardStore)
+    assert game_logic.cards is config.cards
+    assert game_logic.calculate_progress() > 0
+    assert isinstance(game_state.current_card, Card)
+    # Only the cards in play were read
+    assert config.cards.loads <= 10
+
+
+@pytest.mark.asyncio
+async def test_loader_keeps_small_files_in_memory(scenario_file):
+    config = await ConfigLoader().load_config(str(scenario_file))
+
+    assert isinstance(config.cards, list)
@@ -0,0 +1,116 @@
+import gc
+import json
+import os
+
+import pytest
+
+from swipe_verse.models.config import GameConfig
+from swipe_verse.services import config_cache
+from swipe_verse.services.config_cache import ConfigCache
+from swipe_verse.services.config_loader import ConfigLoader
+
+SCENARIO = os.path.join(
+    os.path.dirname(__file__), "..", "swipe_verse", "scenarios", "kingdom_game.json"
+)
+
+
+@pytest.fixture
+def scenario(tmp_path):
+    """Copy a bundled scenario to a temporary file"""
+    path = tmp_path / "kingdom_game.json"
+    with open(SCENARIO, "r", encoding="utf-8") as f:
+        path.write_text(f.read(), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ConfigCache(cache_dir=tmp_path / "config_cache")
+
+
+def _validate(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return GameConfig.model_validate(json.load(f))
+
+
+def test_warm_load_skips_validation(cache, scenario, mocker):
+    """Test that a second load unpickles instead of validating"""
+    # Arrange
+    first = cache.load(scenario, _validate)
+    validate = mocker.Mock(side_effect=AssertionError("validated again"))
+
+    # Act
+    second = cache.load(scenario, validate)
+
+    # Assert
+    assert second == first
+    assert second is not first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_changed_file_is_revalidated(cache, scenario):
+    """Test that editing the scenario invalidates its entry"""
+    cache.load(scenario, _validate)
+    data = json.loads(scenario.read_text(encoding="utf-8"))
+    data["game_info"]["title"] = "Edited Kingdom"
+    scenario.write_text(json.dumps(data), encoding="utf-8")
+
+    config = cache.load(scenario, _validate)
+
+    assert config.game_info.title == "Edited Kingdom"
+    assert cache.misses == 2
+
+
+def test_schema_change_invalidates(cache, scenario, monkeypatch):
+    """Test that entries made with another schema version are ignored"""
+    cache.load(scenario, _validate)
+    monkeypatch.setattr(config_cache, "schema_version", lambda: "other")
+
+    assert cache.get(scenario) is None
+
+
+def test_corrupt_entry_is_discarded(cache, scenario):
+    """Test that an unreadable entry is treated as a miss and removed"""
+    cache.load(scenario, _validate)
+    entry = next(cache.cache_dir.glob("*.pickle"))
+    entry.write_bytes(b"not a pickle")
+
+    assert cache.get(scenario) is None
+    assert not entry.exists()
+    assert cache.load(scenario, _validate).game_info.title
+
+
+@pytest.mark.asyncio
+async def test_config_loader_uses_cache(cache, scenario, mocker):
+    """Test that ConfigLoader serves warm loads from the cache"""
+    # Arrange
+    loader = ConfigLoader(config_cache=cache)
+    first = await loader.load_config(str(scenario))
+    validate = mocker.patch.object(GameConfig, "model_validate")
+
+    # Act
+    second = await loader.load_config(str(scenario))
+
+    # Assert
+    validate.assert_not_called()
+    assert second == first
+
+
+@pytest.mark.asyncio
+async def test_config_loader_fallback_with_cache(cache, tmp_path):
+    """Test that a missing file still falls back to the bundled scenario"""
+    loader = ConfigLoader(config_cache=cache)
+
+    config = await loader.load_config(str(tmp_path / "missing.json"))
+
+    assert config.game_info.title == _validate(SCENARIO).game_info.title
+
+
+def test_paused_gc_nests_and_restores():
+    """Test that collection resumes only when the outermost pause ends"""
+    assert gc.isenabled()
+    with config_cache.paused_gc():
+        with config_cache.paused_gc():
+            assert not gc.isenabled()
+        assert not gc.isenabled()
+    assert gc.isenabled()
@@ -1,6 +1,7 @@
 import json
 import os
 import tempfile
+from pathlib import Path
 
 import pytest
 
@@ -98,3 +99,53 @@ async def test_merge_configs(sample_config):
     # Assert
     assert merged.game_info.title == "Overridden Title"
     assert merged.game_info.description == base_config.game_info.description
+
+
+def test_theme_filter_chain(sample_config):
+    """Test resolving filters and named looks to filter chains"""
+    # Arrange
+    sample_config["theme"]["filters"]["noir"] = ["grayscale", "blur"]
+    theme = GameConfig.model_validate(sample_config).theme
+
+    # Assert
+    assert theme.looks() == {"noir": ["grayscale", "blur"]}
+    assert theme.filter_chain("noir") == ["grayscale", "blur"]
+    assert theme.filter_chain("cartoon") == ["cartoon"]
+    assert theme.filter_chain("none") == []
+    assert theme.filter_chain(None) == []
+
+
+def test_validate_file_matches_dict_validation(config_file, sample_config):
+    loader = ConfigLoader()
+
+    config = loader._validate_file(Path(config_file))
+
+    assert config == GameConfig.model_validate(sample_config)
+
+
+@pytest.mark.asyncio
+async def test_load_config_falls_back_on_malformed_json(tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_bytes(b'{"game_info": {"title": "Broken"')
+    loader = ConfigLoader()
+
+    config = await loader.load_config(str(path))
+
+    # The bundled kingdom scenario is loaded instead
+    assert config.game_info.title != "Broken"
+    assert len(config.cards) > 0
+
+
+@pytest.mark.asyncio
+async def test_load_config_from_url_validates_bytes(sample_config, mocker):
+    loader = ConfigLoader()
+    read = mocker.patch.object(
+        loader,
+        "_load_from_url",
+        mocker.AsyncMock(return_value=json.dumps(sample_config).encode()),
+    )
+
+    config = await loader.load_config("https://example.com/game.json")
+
+    read.assert_awaited_once_with("https://example.com/game.json")
+    assert config.game_info.title == sample_config["game_info"]["title"]
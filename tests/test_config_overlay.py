@@ -0,0 +1,90 @@
+import pytest
+from pydantic import ValidationError
+
+from swipe_verse.models.config import GameConfig
+from swipe_verse.services.config_overlay import apply_overlay
+from swipe_verse.services.scenario_catalog import SCENARIOS_DIR
+from swipe_verse.services.scenario_pack import open_pack, write_pack
+
+
+@pytest.fixture
+def config():
+    return GameConfig.model_validate_json(
+        (SCENARIOS_DIR / "kingdom_game.json").read_bytes()
+    )
+
+
+def deep_merge(base, override):
+    result = dict(base)
+    for key, value in override.items():
+        if isinstance(result.get(key), dict) and isinstance(value, dict):
+            result[key] = deep_merge(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+
+OVERRIDES = [
+    {"game_info": {"title": "Overridden", "license_url": "https://example.com/l"}},
+    {"theme": {"color_scheme": {"accent": "#123456"}, "filters": {"noir": ["blur"]}}},
+    {"game_settings": {"difficulty_modifiers": {"hard": 2.0}, "stats": {}}},
+    {"game_settings": {"initial_resources": {"treasury": 10}, "turn_unit": "days"}},
+    {"theme": {"background": "night.png"}, "unknown": {"ignored": True}},
+    {"cards": []},
+]
+
+
+@pytest.mark.parametrize("override", OVERRIDES)
+def test_matches_dump_merge_validate(config, override):
+    expected = GameConfig.model_validate(deep_merge(config.model_dump(), override))
+
+    assert apply_overlay(config, override) == expected
+
+
+def test_unchanged_parts_are_shared(config):
+    before = config.model_dump()
+
+    merged = apply_overlay(config, {"theme": {"color_scheme": {"primary": "#000000"}}})
+
+    assert merged.cards is config.cards
+    assert merged.game_info is config.game_info
+    assert merged.game_settings is config.game_settings
+    assert merged.theme is not config.theme
+    assert merged.theme.resource_icons is config.theme.resource_icons
+    assert merged.theme.color_scheme.primary == "#000000"
+    assert config.model_dump() == before
+
+
+def test_invalid_override_raises(config):
+    before = config.model_dump()
+
+    with pytest.raises(ValidationError):
+        apply_overlay(config, {"game_settings": {"initial_resources": {"gold": "lots"}}})
+    with pytest.raises(ValidationError):
+        apply_overlay(config, {"theme": "dark"})
+
+    assert config.model_dump() == before
+
+
+def test_stacked_overlays(config):
+    merged = config
+    for turn in range(200):
+        override = {"game_settings": {"initial_resources": {"treasury": turn}}}
+        merged = apply_overlay(merged, override)
+    merged = apply_overlay(merged, {"theme": {"name": "Night"}})
+
+    assert merged.game_settings.initial_resources["treasury"] == 199
+    assert merged.game_settings.initial_resources["military"] == 50
+    assert merged.theme.name == "Night"
+    assert merged.cards is config.cards
+
+
+def test_overlay_on_packed_scenario(config, tmp_path):
+    path = tmp_path / "kingdom.svpack"
+    write_pack(config, path)
+    packed = open_pack(path)
+
+    merged = apply_overlay(packed, {"game_info": {"title": "Packed"}})
+
+    assert merged.cards is packed.cards
+    assert merged.game_info.title == "Packed"
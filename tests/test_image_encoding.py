@@ -0,0 +1,73 @@
+import pytest
+from PIL import Image, ImageOps
+
+from swipe_verse.services import image_encoding
+from swipe_verse.services.image_encoding import (
+    PROFILES,
+    default_profile,
+    measure,
+    output_suffix,
+    resolve_profile,
+    save_image,
+)
+
+
+@pytest.fixture
+def gradient_image():
+    """Create an RGB image with many colours"""
+    gradient = Image.linear_gradient("L").resize((128, 96))
+    return Image.merge("RGB", (gradient, gradient.rotate(90), gradient.transpose(0)))
+
+
+def test_resolve_unknown_profile():
+    """Test that unknown profile names are rejected"""
+    with pytest.raises(ValueError):
+        resolve_profile("thumbnail")
+
+
+def test_webp_profiles_fall_back_to_png(monkeypatch):
+    """Test that WebP profiles become PNG when Pillow lacks WebP support"""
+    monkeypatch.setattr(image_encoding.features, "check", lambda feature: False)
+
+    assert resolve_profile("card_art")["format"] == "png"
+    assert resolve_profile("icon") == PROFILES["icon"]
+
+
+def test_default_profile():
+    """Test that few-colour filter chains default to a palette PNG"""
+    assert default_profile([]) == "source"
+    assert default_profile(["grayscale", "posterize"]) == "palette"
+    assert default_profile(["posterize", "blur"]) == "source"
+
+
+def test_output_suffix():
+    """Test output suffixes per profile"""
+    assert output_suffix(resolve_profile("source"), ".jpg") == ".jpg"
+    assert output_suffix(PROFILES["palette"], ".jpg") == ".png"
+
+
+def test_palette_is_exact_for_posterized_images(gradient_image, tmp_path):
+    """Test that palette reduction is lossless when there are <= 256 colours"""
+    # Arrange
+    posterized = ImageOps.posterize(gradient_image, 2)
+    path = tmp_path / "out.png"
+
+    # Act
+    save_image(posterized, path, PROFILES["palette"])
+
+    # Assert
+    with Image.open(path) as saved:
+        assert saved.mode == "P"
+        assert list(saved.convert("RGB").getdata()) == list(posterized.getdata())
+
+
+def test_measure_reports_smaller_webp():
+    """Test that measure returns encoded sizes and timings"""
+    # Noise stands in for photographic card art
+    photo = Image.effect_noise((128, 96), 40).convert("RGB")
+
+    source_bytes, source_s = measure(photo, resolve_profile("source"))
+    webp_bytes, webp_s = measure(photo, resolve_profile("card_art"))
+
+    assert 0 < webp_bytes < source_bytes
+    assert source_s >= 0 and webp_s >= 0
@@ -0,0 +1,183 @@
+import asyncio
+import threading
+
+import pytest
+
+from swipe_verse.services.image_executor import (
+    PRIORITY_PREFETCH,
+    PRIORITY_VISIBLE,
+    ImageExecutor,
+)
+
+
+@pytest.fixture
+def executor():
+    """Create a single-worker executor so queue order is observable"""
+    executor = ImageExecutor(max_workers=1, max_pending=8)
+    yield executor
+    executor.shutdown()
+
+
+def blocker():
+    """Return a job that blocks its worker until the event is set"""
+    gate = threading.Event()
+
+    def job():
+        gate.wait(5)
+        return "blocker"
+
+    return gate, job
+
+
+@pytest.mark.asyncio
+async def test_run_returns_result(executor):
+    # Act
+    result = await executor.run(pow, 2, 10)
+
+    # Assert
+    assert result == 1024
+    stats = executor.stats()
+    assert stats["completed"] == 1
+    assert stats["processing"]["max_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_run_propagates_exceptions(executor):
+    # Act & Assert
+    with pytest.raises(ZeroDivisionError):
+        await executor.run(divmod, 1, 0)
+    assert executor.stats()["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_visible_jobs_overtake_prefetch(executor):
+    # Arrange - occupy the only worker
+    gate, job = blocker()
+    order = []
+    first = executor.submit(job)
+
+    # Act - queue prefetch work before visible work
+    prefetch = executor.submit(order.append, "prefetch", priority=PRIORITY_PREFETCH)
+    visible = executor.submit(order.append, "visible", priority=PRIORITY_VISIBLE)
+    gate.set()
+    await asyncio.gather(*(asyncio.wrap_future(f) for f in (first, prefetch, visible)))
+
+    # Assert
+    assert order == ["visible", "prefetch"]
+    assert executor.stats()["queue_wait"]["max_ms"] > 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_drops_queued_job(executor):
+    # Arrange
+    gate, job = blocker()
+    ran = []
+    executor.submit(job)
+
+    # Act
+    task = asyncio.create_task(executor.run(ran.append, "late"))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    gate.set()
+    await executor.run(ran.append, "after")
+
+    # Assert
+    assert ran == ["after"]
+    assert executor.stats()["cancelled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_run_waits_for_queue_space():
+    # Arrange
+    executor = ImageExecutor(max_workers=1, max_pending=1)
+    gate, job = blocker()
+    executor.submit(job)
+    executor.submit(lambda: None)  # fills the queue
+
+    # Act
+    task = asyncio.create_task(executor.run(lambda: "done"))
+    await asyncio.sleep(0.05)
+    waiting = not task.done()
+    queued_while_waiting = executor.stats()["queued"]
+    gate.set()
+    result = await task
+
+    # Assert
+    assert waiting
+    assert queued_while_waiting == 1
+    assert result == "done"
+    executor.shutdown()
+
+
+def test_invalid_max_pending():
+    with pytest.raises(ValueError):
+        ImageExecutor(max_pending=0)
+
+
+@pytest.mark.asyncio
+async def test_submit_drops_oldest_submitted_job_when_full():
+    # Arrange - occupy the only worker and fill the queue
+    executor = ImageExecutor(max_workers=1, max_pending=2)
+    gate, job = blocker()
+    executor.submit(job)
+    ran = []
+    prefetch = executor.submit(ran.append, "prefetch", priority=PRIORITY_PREFETCH)
+    older = executor.submit(ran.append, "older")
+
+    # Act
+    newer = executor.submit(ran.append, "newer")
+    late_prefetch = executor.submit(ran.append, "late", priority=PRIORITY_PREFETCH)
+    gate.set()
+    await asyncio.gather(*(asyncio.wrap_future(f) for f in (older, newer)))
+
+    # Assert - prefetch made way for newer; nothing outranked by late is queued
+    assert prefetch.cancelled() and late_prefetch.cancelled()
+    assert ran == ["older", "newer"]
+    assert executor.stats()["cancelled"] == 2
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_run_callers_never_exceed_the_queue_bound():
+    # Arrange
+    executor = ImageExecutor(max_workers=1, max_pending=2)
+    gate, job = blocker()
+    executor.submit(job)
+    queued = []
+
+    def record():
+        queued.append(executor.stats()["queued"])
+
+    # Act
+    tasks = [asyncio.create_task(executor.run(record)) for _ in range(10)]
+    await asyncio.sleep(0.05)
+    queued_while_blocked = executor.stats()["queued"]
+    gate.set()
+    await asyncio.gather(*tasks)
+
+    # Assert
+    assert queued_while_blocked == 2
+    assert len(queued) == 10 and max(queued) <= 2
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_waiting_callers():
+    # Arrange
+    executor = ImageExecutor(max_workers=1, max_pending=1)
+    gate, job = blocker()
+    executor.submit(job)
+    executor.submit(lambda: None)
+    task = asyncio.create_task(executor.run(lambda: "never"))
+    await asyncio.sleep(0.01)
+
+    # Act
+    executor.shutdown(wait=False)
+    gate.set()
+
+    # Assert
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert executor.stats()["cancelled"] == 2
@@ -1,5 +1,7 @@
+import gc
 import os
 import tempfile
+import tracemalloc
 from pathlib import Path
 
 import pytest
@@ -183,3 +185,344 @@ def test_filter_methods(image_processor, sample_image, filter_name, expected_cha
     # Assert
     assert Path(result).exists()
     assert f"{filter_name}_no_scale" in result
+
+
+def test_same_named_images_do_not_collide(image_processor, tmp_path):
+    """Test that identically named files from different themes get separate outputs"""
+    # Arrange
+    business = tmp_path / "business" / "card_back.png"
+    medieval = tmp_path / "medieval" / "card_back.png"
+    for path, color in [(business, (0, 0, 255)), (medieval, (255, 0, 0))]:
+        path.parent.mkdir()
+        Image.new("RGB", (20, 20), color=color).save(path)
+
+    # Act
+    business_result = image_processor.process_image(str(business), filter_name="blur")
+    medieval_result = image_processor.process_image(str(medieval), filter_name="blur")
+
+    # Assert
+    assert business_result != medieval_result
+    assert Image.open(business_result).getpixel((10, 10))[2] == 255
+    assert Image.open(medieval_result).getpixel((10, 10))[0] == 255
+
+
+def test_identical_content_shares_output(image_processor, tmp_path):
+    """Test that cache keys are derived from content rather than location"""
+    # Arrange
+    first = tmp_path / "a.png"
+    second = tmp_path / "b.png"
+    Image.new("RGB", (20, 20), color=(9, 9, 9)).save(first)
+    second.write_bytes(first.read_bytes())
+
+    # Act & Assert
+    assert image_processor.process_image(str(first)) == image_processor.process_image(
+        str(second)
+    )
+
+
+def test_manifest_hit_needs_one_filesystem_call(image_processor, sample_image, mocker):
+    """Test that repeat lookups are answered from the in-memory manifest"""
+    # Arrange
+    first = image_processor.process_image(sample_image, filter_name="grayscale")
+    stat = mocker.spy(os, "stat")
+    hash_file = mocker.patch.object(ImageProcessor, "_hash_file")
+
+    # Act
+    second = image_processor.process_image(sample_image, filter_name="grayscale")
+
+    # Assert: only the check that the cached file was not evicted since
+    assert second == first
+    stat.assert_called_once_with(first)
+    hash_file.assert_not_called()
+
+
+def test_manifest_hit_for_evicted_file_is_rendered_again(image_processor, sample_image):
+    """Test that a file removed by cache gc is not returned from the manifest"""
+    # Arrange
+    first = image_processor.process_image(sample_image, filter_name="grayscale")
+    os.unlink(first)
+
+    # Act
+    second = image_processor.process_image(sample_image, filter_name="grayscale")
+
+    # Assert
+    assert second == first
+    assert os.path.exists(second)
+
+
+def test_digest_index_is_persisted(image_processor, sample_image, mocker):
+    """Test that a new processor reuses digests instead of re-hashing files"""
+    # Arrange
+    first = image_processor.process_image(sample_image)
+    fresh = ImageProcessor(cache_dir=image_processor.cache_dir)
+    hash_file = mocker.patch.object(ImageProcessor, "_hash_file")
+
+    # Act
+    second = fresh.process_image(sample_image)
+
+    # Assert
+    assert second == first
+    hash_file.assert_not_called()
+
+
+def test_changed_source_gets_new_output(image_processor, sample_image):
+    """Test that editing a source produces a new cache entry once forgotten"""
+    # Arrange
+    first = image_processor.process_image(sample_image)
+    Image.new("RGB", (60, 60), color=(1, 1, 1)).save(sample_image)
+
+    # Act
+    image_processor.forget(sample_image)
+    second = image_processor.process_image(sample_image)
+
+    # Assert
+    assert second != first
+    assert Image.open(second).size == (60, 60)
+
+
+def test_derivative_fits_box_at_density(image_processor, tmp_path):
+    """Test that derivatives are sized to the display box times the density"""
+    # Arrange
+    source = tmp_path / "art.png"
+    Image.new("RGB", (1536, 1024), color=(10, 20, 30)).save(source)
+
+    # Act
+    result = image_processor.derivative(str(source), 300, 240, density=2.0)
+
+    # Assert
+    with Image.open(result) as img:
+        assert img.size == (600, 400)  # aspect ratio kept inside 600x480
+
+
+def test_derivative_never_upscales(image_processor, sample_image):
+    """Test that sources smaller than the box are not enlarged"""
+    result = image_processor.derivative(sample_image, 300, 300, density=2.0)
+
+    with Image.open(result) as img:
+        assert img.size == (100, 100)
+
+
+def test_derivative_is_cached_per_box(image_processor, tmp_path):
+    """Test that each box size gets its own cached derivative"""
+    # Arrange
+    source = tmp_path / "art.png"
+    Image.new("RGB", (400, 400), color=(10, 20, 30)).save(source)
+
+    # Act
+    small = image_processor.derivative(str(source), 50, 50)
+    again = image_processor.derivative(str(source), 50, 50)
+    large = image_processor.derivative(str(source), 100, 100)
+
+    # Assert
+    assert small == again
+    assert small != large
+    assert Image.open(large).size == (100, 100)
+
+
+def test_pipeline_applies_chain_in_one_save(image_processor, sample_image, mocker):
+    """Test that a filter chain is applied in order and encoded once"""
+    # Arrange
+    save = mocker.spy(Image.Image, "save")
+
+    # Act
+    result = image_processor.process_image(sample_image, filter_name="grayscale+blur")
+
+    # Assert
+    assert "grayscale+blur_no_scale" in result
+    assert save.call_count == 1
+    assert Image.open(result).mode == "L"
+
+
+def test_pipeline_reuses_cached_prefix(image_processor, sample_image, mocker):
+    """Test that extending a rendered chain only runs the new steps"""
+    # Arrange
+    grayscale = mocker.spy(image_processor, "_apply_grayscale")
+    image_processor.filters["grayscale"] = image_processor._apply_grayscale
+    image_processor.process_pipeline(sample_image, ["grayscale"], scale=0.5)
+
+    # Act
+    result = image_processor.process_pipeline(sample_image, ["grayscale", "blur"], scale=0.5)
+
+    # Assert
+    assert grayscale.call_count == 1
+    assert image_processor.intermediate_hits == 1
+    assert "grayscale+blur_0.5" in result
+    assert Image.open(result).size == (50, 50)
+
+
+def test_intermediates_respect_budget(sample_image, tmp_path):
+    """Test that cached intermediates are evicted beyond the memory budget"""
+    # 100x100 RGB is 30000 bytes, so only one intermediate fits
+    processor = ImageProcessor(cache_dir=tmp_path, intermediate_budget=40000)
+
+    processor.process_pipeline(sample_image, ["blur"])
+
+    assert len(processor._intermediates) == 1
+    assert processor._intermediate_bytes <= 40000
+
+
+def test_profile_sets_output_format(image_processor, sample_image):
+    """Test that an encoding profile changes the output format and cache key"""
+    # Act
+    default = image_processor.process_image(sample_image)
+    webp = image_processor.process_image(sample_image, profile="card_art")
+
+    # Assert
+    assert default.endswith(".png")
+    assert webp.endswith("_card_art.webp")
+    assert Image.open(webp).format == "WEBP"
+
+
+def test_posterize_defaults_to_palette_png(image_processor, sample_image):
+    """Test that few-colour filter outputs are stored as palette images"""
+    result = image_processor.process_image(sample_image, filter_name="posterize")
+
+    assert "posterize_no_scale" in result
+    assert Image.open(result).mode == "P"
+
+
+def test_depletion_sprite_frames(image_processor, tmp_path):
+    """Test that the sprite stacks frames from empty (darkened) to full"""
+    # Arrange
+    source = tmp_path / "icon.png"
+    Image.new("RGBA", (40, 40), color=(200, 100, 50, 255)).save(source)
+
+    # Act
+    result = image_processor.depletion_sprite(str(source), 20, frames=3, profile="source")
+
+    # Assert
+    sprite = Image.open(result).convert("RGBA")
+    assert sprite.size == (20, 60)
+    dark = (80, 40, 20, 255)  # 40% of the colour, alpha kept
+    assert sprite.getpixel((10, 2)) == dark  # empty frame: all dark
+    assert sprite.getpixel((10, 22)) == dark  # half frame: top half dark...
+    assert sprite.getpixel((10, 38)) == (200, 100, 50, 255)  # ...bottom half lit
+    assert sprite.getpixel((10, 42)) == (200, 100, 50, 255)  # full frame
+
+
+def test_depletion_sprite_needs_two_frames(image_processor, sample_image):
+    """Test that a sprite needs at least the empty and full frames"""
+    with pytest.raises(ValueError):
+        image_processor.depletion_sprite(sample_image, 20, frames=1)
+
+
+def test_oversized_source_is_downscaled_on_decode(tmp_path):
+    """Test that sources over max_pixels are reduced before filtering"""
+    # Arrange
+    source = tmp_path / "huge.png"
+    Image.new("RGB", (400, 300), color=(10, 200, 30)).save(source)
+    processor = ImageProcessor(cache_dir=tmp_path / "cache", max_pixels=10_000)
+
+    # Act
+    output = processor.process_image(str(source), "grayscale")
+
+    # Assert
+    with Image.open(output) as result:
+        assert result.width * result.height <= 10_000
+        assert abs(result.width / result.height - 4 / 3) < 0.05
+    job = processor.last_job()
+    assert job["source_pixels"] == 120_000
+    assert job["decoded_pixels"] <= 10_000
+    # PNGs are decoded in full before the reduce
+    assert job["peak_bytes"] >= 120_000 * 3
+    assert processor.downscaled_sources == 1
+
+
+def test_oversized_jpeg_is_reduced_while_decoding(tmp_path):
+    """Test that JPEG sources over max_pixels are never decoded in full"""
+    # Arrange
+    source = tmp_path / "huge.jpg"
+    Image.new("RGB", (400, 300), color=(10, 200, 30)).save(source)
+    processor = ImageProcessor(cache_dir=tmp_path / "cache", max_pixels=10_000)
+
+    # Act
+    processor.process_image(str(source), "grayscale")
+
+    # Assert: decoded at half size by draft, then reduced
+    job = processor.last_job()
+    assert job["decoded_pixels"] <= 10_000
+    assert job["peak_bytes"] <= (200 * 150 + 10_000) * 3
+
+
+def test_last_job_is_cleared_on_cache_hits(image_processor, sample_image):
+    """Test that job stats describe renders only"""
+    image_processor.process_image(sample_image, "blur")
+    assert image_processor.last_job()["peak_bytes"] == 100 * 100 * 3 * 2
+
+    image_processor.process_image(sample_image, "blur")
+    assert image_processor.last_job() is None
+    assert image_processor.peak_job_bytes == 100 * 100 * 3 * 2
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc")
+def test_source_files_are_closed(image_processor, tmp_path):
+    """Test that processing leaves no source file handles open"""
+    # Arrange
+    paths = []
+    for i in range(50):
+        path = tmp_path / f"src{i}.png"
+        Image.new("RGB", (16, 16), color=(i, 0, 0)).save(path)
+        paths.append(path)
+    open_before = len(os.listdir("/proc/self/fd"))
+
+    # Act
+    for path in paths:
+        image_processor.process_image(str(path), "cartoon")
+        image_processor.derivative(str(path), 8, 8)
+        image_processor.depletion_sprite(str(path), 8, frames=3)
+
+    # Assert
+    assert len(os.listdir("/proc/self/fd")) <= open_before
+
+
+def test_memory_is_bounded_over_many_images(tmp_path):
+    """Test that Pillow-side Python allocations do not grow with image count"""
+    # Arrange
+    paths = []
+    for i in range(1200):
+        path = tmp_path / f"src{i}.png"
+        Image.new("RGB", (24, 24), color=(i % 256, i * 7 % 256, 90)).save(path)
+        paths.append(path)
+    processor = ImageProcessor(cache_dir=tmp_path / "cache", intermediate_budget=0)
+    for path in paths[:200]:
+        processor.process_image(str(path), "cartoon")
+
+    # Act
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for path in paths[200:]:
+            processor.process_image(str(path), "cartoon")
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    # Assert: unclosed or retained images would add ~270 bytes each here;
+    # the manifest and digest entries are expected to grow and are excluded
+    pil_only = [tracemalloc.Filter(True, "*PIL*")]
+    growth = sum(
+        stat.size_diff
+        for stat in after.filter_traces(pil_only).compare_to(
+            before.filter_traces(pil_only), "filename"
+        )
+    )
+    assert growth < 64 * 1024
+    assert processor.peak_job_bytes <= 24 * 24 * 3 * 2
+
+
+def test_cartoon_contrast_matches_image_enhance():
+    """Test that the lookup-table contrast matches ImageEnhance.Contrast"""
+    from PIL import ImageEnhance, ImageFilter
+
+    from swipe_verse.services.image_processor import _enhance_contrast
+
+    noise = Image.effect_noise((64, 48), 70)
+    edges = Image.merge("RGB", (noise, noise.rotate(90), noise.transpose(0))).filter(
+        ImageFilter.FIND_EDGES
+    )
+
+    expected = ImageEnhance.Contrast(edges).enhance(2.0)
+
+    assert _enhance_contrast(edges, 2.0).tobytes() == expected.tobytes()
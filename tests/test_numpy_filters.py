@@ -0,0 +1,110 @@
+import pytest
+from PIL import Image
+
+from swipe_verse.services import numpy_filters
+from swipe_verse.services.image_processor import ImageProcessor
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def sample_image():
+    """Create a noisy RGB test image with an odd size"""
+    size = (333, 217)
+    noise = Image.effect_noise(size, 80)
+    gradient = Image.linear_gradient("L").resize(size)
+    return Image.merge("RGB", (noise, gradient, noise.rotate(90)))
+
+
+@pytest.fixture
+def pil_processor(tmp_path):
+    """Create an ImageProcessor that uses the PIL filters"""
+    return ImageProcessor(cache_dir=tmp_path, backend="pil")
+
+
+@pytest.mark.parametrize("filter_name", ["grayscale", "posterize"])
+def test_kernel_matches_pil(pil_processor, sample_image, filter_name):
+    """Test that the exact kernels produce the same pixels as PIL"""
+    # Act
+    expected = pil_processor.filters[filter_name](sample_image)
+    result = numpy_filters.KERNELS[filter_name](sample_image)
+
+    # Assert
+    assert result.mode == expected.mode
+    assert np.array_equal(np.asarray(result), np.asarray(expected))
+
+
+def test_grayscale_ignores_alpha(sample_image):
+    """Test that RGBA images are converted like PIL's convert('L')"""
+    rgba = sample_image.convert("RGBA")
+
+    result = numpy_filters.grayscale(rgba)
+
+    assert np.array_equal(np.asarray(result), np.asarray(rgba.convert("L")))
+
+
+def test_pixelate_produces_uniform_blocks(pil_processor, sample_image):
+    """Test that pixelation keeps the size and matches PIL's block layout"""
+    # Act
+    expected = np.asarray(pil_processor.filters["pixelate"](sample_image))
+    result = np.asarray(numpy_filters.pixelate(sample_image))
+
+    # Assert
+    assert result.shape == expected.shape
+    assert (result != expected).mean() < 0.05
+    # Factor is 217 // 50 = 4, so the first block is a single colour
+    assert (result[:4, :4] == result[0, 0]).all()
+
+
+def test_cartoon_output(sample_image):
+    """Test that the cartoon kernel returns an RGB image with few colours"""
+    result = numpy_filters.cartoon(sample_image.convert("RGBA"))
+
+    assert result.mode == "RGB"
+    assert result.size == sample_image.size
+    assert result != sample_image
+
+
+def test_auto_backend_uses_kernels(tmp_path):
+    """Test that the numpy kernels replace the PIL filters when available"""
+    processor = ImageProcessor(cache_dir=tmp_path)
+
+    assert processor.backend == "numpy"
+    assert processor.filters["cartoon"] is numpy_filters.cartoon
+    # Filters where PIL is faster (or has no kernel) stay on PIL
+    assert processor.filters["grayscale"] == processor._apply_grayscale
+    assert processor.filters["blur"] == processor._apply_blur
+
+
+def test_backend_outputs_are_cached_separately(tmp_path):
+    """Test that PIL and numpy outputs do not share cache entries"""
+    # Arrange
+    source = tmp_path / "art.png"
+    Image.new("RGB", (80, 80), color=(200, 40, 90)).save(source)
+
+    # Act
+    pil = ImageProcessor(cache_dir=tmp_path, backend="pil")
+    fast = ImageProcessor(cache_dir=tmp_path, backend="numpy")
+
+    # Assert
+    assert pil.process_image(str(source), "cartoon") != fast.process_image(
+        str(source), "cartoon"
+    )
+    assert pil.process_image(str(source), "blur") == fast.process_image(
+        str(source), "blur"
+    )
+
+
+def test_falls_back_to_pil_without_numpy(tmp_path, monkeypatch):
+    """Test backend selection when numpy is not installed"""
+    monkeypatch.setattr(numpy_filters, "HAVE_NUMPY", False)
+
+    assert ImageProcessor(cache_dir=tmp_path).backend == "pil"
+    with pytest.raises(ImportError):
+        ImageProcessor(cache_dir=tmp_path, backend="numpy")
+
+
+def test_unknown_backend(tmp_path):
+    """Test that an unknown backend name is rejected"""
+    with pytest.raises(ValueError):
+        ImageProcessor(cache_dir=tmp_path, backend="opencv")
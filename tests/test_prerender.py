@@ -0,0 +1,165 @@
+import json
+
+import pytest
+from PIL import Image
+
+from swipe_verse.cli import run
+from swipe_verse.models.config import GameConfig
+from swipe_verse.services.asset_manager import AssetManager
+from swipe_verse.services.image_processor import ImageProcessor
+from swipe_verse.services.prerender import (
+    MANIFEST_NAME,
+    collect_theme_images,
+    prerender,
+)
+
+
+@pytest.fixture
+def scenario(tmp_path):
+    """Create a small scenario with its own theme images"""
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    for name, color in [("back", (0, 0, 0)), ("gold", (255, 215, 0)), ("art", (0, 128, 0))]:
+        Image.new("RGB", (40, 40), color=color).save(assets / f"{name}.png")
+
+    data = {
+        "game_info": {
+            "title": "Prerender Test",
+            "description": "Test",
+            "version": "1.0.0",
+            "author": "Test",
+        },
+        "theme": {
+            "name": "Test Theme",
+            "card_back": "assets/back.png",
+            "color_scheme": {"primary": "#000", "secondary": "#fff", "accent": "#f00"},
+            "resource_icons": {"gold": "assets/gold.png"},
+            "filters": {"default": "none", "available": ["grayscale"]},
+        },
+        "game_settings": {
+            "initial_resources": {"gold": 50},
+            "win_conditions": [],
+            "difficulty_modifiers": {"standard": 1.0},
+        },
+        "cards": [
+            {
+                "id": "c1",
+                "title": "Card",
+                "text": "Text",
+                "image": "assets/art.png",
+                "choices": {
+                    "left": {"text": "L", "effects": {"gold": 1}},
+                    "right": {"text": "R", "effects": {"gold": -1}},
+                },
+            },
+            {
+                "id": "c2",
+                "title": "Card 2",
+                "text": "Text",
+                "image": "https://example.com/remote.png",
+                "choices": {
+                    "left": {"text": "L", "effects": {}},
+                    "right": {"text": "R", "effects": {}},
+                },
+            },
+        ],
+    }
+    path = tmp_path / "test_game.json"
+    path.write_text(json.dumps(data))
+    return path
+
+
+def make_asset_manager(tmp_path):
+    return AssetManager(base_path=str(tmp_path), default_assets_path=str(tmp_path))
+
+
+def test_collect_theme_images_skips_urls(scenario, tmp_path):
+    # Arrange
+    config = GameConfig.model_validate(json.loads(scenario.read_text()))
+
+    # Act
+    images = collect_theme_images(config, make_asset_manager(tmp_path))
+
+    # Assert
+    assert [image.name for image in images] == ["back.png", "gold.png", "art.png"]
+
+
+def test_prerender_writes_every_variant_and_manifest(scenario, tmp_path):
+    # Arrange
+    config = GameConfig.model_validate(json.loads(scenario.read_text()))
+    images = collect_theme_images(config, make_asset_manager(tmp_path))
+    cache_dir = tmp_path / "cache"
+
+    # Act
+    report = prerender(
+        images,
+        filters=["grayscale", "pixelate"],
+        scales=[None, 0.5],
+        cache_dir=cache_dir,
+        workers=2,
+    )
+
+    # Assert
+    assert report["variants"] == 3 * 2 * 2
+    assert report["errors"] == []
+    assert set(report["per_filter"]) == {"grayscale", "pixelate"}
+    manifest = json.loads((cache_dir / MANIFEST_NAME).read_text())
+    assert len(manifest["variants"]) == 12
+    for variant in manifest["variants"]:
+        assert (cache_dir / variant["output"]).exists()
+
+
+@pytest.mark.asyncio
+async def test_app_finds_prerendered_variant(scenario, tmp_path):
+    # Arrange
+    cache_dir = tmp_path / "cache"
+    config = GameConfig.model_validate(json.loads(scenario.read_text()))
+    images = collect_theme_images(config, make_asset_manager(tmp_path))
+    report = prerender(images, filters=["cartoon"], cache_dir=cache_dir, workers=1)
+    manifest = json.loads((cache_dir / MANIFEST_NAME).read_text())
+    outputs = {variant["output"] for variant in manifest["variants"]}
+    mtimes = {output: (cache_dir / output).stat().st_mtime_ns for output in outputs}
+
+    manager = AssetManager(
+        base_path=str(tmp_path),
+        default_assets_path=str(tmp_path),
+        image_processor=ImageProcessor(cache_dir=cache_dir),
+    )
+
+    # Act
+    result = await manager.get_image("assets/back.png", filter_type="cartoon")
+
+    # Assert
+    assert report["variants"] == 3
+    assert result in outputs
+    assert (cache_dir / result).stat().st_mtime_ns == mtimes[result]
+
+
+def test_cli_prerender(scenario, tmp_path, capsys):
+    # Act
+    code = run(
+        [
+            "prerender",
+            str(scenario),
+            "--filters",
+            "grayscale",
+            "--workers",
+            "1",
+            "--assets",
+            str(tmp_path),
+            "--cache-dir",
+            str(tmp_path / "cache"),
+        ]
+    )
+
+    # Assert
+    output = capsys.readouterr().out
+    assert code == 0
+    assert "Rendered 3 variants of 3 images" in output
+    assert "grayscale" in output
+
+
+def test_cli_prerender_unknown_scenario():
+    with pytest.raises(SystemExit) as excinfo:
+        run(["prerender", "no_such_universe"])
+    assert excinfo.value.code == 2
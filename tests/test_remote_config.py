@@ -0,0 +1,195 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import web
+
+from swipe_verse.cli import run
+from swipe_verse.services.cache_manager import CacheManager
+from swipe_verse.services.config_loader import ConfigLoader
+from swipe_verse.services.remote_config import RemoteConfigCache
+from swipe_verse.services.scenario_catalog import SCENARIOS_DIR
+
+KINGDOM = (SCENARIOS_DIR / "kingdom_game.json").read_bytes()
+TUTORIAL = (SCENARIOS_DIR / "tutorial_game.json").read_bytes()
+
+
+@asynccontextmanager
+async def serve(handler):
+    """Run a local aiohttp server answering /game.json for the block"""
+    app = web.Application()
+    app.add_routes([web.get("/game.json", handler)])
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}/game.json"
+    finally:
+        await runner.cleanup()
+
+
+class Origin:
+    """A scenario server that honours conditional requests"""
+
+    def __init__(self, body=KINGDOM, etag='"v1"', last_modified=None):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.status = 200
+        self.requests = []
+
+    async def handle(self, request):
+        self.requests.append(dict(request.headers))
+        if self.status != 200:
+            return web.Response(status=self.status)
+        headers = {}
+        if self.etag:
+            headers["ETag"] = self.etag
+        if self.last_modified:
+            headers["Last-Modified"] = self.last_modified
+        if (self.etag and request.headers.get("If-None-Match") == self.etag) or (
+            self.last_modified
+            and request.headers.get("If-Modified-Since") == self.last_modified
+        ):
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=self.body, headers=headers)
+
+
+@pytest.mark.asyncio
+async def test_revalidates_with_etag(tmp_path):
+    origin = Origin()
+    cache = RemoteConfigCache(cache_dir=tmp_path)
+    async with serve(origin.handle) as url:
+        first = await cache.fetch(url)
+        second = await cache.fetch(url)
+
+        origin.body, origin.etag = TUTORIAL, '"v2"'
+        third = await cache.fetch(url)
+
+    assert first == second == third
+    assert third.read_bytes() == TUTORIAL
+    assert [r.get("If-None-Match") for r in origin.requests] == [None, '"v1"', '"v1"']
+    assert (cache.downloads, cache.not_modified) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_revalidates_with_last_modified(tmp_path):
+    origin = Origin(etag=None, last_modified="Wed, 21 Oct 2026 07:28:00 GMT")
+    cache = RemoteConfigCache(cache_dir=tmp_path)
+    async with serve(origin.handle) as url:
+        await cache.fetch(url)
+        await cache.fetch(url)
+
+    assert origin.requests[1]["If-Modified-Since"] == origin.last_modified
+    assert "If-None-Match" not in origin.requests[1]
+    assert cache.not_modified == 1
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_cached_copy_when_server_fails(tmp_path):
+    origin = Origin()
+    cache = RemoteConfigCache(cache_dir=tmp_path)
+    async with serve(origin.handle) as url:
+        path = await cache.fetch(url)
+        origin.status = 500
+        assert await cache.fetch(url) == path
+
+        with pytest.raises(Exception, match="status 500"):
+            await RemoteConfigCache(cache_dir=tmp_path / "empty").fetch(url)
+
+
+@pytest.mark.asyncio
+async def test_invalid_body_does_not_replace_cached_copy(tmp_path):
+    origin = Origin()
+    cache = RemoteConfigCache(cache_dir=tmp_path)
+    async with serve(origin.handle) as url:
+        path = await cache.fetch(url)
+        origin.body, origin.etag = b"<html>Bad gateway", '"broken"'
+        await cache.fetch(url)
+
+    assert path.read_bytes() == KINGDOM
+
+
+@pytest.mark.asyncio
+async def test_stale_mode_serves_cache_and_refreshes_in_background(tmp_path):
+    origin = Origin()
+    async with serve(origin.handle) as url:
+        await RemoteConfigCache(cache_dir=tmp_path).fetch(url)
+        origin.body, origin.etag = TUTORIAL, '"v2"'
+
+        cache = RemoteConfigCache(cache_dir=tmp_path, mode="stale")
+        path = await cache.fetch(url)
+        assert path.read_bytes() == KINGDOM
+
+        await asyncio.to_thread(cache.wait)
+
+    assert path.read_bytes() == TUTORIAL
+    assert (cache.hits, cache.downloads) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_offline_mode_never_uses_the_network(tmp_path):
+    origin = Origin()
+    async with serve(origin.handle) as url:
+        await RemoteConfigCache(cache_dir=tmp_path).fetch(url)
+        cache = RemoteConfigCache(cache_dir=tmp_path, mode="offline")
+
+        assert (await cache.fetch(url)).read_bytes() == KINGDOM
+        with pytest.raises(FileNotFoundError):
+            await cache.fetch(url + "?other")
+
+    assert len(origin.requests) == 1
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        RemoteConfigCache(mode="sometimes")
+
+
+@pytest.mark.asyncio
+async def test_config_loader_uses_remote_cache(tmp_path):
+    origin = Origin(body=TUTORIAL)
+    cache_manager = CacheManager(root=tmp_path)
+    loader = ConfigLoader(remote_cache=RemoteConfigCache(cache_manager=cache_manager))
+    async with serve(origin.handle) as url:
+        config = await loader.load_config(url)
+
+    # The server is gone; the cached copy still loads
+    offline = ConfigLoader(
+        remote_cache=RemoteConfigCache(cache_manager=cache_manager, mode="offline")
+    )
+    cached = await offline.load_config(url)
+
+    expected = json.loads(TUTORIAL)["game_info"]["title"]
+    assert config.game_info.title == cached.game_info.title == expected
+    stats = cache_manager.stats()["namespaces"]["downloads"]
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_config_loader_does_not_fall_back_for_urls(tmp_path):
+    origin = Origin()
+    origin.status = 500
+    online = ConfigLoader(remote_cache=RemoteConfigCache(cache_dir=tmp_path))
+    offline = ConfigLoader(
+        remote_cache=RemoteConfigCache(cache_dir=tmp_path, mode="offline")
+    )
+    async with serve(origin.handle) as url:
+        # Neither loads the bundled kingdom scenario in place of the URL
+        with pytest.raises(Exception, match="status 500"):
+            await online.load_config(url)
+        with pytest.raises(FileNotFoundError):
+            await offline.load_config(url)
+
+
+def test_play_command_passes_offline_to_the_app(mocker):
+    app = mocker.patch("flet.app")
+
+    assert run(["play", "kingdom", "--offline"]) == 0
+
+    target = app.call_args.kwargs["target"]
+    assert target.keywords["offline"] is True
+    assert target.keywords["config_path"] == str(SCENARIOS_DIR / "kingdom_game.json")
@@ -0,0 +1,115 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from swipe_verse.services.cache_manager import CacheManager
+from swipe_verse.services.config_loader import ConfigLoader
+from swipe_verse.services.scenario_catalog import (
+    SCENARIOS_DIR,
+    ScenarioCatalog,
+    build_manifest,
+)
+
+
+@pytest.fixture
+def scenarios(tmp_path):
+    directory = tmp_path / "scenarios"
+    directory.mkdir()
+    for name in ("kingdom_game.json", "tutorial_game.json"):
+        shutil.copy(SCENARIOS_DIR / name, directory / name)
+    return directory
+
+
+@pytest.mark.asyncio
+async def test_build_manifest_matches_full_config():
+    path = SCENARIOS_DIR / "kingdom_game.json"
+    config = await ConfigLoader().load_config(str(path))
+
+    manifest = build_manifest(path)
+
+    assert manifest.path == str(path)
+    assert manifest.game_info == config.game_info
+    assert manifest.theme.card_back == config.theme.card_back
+    assert manifest.theme.resource_icons == config.theme.resource_icons
+    assert manifest.card_count == len(config.cards)
+    assert manifest.resource_count == len(config.game_settings.initial_resources)
+
+
+@pytest.mark.asyncio
+async def test_scan_lists_scenarios_in_order(scenarios, tmp_path):
+    catalog = ScenarioCatalog(directory=scenarios, cache_dir=tmp_path / "cache")
+
+    manifests = await catalog.scan()
+
+    assert [os.path.basename(m.path) for m in manifests] == [
+        "kingdom_game.json",
+        "tutorial_game.json",
+    ]
+    assert catalog.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_scan_reuses_cached_manifests(scenarios, tmp_path):
+    cache_dir = tmp_path / "cache"
+    first = await ScenarioCatalog(directory=scenarios, cache_dir=cache_dir).scan()
+
+    catalog = ScenarioCatalog(directory=scenarios, cache_dir=cache_dir)
+    second = await catalog.scan()
+
+    assert second == first
+    assert (catalog.hits, catalog.misses) == (2, 0)
+
+
+@pytest.mark.asyncio
+async def test_scan_rebuilds_manifest_of_edited_file(scenarios, tmp_path):
+    cache_dir = tmp_path / "cache"
+    await ScenarioCatalog(directory=scenarios, cache_dir=cache_dir).scan()
+    path = scenarios / "tutorial_game.json"
+    data = json.loads(path.read_text())
+    data["game_info"]["title"] = "Edited"
+    path.write_text(json.dumps(data))
+
+    catalog = ScenarioCatalog(directory=scenarios, cache_dir=cache_dir)
+    manifests = await catalog.scan()
+
+    assert manifests[1].game_info.title == "Edited"
+    assert (catalog.hits, catalog.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_scan_skips_invalid_scenarios(scenarios, tmp_path):
+    (scenarios / "broken_game.json").write_text('{"game_info": ')
+    (scenarios / "headless_game.json").write_text('{"cards": []}')
+    catalog = ScenarioCatalog(directory=scenarios, cache_dir=tmp_path / "cache")
+
+    manifests = await catalog.scan()
+
+    assert len(manifests) == 2
+
+
+def test_corrupt_cache_entry_is_discarded(scenarios, tmp_path):
+    catalog = ScenarioCatalog(directory=scenarios, cache_dir=tmp_path / "cache")
+    path = scenarios / "kingdom_game.json"
+    catalog.manifest(path)
+    entry_path = catalog._entry_path(path)
+    entry_path.write_text("not json")
+
+    manifest = catalog.manifest(path)
+
+    assert manifest is not None
+    assert json.loads(entry_path.read_text())["manifest"]["path"] == str(path)
+
+
+def test_manifests_are_tracked_by_cache_manager(scenarios, tmp_path):
+    cache_manager = CacheManager(root=tmp_path / "root")
+    catalog = ScenarioCatalog(directory=scenarios, cache_manager=cache_manager)
+    path = scenarios / "kingdom_game.json"
+
+    catalog.manifest(path)
+    catalog.manifest(path)
+
+    assert catalog.cache_dir == cache_manager.path("configs")
+    stats = cache_manager.stats()["namespaces"]["configs"]
+    assert (stats["files"], stats["hits"], stats["misses"]) == (1, 1, 1)
@@ -0,0 +1,106 @@
+import json
+
+import pytest
+
+from swipe_verse.cli import run
+from swipe_verse.models.config import GameConfig
+from swipe_verse.services.scenario_catalog import SCENARIOS_DIR
+from swipe_verse.services.scenario_graph import ScenarioGraph, has_errors
+from swipe_verse.services.scenario_pack import open_pack, write_pack
+
+
+def load(name):
+    return GameConfig.model_validate_json((SCENARIOS_DIR / name).read_bytes())
+
+
+def graph(links):
+    return ScenarioGraph(list(links), list(links.values()))
+
+
+def test_bundled_scenarios_have_no_errors():
+    for path in sorted(SCENARIOS_DIR.glob("*_game.json")):
+        report = ScenarioGraph.from_cards(load(path.name).cards).analyze()
+        assert not has_errors(report), path
+
+
+def test_dangling_links_and_dead_ends():
+    report = graph(
+        {
+            "a": {"left": "b", "right": "missing"},
+            "b": {},
+        }
+    ).analyze()
+
+    assert report["dangling"] == [{"card": "a", "direction": "right", "target": "missing"}]
+    assert report["dead_ends"] == ["b"]
+    assert report["links"] == 1
+    assert has_errors(report)
+
+
+def test_cycles_that_draw_a_card_are_not_forced():
+    report = graph(
+        {
+            "a": {"left": "b", "right": None},
+            "b": {"left": "a", "right": "a"},
+            "c": {"left": "d", "right": "d"},
+            "d": {"left": "c", "right": "d"},
+            "e": {"left": "e", "right": None},
+        }
+    ).analyze()
+
+    assert report["cycles"] == [["a", "b"], ["c", "d"], ["e"]]
+    assert report["forced_cycles"] == [["c", "d"]]
+
+
+def test_unreachable_from_start_card():
+    cards = graph(
+        {
+            "start": {"left": "middle", "right": "middle"},
+            "middle": {"left": "start", "right": "start"},
+            "other": {"left": None, "right": None},
+        }
+    )
+
+    assert cards.analyze()["unreachable"] == []
+    assert cards.analyze("start")["unreachable"] == ["other"]
+    # A random draw can reach every card
+    assert cards.analyze("other")["unreachable"] == []
+    with pytest.raises(ValueError):
+        cards.analyze("nowhere")
+
+
+def test_long_chains_do_not_recurse():
+    count = 100_000
+    links = {f"card{i}": {"left": f"card{(i + 1) % count}"} for i in range(count)}
+
+    report = graph(links).analyze("card0")
+
+    assert len(report["forced_cycles"]) == 1
+    assert len(report["forced_cycles"][0]) == count
+    assert report["unreachable"] == []
+
+
+def test_pack_stores_report(tmp_path):
+    config = load("tutorial_game.json")
+    path = tmp_path / "tutorial.svpack"
+    write_pack(config, path)
+
+    cards = open_pack(path).cards
+
+    assert cards.graph_report() == ScenarioGraph.from_cards(config.cards).analyze()
+
+
+def test_cli_analyze(tmp_path, capsys):
+    broken = tmp_path / "broken_game.json"
+    data = json.loads((SCENARIOS_DIR / "kingdom_game.json").read_text())
+    data["cards"][0]["choices"]["left"]["next_card"] = "missing"
+    broken.write_text(json.dumps(data))
+
+    assert run(["analyze", "kingdom", "tutorial"]) == 0
+    assert run(["analyze", "kingdom", str(broken)]) == 1
+    out = capsys.readouterr().out
+    assert "dangling link" in out and "missing" in out
+
+    assert run(["analyze", str(broken), "--json"]) == 1
+    reports = json.loads(capsys.readouterr().out)
+    assert reports[str(broken)]["dangling"][0]["target"] == "missing"
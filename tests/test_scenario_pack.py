@@ -0,0 +1,137 @@
+import pytest
+
+from swipe_verse.cli import run
+from swipe_verse.models.config import GameConfig
+from swipe_verse.models.game_state import GameState
+from swipe_verse.services.config_loader import ConfigLoader
+from swipe_verse.services.game_logic import GameLogic
+from swipe_verse.services.scenario_catalog import SCENARIOS_DIR
+from swipe_verse.services.scenario_pack import (
+    PackedCardStore,
+    is_pack,
+    open_pack,
+    write_pack,
+)
+
+
+def load(name):
+    return GameConfig.model_validate_json((SCENARIOS_DIR / name).read_bytes())
+
+
+@pytest.fixture
+def config():
+    config = load("kingdom_game.json")
+    cards = config.cards
+    # A choice direction only some cards have, a dangling next_card, a
+    # repeated id, non-ASCII text and an effect on an extra resource
+    cards[0].choices["up"] = cards[0].choices["left"].model_copy(
+        update={"text": "Höher ☺", "effects": {"gold": -7}, "next_card": "nowhere"}
+    )
+    cards[1] = cards[1].model_copy(update={"id": "é_card"})
+    cards.append(cards[2].model_copy(update={"title": "Duplicate"}))
+    return config
+
+
+@pytest.mark.parametrize(
+    "name", ["kingdom_game.json", "business_game.json", "tutorial_game.json"]
+)
+def test_pack_round_trips_bundled_scenarios(name, tmp_path):
+    config = load(name)
+    path = tmp_path / "scenario.svpack"
+
+    stats = write_pack(config, path)
+    packed = open_pack(path)
+
+    assert stats["cards"] == len(config.cards)
+    assert stats["bytes"] == path.stat().st_size
+    assert isinstance(packed.cards, PackedCardStore)
+    assert packed.game_info == config.game_info
+    assert packed.theme == config.theme
+    assert packed.game_settings == config.game_settings
+    assert list(packed.cards) == config.cards
+
+
+def test_packed_cards_lookup(config, tmp_path):
+    path = tmp_path / "scenario.svpack"
+    write_pack(config, path)
+
+    cards = open_pack(path).cards
+
+    assert len(cards) == len(config.cards)
+    assert cards[-1] == config.cards[-1]
+    assert cards[0].choices["up"].effects == {"gold": -7}
+    assert cards[0].choices["up"].next_card == "nowhere"
+    assert "up" not in cards[1].choices
+    assert cards.get("é_card") == config.cards[1]
+    # The first card with a repeated id wins, as in a linear search
+    assert cards.get(config.cards[2].id).title == config.cards[2].title
+    assert cards.get("missing") is None
+    assert cards.ids() == [card.id for card in config.cards]
+
+    next_id = config.cards[0].choices["left"].next_card
+    expected = cards.index_of(next_id) if next_id else None
+    assert cards.next_index(0, "left") == expected
+    assert cards.next_index(0, "up") is None
+
+
+def test_random_card_skips_ids(config, tmp_path):
+    path = tmp_path / "scenario.svpack"
+    write_pack(config, path)
+    cards = open_pack(path).cards
+    ids = cards.ids()
+
+    picked = {cards.random_card(skip_ids=set(ids[1:])).id for _ in range(10)}
+
+    assert picked == {ids[0]}
+    assert cards.random_card(skip_ids=set(ids)) is None
+
+
+def test_rejects_invalid_packs(config, tmp_path):
+    path = tmp_path / "scenario.svpack"
+    write_pack(config, path)
+    data = path.read_bytes()
+
+    not_pack = tmp_path / "not.svpack"
+    not_pack.write_bytes(b"{}" * 64)
+    truncated = tmp_path / "truncated.svpack"
+    truncated.write_bytes(data[:-8])
+    newer = tmp_path / "newer.svpack"
+    newer.write_bytes(data[:8] + b"\x63\x00" + data[10:])
+
+    for bad in (not_pack, truncated, newer):
+        with pytest.raises(ValueError):
+            open_pack(bad)
+    assert is_pack(path)
+    assert not is_pack(not_pack)
+
+
+def test_rejects_too_many_resources(config, tmp_path):
+    config.cards[0].choices["left"].effects = {f"r{i}": 1 for i in range(70)}
+
+    with pytest.raises(ValueError):
+        write_pack(config, tmp_path / "scenario.svpack")
+
+
+@pytest.mark.asyncio
+async def test_loader_opens_packs_and_game_plays(config, tmp_path):
+    path = tmp_path / "scenario.svpack"
+    write_pack(config, path)
+
+    loaded = await ConfigLoader().load_config(str(path))
+    game_state = GameState.new_game(loaded)
+    game_logic = GameLogic(game_state, loaded)
+    game_logic.process_choice("left")
+
+    assert isinstance(loaded.cards, PackedCardStore)
+    assert game_state.turn_count == 1
+    # The fixture repeats an id, so the drawn card may be either copy
+    assert game_state.current_card in list(game_logic.cards)
+
+
+def test_cli_pack(tmp_path, capsys):
+    output = tmp_path / "kingdom.svpack"
+
+    assert run(["pack", "kingdom", "-o", str(output)]) == 0
+
+    assert "Packed 4 cards" in capsys.readouterr().out
+    assert list(open_pack(output).cards) == load("kingdom_game.json").cards
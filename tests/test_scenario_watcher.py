@@ -0,0 +1,176 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from swipe_verse.cli import run
+from swipe_verse.models.config import Card, GameConfig
+from swipe_verse.models.game_state import GameState
+from swipe_verse.services.card_store import open_scenario
+from swipe_verse.services.config_loader import ConfigLoader
+from swipe_verse.services.game_logic import GameLogic
+from swipe_verse.services.scenario_catalog import SCENARIOS_DIR
+from swipe_verse.services.scenario_watcher import ScenarioWatcher
+
+
+@pytest.fixture
+def scenario(tmp_path):
+    data = json.loads((SCENARIOS_DIR / "kingdom_game.json").read_text())
+    path = tmp_path / "kingdom_game.json"
+    path.write_text(json.dumps(data))
+    return path, data
+
+
+def save(path, data):
+    """Write the file and move its mtime on, as a later save would"""
+    path.write_text(json.dumps(data))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def start_game(path):
+    config = GameConfig.model_validate_json(path.read_bytes())
+    game_state = GameState.new_game(config)
+    game_logic = GameLogic(game_state, config)
+    return config, game_state, game_logic
+
+
+def test_edited_card_is_swapped_in_without_resetting_the_game(scenario):
+    path, data = scenario
+    config, game_state, game_logic = start_game(path)
+    game_state.current_card = game_logic.cards.get(data["cards"][0]["id"])
+    game_state.turn_count = 7
+    game_state.resources["treasury"] = 12
+    untouched = config.cards[1:]
+    watcher = ScenarioWatcher(path, config, game_logic=game_logic)
+
+    data["cards"][0]["title"] = "Edited"
+    save(path, data)
+    update = watcher.check()
+
+    assert update["changed"] == [data["cards"][0]["id"]]
+    assert update["added"] == update["removed"] == update["sections"] == []
+    assert config.cards[0].title == "Edited"
+    assert all(a is b for a, b in zip(config.cards[1:], untouched))
+    assert game_state.current_card.title == "Edited"
+    assert game_logic.cards.get(data["cards"][0]["id"]).title == "Edited"
+    assert (game_state.turn_count, game_state.resources["treasury"]) == (7, 12)
+    assert watcher.check() is None
+
+
+def test_added_removed_cards_and_sections(scenario):
+    path, data = scenario
+    config, game_state, game_logic = start_game(path)
+    watcher = ScenarioWatcher(path, config, game_logic=game_logic)
+    removed = data["cards"].pop()
+    data["cards"].append({**data["cards"][0], "id": "new_card"})
+    data["game_settings"]["initial_resources"]["gold"] = 30
+    data["theme"]["name"] = "Night"
+
+    save(path, data)
+    update = watcher.check()
+
+    assert update["added"] == ["new_card"]
+    assert update["removed"] == [removed["id"]]
+    assert update["sections"] == ["theme", "game_settings"]
+    assert [card.id for card in config.cards] == [card["id"] for card in data["cards"]]
+    assert game_logic.cards.get(removed["id"]) is None
+    assert game_state.theme.name == "Night"
+    assert game_state.resources["gold"] == 30
+
+
+def test_only_changed_cards_are_validated(scenario, mocker):
+    path, data = scenario
+    data["cards"] = [
+        {**data["cards"][i % len(data["cards"])], "id": f"card_{i}"} for i in range(2000)
+    ]
+    save(path, data)
+    config, _, _ = start_game(path)
+    watcher = ScenarioWatcher(path, config)
+    validate = mocker.spy(Card, "model_validate")
+
+    data["cards"][1234]["text"] = "Edited"
+    save(path, data)
+    update = watcher.check()
+
+    assert update["changed"] == ["card_1234"]
+    assert validate.call_count == 1
+
+
+def test_bad_edits_keep_the_last_good_version(scenario, capsys):
+    path, data = scenario
+    config, _, _ = start_game(path)
+    watcher = ScenarioWatcher(path, config)
+    cards = config.cards
+
+    path.write_text(json.dumps(data)[:-20])
+    assert watcher.check() is None
+    data["cards"][0]["choices"] = "none"
+    save(path, data)
+    assert watcher.check() is None
+
+    assert config.cards is cards
+    assert capsys.readouterr().out.count("Error reloading scenario") == 2
+
+    data["cards"][0]["choices"] = {}
+    save(path, data)
+    assert watcher.check()["changed"] == [data["cards"][0]["id"]]
+
+
+def test_polls_on_a_thread(scenario):
+    path, data = scenario
+    config, _, _ = start_game(path)
+    updates = []
+    watcher = ScenarioWatcher(path, config, interval=0.01, on_reload=updates.append)
+    watcher.start()
+    try:
+        data["game_info"]["title"] = "Polled"
+        save(path, data)
+        deadline = time.monotonic() + 5
+        while not updates and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        watcher.stop()
+
+    assert updates[0]["sections"] == ["game_info"]
+    assert config.game_info.title == "Polled"
+
+
+def test_reload_waits_for_a_choice_in_progress(scenario):
+    path, data = scenario
+    config, game_state, game_logic = start_game(path)
+    watcher = ScenarioWatcher(path, config, game_logic=game_logic)
+    data["game_settings"]["initial_resources"]["morale"] = 40
+    save(path, data)
+
+    # Hold the game as process_choice does while the watcher reloads
+    with game_logic._lock:
+        reload = threading.Thread(target=watcher.check)
+        reload.start()
+        reload.join(0.2)
+        assert reload.is_alive()
+        assert "morale" not in game_state.resources
+    reload.join(5)
+
+    assert game_state.resources["morale"] == 40
+
+
+def test_lazy_scenarios_and_urls_cannot_be_watched(scenario):
+    path, _ = scenario
+    with pytest.raises(ValueError):
+        ScenarioWatcher(path, open_scenario(path))
+    with pytest.raises(ValueError):
+        ConfigLoader().watch("https://example.com/game.json", open_scenario(path))
+
+
+def test_play_command_watches_the_scenario(scenario, mocker):
+    path, _ = scenario
+    app = mocker.patch("flet.app")
+
+    assert run(["play", str(path), "--watch"]) == 0
+
+    target = app.call_args.kwargs["target"]
+    assert target.keywords["watch_scenario"] is True
+    assert target.keywords["config_path"] == str(path.resolve())
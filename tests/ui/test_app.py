@@ -50,10 +50,14 @@ def mock_services(mocker):
     mock_image_processor = mocker.MagicMock()
     mocker.patch("swipe_verse.ui.app.ImageProcessor", return_value=mock_image_processor)
 
+    mock_cache_manager = mocker.MagicMock()
+    mocker.patch("swipe_verse.ui.app.CacheManager", return_value=mock_cache_manager)
+
     return {
         "config_loader": mock_config_loader,
         "asset_manager": mock_asset_manager,
         "image_processor": mock_image_processor,
+        "cache_manager": mock_cache_manager,
     }
 
 
@@ -174,6 +178,7 @@ async def test_app_initialization(app, mock_page, mock_services):
     assert app.config_loader is mock_services["config_loader"]
     assert app.asset_manager is mock_services["asset_manager"]
     assert app.image_processor is mock_services["image_processor"]
+    assert app.cache_manager is mock_services["cache_manager"]
 
 
 @pytest.mark.asyncio
@@ -339,6 +344,7 @@ async def test_navigate_to_game_with_state(
         game_logic=app.game_logic,
         on_new_game=mocker.ANY,
         on_main_menu=mocker.ANY,
+        asset_manager=app.asset_manager,
     )
 
     # Verify the page was updated
@@ -461,3 +467,26 @@ async def test_new_game(app, mock_game_state, mocker):
 
     # Verify navigate_to was called
     app.navigate_to.assert_called_once_with("game")
+
+
+@pytest.mark.asyncio
+async def test_close_shuts_down_image_pool(app, mock_page, mock_services, mocker):
+    """Test that the image worker pool is shut down when the session ends"""
+    executor = mock_services["asset_manager"].executor
+
+    # The page's close handler releases the pool
+    mock_page.on_close(mocker.MagicMock())
+
+    executor.shutdown.assert_called_once_with(wait=False)
+
+
+@pytest.mark.asyncio
+async def test_close_stops_scenario_watcher(app, mocker):
+    """Test that a scenario being watched stops being polled when the session ends"""
+    watcher = mocker.MagicMock()
+    app.scenario_watcher = watcher
+
+    app.close()
+
+    watcher.stop.assert_called_once()
+    assert app.scenario_watcher is None
@@ -0,0 +1,33 @@
+import flet as ft
+
+from swipe_verse.ui.components.atlas_image import AtlasImage
+
+
+def test_region_is_scaled_and_offset():
+    """Test that the page is scaled so the region fills the box and is clipped to it"""
+    # Arrange
+    region = {"page": 0, "x": 64, "y": 10, "w": 60, "h": 60}
+
+    # Act
+    image = AtlasImage({"src": "atlas_0.png"}, (256, 128), region, width=30, height=30)
+
+    # Assert
+    clip = image.content
+    assert isinstance(clip, ft.Stack)
+    assert clip.clip_behavior == ft.ClipBehavior.HARD_EDGE
+    assert (clip.width, clip.height) == (30, 30)
+    page = image.page_image
+    assert page.src == "atlas_0.png"
+    assert (page.width, page.height) == (128, 64)
+    assert (page.left, page.top) == (-32, -5)
+
+
+def test_region_keeps_aspect_ratio():
+    """Test that a region is fitted inside the box like ImageFit.CONTAIN"""
+    region = {"page": 0, "x": 0, "y": 0, "w": 100, "h": 50}
+
+    image = AtlasImage({"src_base64": "AAAA"}, (100, 50), region, width=40, height=40)
+
+    assert (image.content.width, image.content.height) == (40, 20)
+    assert (image.width, image.height) == (40, 40)
+    assert image.page_image.src_base64 == "AAAA"
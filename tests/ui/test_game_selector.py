@@ -1,10 +1,20 @@
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import flet as ft
 
-from swipe_verse.models.config import GameConfig, GameInfo, Theme
+from swipe_verse.models.config import (
+    GameConfig,
+    GameInfo,
+    ScenarioManifest,
+    Theme,
+    ThemeSummary,
+)
+from swipe_verse.services.atlas import Atlas
+from swipe_verse.services.scenario_catalog import ScenarioCatalog
+from swipe_verse.ui.components.atlas_image import AtlasImage
 from swipe_verse.ui.components.game_selector import GameCard, GameSelector
 
 
@@ -25,54 +35,13 @@ class TestGameSelector(unittest.TestCase):
             width=800
         )
 
-    @patch('swipe_verse.ui.components.game_selector.ConfigLoader')
-    def test_init_creates_scroll_container(self, mock_config_loader_cls):
+    @patch('swipe_verse.ui.components.game_selector.ScenarioCatalog')
+    def test_init_creates_scroll_container(self, mock_catalog_cls):
         """Test that the GameSelector initializes with a scroll container."""
         self.assertIsInstance(self.selector.scroll_container, ft.Container)
         self.assertIsInstance(self.selector.scroll_container.content, ft.Row)
         self.assertEqual(self.selector.scroll_container.width, 700)  # 800 - 100 for buttons
 
-    @patch('swipe_verse.ui.components.game_selector.ConfigLoader')
-    @patch('swipe_verse.ui.components.game_selector.Path')
-    async def test_load_games_loads_configs(self, mock_path, mock_config_loader_cls):
-        """Test that load_games loads game configs."""
-        # Configure mock config loader
-        mock_config_loader = mock_config_loader_cls.return_value
-        mock_config_loader.load_config = AsyncMock()
-        
-        # Create mock config
-        mock_config = MagicMock(spec=GameConfig)
-        mock_config.theme = MagicMock(spec=Theme)
-        mock_config.theme.card_back = "test_card_back.png"
-        mock_config.theme.resource_icons = {"resource1": "icon1.png", "resource2": "icon2.png"}
-        mock_config.game_info = MagicMock(spec=GameInfo)
-        mock_config.game_info.title = "Test Game"
-        mock_config.game_info.description = "Test Description"
-        mock_config.game_info.backstory = "This is a test game backstory."
-        
-        mock_config_loader.load_config.return_value = mock_config
-        
-        # Configure mock Path
-        mock_path_instance = MagicMock()
-        mock_path.return_value = mock_path_instance
-        mock_path_instance.parent.parent.parent = mock_path_instance
-        mock_path_instance.__truediv__.return_value = mock_path_instance
-        
-        # Mock glob to return a list of game files
-        mock_path_instance.glob.return_value = [Path("test_game.json")]
-        
-        # Call load_games
-        await self.selector.load_games(self.mock_page)
-        
-        # Check that load_config was called
-        mock_config_loader.load_config.assert_called_once()
-        
-        # Check that a game card was added
-        self.assertEqual(len(self.selector.game_cards), 2)  # 1 game + 1 multiverse portal
-        
-        # First card should be a GameCard
-        self.assertIsInstance(self.selector.game_cards[0], GameCard)
-
     def test_scroll_left_updates_position(self):
         """Test that _scroll_left updates the scroll position."""
         # Set up a mock row
@@ -191,6 +160,126 @@ class TestGameSelector(unittest.TestCase):
         mock_card.update.assert_called_once()
 
 
+class TestGameSelectorLoading(unittest.IsolatedAsyncioTestCase):
+    """Test loading the carousel from the scenario catalogue."""
+
+    async def test_load_games_uses_manifests(self):
+        """Test that load_games builds cards from manifests, not full configs."""
+        # Arrange
+        manifest = ScenarioManifest(
+            path="/scenarios/test_game.json",
+            game_info=GameInfo(
+                title="Test Game",
+                description="Test Description",
+                version="1.0",
+                author="Test",
+                backstory="This is a test game backstory.",
+            ),
+            theme=ThemeSummary(
+                name="Test",
+                card_back="test_card_back.png",
+                resource_icons={"resource1": "icon1.png", "resource2": "icon2.png"},
+            ),
+            card_count=10,
+            resource_count=2,
+        )
+        catalog = MagicMock()
+        catalog.scan = AsyncMock(return_value=[manifest])
+        mock_select_game = MagicMock()
+        selector = GameSelector(
+            on_select_game=mock_select_game, width=800, catalog=catalog
+        )
+        mock_page = MagicMock(spec=ft.Page)
+
+        # Act
+        await selector.load_games(mock_page)
+
+        # Assert
+        catalog.scan.assert_awaited_once()
+        self.assertEqual(len(selector.game_cards), 2)  # 1 game + 1 multiverse portal
+        card = selector.game_cards[0]
+        self.assertIsInstance(card, GameCard)
+        self.assertEqual(card.content.controls[0].content.value, "Test Game")
+        mock_page.update.assert_called_once()
+
+        # Selecting the card hands its path to the app to load in full
+        card.on_select(card.config_path)
+        mock_select_game.assert_called_once_with("/scenarios/test_game.json")
+
+    async def test_load_games_shows_cards_before_the_atlas(self):
+        """Test that cards appear with plain images and take atlas regions later."""
+        # Arrange
+        manifest = ScenarioManifest(
+            path="/scenarios/test_game.json",
+            game_info=GameInfo(
+                title="Test Game",
+                description="Test Description",
+                version="1.0",
+                author="Test",
+            ),
+            theme=ThemeSummary(
+                name="Test",
+                card_back="test_card_back.png",
+                resource_icons={"resource1": "icon1.png"},
+            ),
+            card_count=10,
+            resource_count=1,
+        )
+        catalog = MagicMock()
+        catalog.scan = AsyncMock(return_value=[manifest])
+        atlas = Atlas(
+            pages=["atlas_0.png"],
+            page_sizes=[(300, 200)],
+            regions={"0/card_back": {"page": 0, "x": 2, "y": 2, "w": 224, "h": 228}},
+        )
+        shown = []
+        asset_manager = MagicMock()
+        asset_manager.display_source.return_value = {"src": "test_card_back.png"}
+        asset_manager.atlas_page_source.return_value = {"src": "atlas_0.png"}
+
+        async def prepare_atlas(images):
+            # Record what the carousel held while the atlas was being built
+            shown.append(type(selector.game_cards[0].content.controls[1]))
+            return atlas
+
+        asset_manager.prepare_atlas = prepare_atlas
+        selector = GameSelector(
+            on_select_game=MagicMock(),
+            asset_manager=asset_manager,
+            catalog=catalog,
+        )
+        mock_page = MagicMock(spec=ft.Page)
+
+        # Act
+        await selector.load_games(mock_page)
+
+        # Assert
+        self.assertEqual(shown, [ft.Image])
+        card = selector.game_cards[0]
+        self.assertIsInstance(card.content.controls[1], AtlasImage)
+        # The icon has no region and keeps its own image
+        icon = card.content.controls[4].controls[0].content.controls[0]
+        self.assertIsInstance(icon, ft.Image)
+        self.assertEqual(mock_page.update.call_count, 2)
+
+    async def test_default_catalog_finds_bundled_scenarios(self):
+        """Test that the default catalogue lists the bundled scenarios."""
+        with tempfile.TemporaryDirectory() as tmp:
+            selector = GameSelector(
+                on_select_game=MagicMock(),
+                catalog=ScenarioCatalog(cache_dir=Path(tmp)),
+            )
+
+            await selector.load_games()
+
+        titles = [
+            card.config.game_info.title
+            for card in selector.game_cards
+            if isinstance(card, GameCard)
+        ]
+        self.assertEqual(len(titles), 3)
+
+
 class TestGameCard(unittest.TestCase):
     """Test the GameCard component that displays individual games."""
 
@@ -322,5 +411,43 @@ class TestGameCard(unittest.TestCase):
         self.assertTrue(backstory_found, "Card should contain truncated backstory")
 
 
+    def test_uses_atlas_regions_when_available(self):
+        """Test that images with an atlas region are drawn from the atlas."""
+        # Arrange
+        atlas = Atlas(
+            pages=["atlas_0.png"],
+            page_sizes=[(300, 200)],
+            regions={
+                "0/card_back": {"page": 0, "x": 2, "y": 2, "w": 224, "h": 228},
+                "0/icon:resource1": {"page": 0, "x": 230, "y": 2, "w": 60, "h": 60},
+            },
+        )
+        asset_manager = MagicMock()
+        asset_manager.atlas_page_source.return_value = {"src": "atlas_0.png"}
+        asset_manager.display_source.return_value = {"src": "icon2.png"}
+
+        # Act
+        card = GameCard(
+            config_path="test_game.json",
+            config=self.mock_config,
+            card_back_path="test_card_back.png",
+            on_select=self.mock_select,
+            asset_manager=asset_manager,
+            atlas=atlas,
+            atlas_prefix="0/",
+        )
+
+        # Assert
+        self.assertIsInstance(card.content.controls[1], AtlasImage)
+        icons = [
+            preview.content.controls[0]
+            for preview in card.content.controls[4].controls
+        ]
+        self.assertIsInstance(icons[0], AtlasImage)
+        # Icons without a region fall back to their own image
+        self.assertIsInstance(icons[1], ft.Image)
+        self.assertEqual(icons[1].src, "icon2.png")
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,199 @@
+import asyncio
+import io
+import json
+import time
+from contextlib import redirect_stdout
+from types import SimpleNamespace
+
+import flet as ft
+import pytest
+from flet.core.connection import Connection
+
+import swipe_verse.main as main_module
+
+
+class RecordingConnection(Connection):
+    """A Flet connection that records command batches instead of sending them."""
+
+    def __init__(self):
+        super().__init__()
+        self.page = None
+        self.messages = []
+        self._next_id = 1
+
+    def send_command(self, session_id, command):
+        self.messages.append([command])
+        if command.name == "invokeMethod" and self.page is not None:
+            # Answer client storage calls at once, as the client would
+            data = json.dumps(
+                {"method_id": command.values[0], "result": "false", "error": ""}
+            )
+            self.page._get_event_handler("invoke_method_result")(
+                SimpleNamespace(data=data)
+            )
+        return SimpleNamespace(result="", error="")
+
+    def send_commands(self, session_id, commands):
+        self.messages.append(commands)
+        results = []
+        for command in commands:
+            if command.name == "add":
+                ids = range(self._next_id, self._next_id + len(command.commands))
+                self._next_id += len(command.commands)
+                results.append(" ".join(f"_{n}" for n in ids))
+        return SimpleNamespace(results=results, error="")
+
+
+def find(control, predicate):
+    if predicate(control):
+        return control
+    for child in control._get_children():
+        found = find(child, predicate)
+        if found is not None:
+            return found
+    return None
+
+
+@pytest.fixture
+def game_screen():
+    """Open main.py's game screen on a page with a recording connection"""
+    conn = RecordingConnection()
+    loop = asyncio.new_event_loop()
+    page = ft.Page(conn, "test", loop=loop)
+    conn.page = page
+    page._set_attr("platform", "linux", dirty=False)
+    with redirect_stdout(io.StringIO()):
+        main_module.main(page)
+        start = find(
+            page,
+            lambda c: isinstance(c, ft.ElevatedButton) and c.text == "Start Game",
+        )
+        start.on_click(SimpleNamespace(control=start))
+    yield page, conn
+    loop.close()
+
+
+def swipe(page, delta_x=120.0):
+    detector = find(page, lambda c: isinstance(c, ft.GestureDetector))
+    with redirect_stdout(io.StringIO()):
+        detector.on_horizontal_drag_update(SimpleNamespace(delta_x=delta_x))
+        detector.on_horizontal_drag_end(SimpleNamespace(velocity_x=0.0))
+    return detector
+
+
+def commands_since(conn, mark):
+    return [command for message in conn.messages[mark:] for command in message]
+
+
+def resource_row(page):
+    return find(
+        page,
+        lambda c: isinstance(c, ft.Row)
+        and c.controls
+        and all(getattr(i, "tooltip", None) for i in c.controls),
+    )
+
+
+def test_swipe_updates_card_controls_in_place(game_screen):
+    # Arrange
+    page, conn = game_screen
+    detector = find(page, lambda c: isinstance(c, ft.GestureDetector))
+    title, image, text = detector.content.content.content.controls
+    first_title = title.value
+    mark = len(conn.messages)
+
+    # Act
+    swipe(page)
+
+    # Assert - the same controls show the next card, and nothing is re-added
+    card = main_module.get_card(main_module.GAME_STATE["current_card_id"])
+    assert find(page, lambda c: isinstance(c, ft.GestureDetector)) is detector
+    assert detector.content.content.content.controls == [title, image, text]
+    assert title.value == card["title"] != first_title
+    assert text.value == card["text"]
+    assert image.content.src == card["image"]
+    assert all(c.name != "add" for c in commands_since(conn, mark))
+
+
+def test_next_card_comes_back_without_animation(game_screen):
+    # Arrange
+    page, conn = game_screen
+    detector = find(page, lambda c: isinstance(c, ft.GestureDetector))
+    drag_container = detector.content
+    animation = drag_container.animate_offset
+    mark = len(conn.messages)
+
+    # Act
+    swipe(page)
+
+    # Assert - the reset is sent with the animations off...
+    reset = [
+        c
+        for c in commands_since(conn, mark)
+        if c.attrs.get("offset") == '{"x":0,"y":0}'
+    ]
+    assert len(reset) == 1
+    assert reset[0].attrs["animateoffset"] == ""
+    assert reset[0].attrs["animateopacity"] == ""
+    assert reset[0].attrs["animaterotation"] == ""
+    # ...and they are back for dragging the new card
+    assert drag_container.animate_offset is animation
+    mark = len(conn.messages)
+    with redirect_stdout(io.StringIO()):
+        detector.on_horizontal_drag_update(SimpleNamespace(delta_x=30.0))
+        # The drag frame may wait for the end of the frame
+        deadline = time.monotonic() + 2
+        while len(conn.messages) == mark and time.monotonic() < deadline:
+            time.sleep(0.005)
+    drag = commands_since(conn, mark)
+    assert any(c.attrs.get("animateoffset") for c in drag)
+
+
+def test_short_drag_snaps_back_animated(game_screen):
+    # Arrange
+    page, conn = game_screen
+    card_id = main_module.GAME_STATE["current_card_id"]
+    mark = len(conn.messages)
+
+    # Act
+    swipe(page, delta_x=30.0)
+
+    # Assert
+    assert main_module.GAME_STATE["current_card_id"] == card_id
+    assert all("animateoffset" not in c.attrs for c in commands_since(conn, mark))
+
+
+def test_resource_indicators_are_updated_in_place(game_screen):
+    # Arrange
+    page, conn = game_screen
+    row = resource_row(page)
+    indicators = list(row.controls)
+    mark = len(conn.messages)
+
+    # Act
+    swipe(page)
+
+    # Assert - same controls, with the new values
+    assert resource_row(page).controls == indicators
+    resources = main_module.GAME_STATE["resources"]
+    for indicator, (name, value) in zip(indicators, resources.items()):
+        overlay = indicator.content.controls[1]
+        assert indicator.tooltip == f"{name.capitalize()}: {value}"
+        assert overlay.height == 40 * (1 - min(max(value, 0), 100) / 100)
+    assert all(c.name != "add" for c in commands_since(conn, mark))
+
+
+def test_resource_indicators_are_rebuilt_when_resources_change(game_screen):
+    # Arrange
+    page, _ = game_screen
+    indicators = list(resource_row(page).controls)
+    main_module.GAME_STATE["resources"]["gold"] = 50
+
+    # Act
+    swipe(page)
+
+    # Assert
+    controls = resource_row(page).controls
+    assert len(controls) == len(indicators) + 1
+    assert not set(map(id, controls)) & set(map(id, indicators))
+    assert controls[-1].tooltip == "Gold: 50"
@@ -0,0 +1,155 @@
+import threading
+import time
+
+import pytest
+
+from swipe_verse.models.card import Card, CardChoice
+from swipe_verse.ui.render_scheduler import RenderScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+def test_first_request_flushes_at_once():
+    updates = []
+    render = RenderScheduler(lambda: updates.append(1))
+
+    render.request()
+
+    assert len(updates) == 1
+
+
+def test_requests_within_a_frame_are_coalesced():
+    updates = []
+    render = RenderScheduler(lambda: updates.append(1), frame_budget=0.05)
+
+    for _ in range(20):
+        render.request()
+
+    assert len(updates) == 1
+    assert wait_for(lambda: len(updates) == 2)
+    time.sleep(0.1)
+    assert len(updates) == 2
+    assert render.stats()["coalesced"] == 18
+
+
+def test_flush_replaces_scheduled_frame():
+    updates = []
+    render = RenderScheduler(lambda: updates.append(1), frame_budget=0.05)
+    render.request()
+    render.request()
+
+    render.flush()
+    time.sleep(0.1)
+
+    assert len(updates) == 2
+    assert render.flushes == 2
+
+
+def test_coalesced_counts_folded_requests_only():
+    render = RenderScheduler(lambda: None, frame_budget=0.05)
+    for _ in range(3):
+        render.request()
+
+    # Direct flushes are not requests and do not offset the count
+    render.flush()
+    render.flush()
+
+    assert render.stats()["requests"] == 3
+    assert render.stats()["coalesced"] == 1
+    assert render.flushes == 3
+
+
+def test_replaced_frame_does_not_send_later():
+    updates = []
+    render = RenderScheduler(lambda: updates.append(1), frame_budget=0.05)
+    render.request()
+    render.request()
+    render.cancel()
+
+    # A new frame scheduled after the cancel replaces the old one
+    render.request()
+    time.sleep(0.15)
+
+    assert len(updates) == 2
+    assert render.flushes == 2
+
+
+def test_schedulers_share_one_timer_thread():
+    render = RenderScheduler(lambda: None, frame_budget=0.05)
+    render.request()
+    render.request()
+    threads = threading.active_count()
+
+    schedulers = [RenderScheduler(lambda: None, frame_budget=0.05) for _ in range(10)]
+    for scheduler in schedulers:
+        scheduler.request()
+        scheduler.request()
+
+    assert threading.active_count() == threads
+    assert wait_for(lambda: all(s.flushes == 2 for s in schedulers))
+
+
+def test_messages_per_second():
+    clock = FakeClock()
+    render = RenderScheduler(lambda: None, frame_budget=1 / 30, clock=clock)
+
+    # 100 drag events a second for one second (dropping trailing frames)
+    for _ in range(100):
+        render.request()
+        render.cancel()
+        clock.now += 0.01
+
+    assert render.requests == 100
+    assert 20 <= render.messages_per_second() <= 30
+    clock.now += 1.0
+    assert render.messages_per_second() == 0
+
+
+@pytest.fixture
+def card_display(mocker):
+    from swipe_verse.ui.components.card_display import CardDisplay
+
+    card = Card(
+        id="card",
+        title="Card",
+        text="Text",
+        image="card.png",
+        choices={
+            "left": CardChoice(text="Left", effects={}),
+            "right": CardChoice(text="Right", effects={}),
+        },
+    )
+    display = CardDisplay(card=card)
+    display.card_container = mocker.MagicMock(width=300)
+    display.left_choice_text = mocker.MagicMock()
+    display.right_choice_text = mocker.MagicMock()
+    display.update = mocker.MagicMock()
+    display.render.frame_budget = 0.05
+    return display
+
+
+def test_card_drag_sends_one_update_per_frame(card_display, mocker):
+    card_display._on_pan_start(mocker.MagicMock(local_x=0))
+    for x in range(1, 30):
+        card_display._on_pan_update(mocker.MagicMock(local_x=x * 3))
+    assert card_display.update.call_count == 1
+
+    card_display._on_pan_end(mocker.MagicMock())
+
+    # The released card is sent at once, and no stale frame follows
+    assert card_display.update.call_count == 2
+    time.sleep(0.1)
+    assert card_display.update.call_count == 2
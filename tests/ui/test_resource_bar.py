@@ -242,3 +242,80 @@ def test_update_all_resources(resource_bar, mocker):
         mocker.call(resource_id, value) for resource_id, value in new_resources.items()
     ]
     mock_update.assert_has_calls(expected_calls, any_order=True)
+
+
+def test_create_resource_icon_uses_display_sized_icon(resource_bar, mocker, mock_flet):
+    """Test that icons are requested at their display size when an asset manager is set"""
+    # Arrange
+    asset_manager = mocker.MagicMock()
+    asset_manager.sprite_source.return_value = None
+    asset_manager.display_source.return_value = {"src_base64": "aWNvbg=="}
+    resource_bar.asset_manager = asset_manager
+
+    # Act
+    resource_bar._create_resource_icon("resource1", 75)
+
+    # Assert: requested for both the filled and the tinted copy
+    asset_manager.display_source.assert_called_with(
+        "assets/default/resource_icons/resource1.png", 50, 50, "icon", on_ready=mocker.ANY
+    )
+    assert asset_manager.display_source.call_count == 2
+    image = mock_flet.Image.return_value
+    assert image.src_base64 == "aWNvbg=="
+    assert image.src is None
+
+
+def test_sprite_replaces_overlay_icon_once_rendered(resource_bar, mocker, mock_flet):
+    """Test that a sprite still being rendered is swapped in when it is ready"""
+    # Arrange
+    asset_manager = mocker.MagicMock()
+    asset_manager.sprite_source.return_value = None
+    asset_manager.display_source.return_value = {"src": "icon.png"}
+    resource_bar.asset_manager = asset_manager
+    tooltip = resource_bar._create_resource_icon("resource1", 75)
+    resource_bar.resource_controls["resource1"] = tooltip
+    on_ready = asset_manager.sprite_source.call_args[1]["on_ready"]
+
+    # Act
+    on_ready({"src": "/cache/resource1_sprite.png"})
+
+    # Assert
+    assert "resource1" in resource_bar.sprites
+    assert tooltip.content is mock_flet.Stack.return_value
+    tooltip.update.assert_called_once()
+
+
+def test_create_resource_icon_from_sprite(resource_bar, mocker, mock_flet):
+    """Test that a fill-level sprite replaces the tinted overlay when available"""
+    # Arrange
+    asset_manager = mocker.MagicMock()
+    asset_manager.sprite_source.return_value = {"src": "/cache/resource1_sprite.png"}
+    resource_bar.asset_manager = asset_manager
+
+    # Act
+    resource_bar._create_resource_icon("resource1", 75)
+
+    # Assert
+    mock_flet.Image.assert_called_once()
+    image_args = mock_flet.Image.call_args[1]
+    assert image_args["src"] == "/cache/resource1_sprite.png"
+    assert image_args["height"] == 50 * 21
+    # 75% of 20 steps rounds to frame 15
+    assert image_args["top"] == -15 * 50
+    mock_flet.Container.assert_not_called()
+
+
+def test_update_resource_moves_sprite(resource_bar, mocker):
+    """Test that updating a sprite-based resource only changes its offset"""
+    # Arrange
+    sprite = mocker.MagicMock()
+    resource_bar.sprites["resource1"] = sprite
+    resource_bar.resource_controls["resource1"] = mocker.MagicMock()
+
+    # Act
+    resource_bar.update_resource("resource1", 40)
+
+    # Assert
+    assert sprite.top == -8 * 50
+    sprite.update.assert_called_once()
+    assert resource_bar.resources["resource1"] == 40
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Benchmark scenario loading: cold (parse and validate) vs warm (config cache).
+
+Usage:
+    python tools/benchmark_config_load.py [--cards 5000] [--repeat 5]
+    python tools/benchmark_config_load.py --parse-only --cards 50000
+
+Writes a synthetic scenario with the given number of cards (cloned from the
+bundled kingdom scenario) and reports the best-of-N time for each path,
+plus the plain parse-and-validate with garbage collection left running.
+
+It also compares ways of parsing the file: ``json.load`` followed by
+``model_validate`` on the dicts, ``model_validate_json`` on the raw bytes,
+and pydantic-core's ``from_json`` on the raw bytes followed by
+``model_validate`` (the loader's path), plus indexing the cards without
+loading them (the loader's mode for very large files) and opening the
+scenario compiled into a binary pack. Each runs in a fresh interpreter,
+with garbage collection paused as in the loader, so its peak resident
+memory can be measured; that includes pydantic-core's own buffers, which
+tracemalloc cannot see.
+
+Finally it times a small theme override applied to the loaded scenario,
+by dumping, merging and revalidating it, and as an overlay.
+"""
+
+import argparse
+import asyncio
+import copy
+import gc
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pydantic_core import from_json  # noqa: E402
+
+from swipe_verse.models.config import GameConfig  # noqa: E402
+from swipe_verse.services.card_store import open_scenario  # noqa: E402
+from swipe_verse.services.config_cache import ConfigCache  # noqa: E402
+from swipe_verse.services.config_loader import ConfigLoader  # noqa: E402
+from swipe_verse.services.config_overlay import apply_overlay  # noqa: E402
+from swipe_verse.services.scenario_pack import (  # noqa: E402
+    PACK_SUFFIX,
+    open_pack,
+    write_pack,
+)
+
+PACKAGE_DIR = Path(__file__).parent.parent / "swipe_verse"
+
+
+def make_scenario(cards: int) -> Dict[str, Any]:
+    """Clone the kingdom scenario's cards into a chain of the given length."""
+    with open(PACKAGE_DIR / "scenarios" / "kingdom_game.json", "r", encoding="utf-8") as f:
+        scenario = json.load(f)
+    templates = scenario["cards"]
+    scenario["cards"] = []
+    for index in range(cards):
+        card = copy.deepcopy(templates[index % len(templates)])
+        card["id"] = f"card_{index:06d}"
+        for choice in card["choices"].values():
+            choice["next_card"] = f"card_{(index + 1) % cards:06d}"
+        scenario["cards"].append(card)
+    return scenario
+
+
+PARSE_METHODS: Dict[str, Callable[[Path], Any]] = {
+    "json.load + dicts": lambda path: GameConfig.model_validate(
+        json.loads(path.read_bytes())
+    ),
+    "validate_json": lambda path: GameConfig.model_validate_json(path.read_bytes()),
+    "from_json (loader)": lambda path: GameConfig.model_validate(
+        from_json(path.read_bytes())
+    ),
+    # Indexes the cards in place of loading them (large files)
+    "lazy cards": open_scenario,
+    # Maps the pack written by `swipe-verse pack` next to the scenario
+    "pack (mmap)": lambda path: open_pack(path.with_suffix(PACK_SUFFIX)),
+}
+
+
+def peak_rss_kib() -> int:
+    """
+    Peak resident memory of this process in KiB.
+
+    Read from /proc where available: ru_maxrss also counts the parent's
+    memory at fork time, which hides the peak of a child started by a
+    process that has built a large scenario.
+    """
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    # ru_maxrss is in KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def parse_once(path: Path, method: str) -> Dict[str, float]:
+    """
+    Parse a scenario once, in this process, the given way.
+
+    Returns:
+        Dict[str, float]: Seconds taken and the growth of peak RSS in KiB
+    """
+    gc.collect()
+    gc.disable()
+    baseline = peak_rss_kib()
+    started = time.perf_counter()
+    PARSE_METHODS[method](path)
+    seconds = time.perf_counter() - started
+    peak = peak_rss_kib()
+    return {"seconds": seconds, "peak_kib": peak - baseline}
+
+
+def compare_parse(path: Path, repeat: int) -> Dict[str, Dict[str, float]]:
+    """Run parse_once for each method in fresh interpreters; best of N."""
+    results = {}
+    for method in PARSE_METHODS:
+        runs = []
+        for _ in range(repeat):
+            output = subprocess.run(
+                [sys.executable, __file__, "--measure", method, str(path)],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            runs.append(json.loads(output))
+        results[method] = {
+            "seconds": min(run["seconds"] for run in runs),
+            "peak_kib": min(run["peak_kib"] for run in runs),
+        }
+    return results
+
+
+async def best_time(load: Callable[[], Awaitable[Any]], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await load()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+async def run(path: Path, cache_dir: Path, repeat: int) -> Dict[str, float]:
+    # One event loop for all runs: asyncio.run() would repr the (huge)
+    # result when restoring its signal handler, which dwarfs the load time
+    plain = ConfigLoader()
+    cached = ConfigLoader(config_cache=ConfigCache(cache_dir=cache_dir))
+
+    async def unpaused() -> None:
+        # The loader before the config cache: GC runs during the parse
+        with open(path, "r", encoding="utf-8") as f:
+            GameConfig.model_validate(json.load(f))
+
+    before = await best_time(unpaused, repeat)
+    cold = await best_time(lambda: plain.load_config(str(path)), repeat)
+    # First load through the cache validates and writes the entry
+    fill = await best_time(lambda: cached.load_config(str(path)), 1)
+    warm = await best_time(lambda: cached.load_config(str(path)), repeat)
+    return {"before": before, "cold": cold, "fill": fill, "warm": warm}
+
+
+def compare_overlay(path: Path, repeat: int) -> Dict[str, float]:
+    """Time a small theme override: dump, merge and revalidate vs an overlay."""
+    config = GameConfig.model_validate(from_json(path.read_bytes()))
+    override = {"theme": {"color_scheme": {"accent": "#123456"}}}
+
+    def dump_merge_validate() -> GameConfig:
+        merged = config.model_dump()
+        merged["theme"]["color_scheme"].update(override["theme"]["color_scheme"])
+        return GameConfig.model_validate(merged)
+
+    timings = {}
+    for name, merge in (
+        ("dump/merge/validate", dump_merge_validate),
+        ("overlay", lambda: apply_overlay(config, override)),
+    ):
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            merge()
+            best = min(best, time.perf_counter() - started)
+        timings[name] = best
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cards", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--parse-only", action="store_true", help="Only compare the parse paths"
+    )
+    parser.add_argument("--measure", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        # Child process of compare_parse
+        method, path_arg = args.measure
+        print(json.dumps(parse_once(Path(path_arg), method)))
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "large_game.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(make_scenario(args.cards), f)
+
+        size_kib = path.stat().st_size / 1024
+        print(f"{args.cards} cards, {size_kib:.0f} KiB of JSON")
+        write_pack(
+            GameConfig.model_validate(from_json(path.read_bytes())),
+            path.with_suffix(PACK_SUFFIX),
+        )
+
+        parsed = compare_parse(path, args.repeat)
+        reference = parsed["json.load + dicts"]
+        print(f"{'parse path':<20} {'time':>12} {'peak RSS':>12}")
+        for method, result in parsed.items():
+            print(
+                f"{method:<20} {result['seconds'] * 1000:>9.1f} ms "
+                f"{result['peak_kib'] / 1024:>8.1f} MiB  "
+                f"({result['seconds'] / reference['seconds']:.2f}x time, "
+                f"{result['peak_kib'] / max(reference['peak_kib'], 1):.2f}x memory)"
+            )
+        if args.parse_only:
+            return 0
+
+        times = asyncio.run(run(path, Path(tmp) / "config_cache", args.repeat))
+        cold, warm = times["cold"], times["warm"]
+
+        print(f"{'GC during parse':<18} {times['before'] * 1000:>9.1f} ms")
+        print(f"{'cold (validate)':<18} {cold * 1000:>9.1f} ms")
+        print(f"{'first cached load':<18} {times['fill'] * 1000:>9.1f} ms")
+        print(f"{'warm (cache)':<18} {warm * 1000:>9.1f} ms  ({cold / warm:.1f}x cold)")
+
+        overlay = compare_overlay(path, args.repeat)
+        full = overlay["dump/merge/validate"]
+        for name, seconds in overlay.items():
+            print(f"{name:<20} {seconds * 1000:>9.3f} ms  ({full / seconds:.0f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark drag rendering: updates sent per second with and without coalescing.
+
+Usage:
+    python tools/benchmark_drag_render.py [--seconds 2] [--event-interval 10]
+
+Replays a drag at the GestureDetector's drag_interval and counts the UI
+updates that would be sent to the client, first with an update per event
+(as before RenderScheduler) and then coalesced with 16 ms and 33 ms frame
+budgets. It also checks that the last drag state is the one sent last.
+"""
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from swipe_verse.ui.render_scheduler import RenderScheduler  # noqa: E402
+
+
+def replay(
+    seconds: float, event_interval: float, frame_budget: Optional[float]
+) -> Dict[str, float]:
+    """Replay a drag and return the number and rate of updates sent."""
+    lock = threading.Lock()
+    sent = {"updates": 0, "state": -1}
+    state = {"value": 0}
+
+    def update() -> None:
+        with lock:
+            sent["updates"] += 1
+            sent["state"] = state["value"]
+
+    scheduler = RenderScheduler(update, frame_budget) if frame_budget else None
+    send: Callable[[], None] = scheduler.request if scheduler else update
+
+    events = int(seconds / event_interval)
+    started = time.perf_counter()
+    for index in range(events):
+        state["value"] = index
+        send()
+        # Next event on the drag_interval grid
+        delay = started + (index + 1) * event_interval - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+    last_event = time.perf_counter()
+    if scheduler is not None:
+        # Drag end: the final state is always sent
+        scheduler.flush()
+
+    with lock:
+        return {
+            "events": events,
+            "updates": sent["updates"],
+            "per_second": sent["updates"] / (last_event - started),
+            "final_sent": sent["state"] == events - 1,
+        }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument(
+        "--event-interval", type=float, default=10, help="Milliseconds between drag events"
+    )
+    args = parser.parse_args()
+
+    print(f"{'mode':<16} {'events':>7} {'updates':>8} {'msg/s':>7}  final state sent")
+    for name, budget in (
+        ("every event", None),
+        ("16 ms budget", 0.016),
+        ("33 ms budget", 0.033),
+    ):
+        result = replay(args.seconds, args.event_interval / 1000, budget)
+        print(
+            f"{name:<16} {result['events']:>7} {result['updates']:>8} "
+            f"{result['per_second']:>7.1f}  {'yes' if result['final_sent'] else 'NO'}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Compare output encoding profiles on the bundled assets.
+
+Usage:
+    python tools/benchmark_encoding.py [--assets swipe_verse/assets] [--max-images 8]
+
+For card art, icons and few-colour filter outputs, reports the total encoded
+bytes, the size relative to the source-format encoding and the average encode
+time for each profile in swipe_verse.services.image_encoding.PROFILES.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from PIL import Image, ImageOps
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from swipe_verse.services.image_encoding import PROFILES, measure, resolve_profile  # noqa: E402
+
+PACKAGE_DIR = Path(__file__).parent.parent / "swipe_verse"
+
+
+def load_groups(assets: Path, max_images: int) -> Dict[str, List[Image.Image]]:
+    """Group the bundled images by how the app uses them."""
+    card_art = sorted(assets.glob("**/card_fronts/*.png")) + sorted(assets.glob("**/card_back.png"))
+    icons = sorted(assets.glob("**/resource_icons/*.png"))
+
+    def open_all(paths: List[Path]) -> List[Image.Image]:
+        images = []
+        for path in paths[:max_images]:
+            with Image.open(path) as img:
+                images.append(img.copy())
+        return images
+
+    groups = {"card_art": open_all(card_art), "icon": open_all(icons)}
+    # Few-colour outputs, as produced by the posterize filter
+    groups["posterized"] = [
+        ImageOps.posterize(img.convert("RGB"), 2) for img in groups["card_art"]
+    ]
+    return groups
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--assets", default=str(PACKAGE_DIR / "assets"))
+    parser.add_argument("--max-images", type=int, default=8)
+    args = parser.parse_args()
+
+    groups = load_groups(Path(args.assets), args.max_images)
+    print(f"{'images':<11} {'profile':<11} {'KiB':>9} {'vs source':>10} {'avg ms':>8}")
+    for group, images in groups.items():
+        if not images:
+            continue
+        baseline = None
+        for name in PROFILES:
+            profile = resolve_profile(name)
+            total_bytes = 0
+            total_s = 0.0
+            for img in images:
+                size, seconds = measure(img, profile)
+                total_bytes += size
+                total_s += seconds
+            if baseline is None:
+                baseline = total_bytes
+            print(
+                f"{group:<11} {name:<11} {total_bytes / 1024:>9.0f} "
+                f"{total_bytes / baseline:>9.0%} {total_s / len(images) * 1000:>8.1f}"
+            )
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
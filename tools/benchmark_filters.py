@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark the ImageProcessor filters: PIL implementation vs NumPy kernels.
+
+Usage:
+    python tools/benchmark_filters.py [--width 3840] [--height 2160] [--repeat 5]
+
+Reports the best-of-N time per filter for each backend and the speedup.
+Requires numpy (``pip install swipe-verse[fast]``) for the NumPy column.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from swipe_verse.services import numpy_filters  # noqa: E402
+from swipe_verse.services.image_processor import ImageProcessor  # noqa: E402
+
+
+def make_image(width: int, height: int) -> Image.Image:
+    """Build a synthetic photo-like test image (noise over gradients)."""
+    noise = Image.effect_noise((width, height), 64)
+    gradient = Image.linear_gradient("L").resize((width, height))
+    return Image.merge("RGB", (noise, gradient, gradient.rotate(180)))
+
+
+def best_time(fn, img: Image.Image, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(img)
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--width", type=int, default=3840)
+    parser.add_argument("--height", type=int, default=2160)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    img = make_image(args.width, args.height)
+    cache_dir = Path(tempfile.mkdtemp())
+    pil = ImageProcessor(cache_dir=cache_dir, backend="pil")
+
+    print(f"Image: {args.width}x{args.height}, best of {args.repeat}")
+    print(f"{'filter':<12} {'pil ms':>9} {'numpy ms':>9} {'speedup':>8}  used")
+    for name, kernel in numpy_filters.KERNELS.items():
+        pil_s = best_time(pil.filters[name], img, args.repeat)
+        if numpy_filters.HAVE_NUMPY:
+            numpy_s = best_time(kernel, img, args.repeat)
+            print(
+                f"{name:<12} {pil_s * 1000:>9.1f} {numpy_s * 1000:>9.1f} "
+                f"{pil_s / numpy_s:>7.1f}x  "
+                f"{'numpy' if name in numpy_filters.PREFERRED else 'pil'}"
+            )
+        else:
+            print(f"{name:<12} {pil_s * 1000:>9.1f} {'-':>9} {'-':>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
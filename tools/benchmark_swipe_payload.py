@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Benchmark the UI payload Flet sends for each swipe on the main.py game screen.
+
+Usage:
+    python tools/benchmark_swipe_payload.py [--swipes 10] [--main swipe_verse/main.py]
+
+Runs main.py's Flet app against a connection that records every command
+batch instead of sending it, opens the game screen and swipes through
+cards. For each swipe it reports the commands and bytes of the update that
+shows the next card, and the total for the whole swipe (drag frames,
+drag end and next card). To compare with another version of the screen,
+pass its source with --main, e.g.
+
+    git show <rev>:swipe_verse/main.py > /tmp/main_before.py
+    python tools/benchmark_swipe_payload.py --main /tmp/main_before.py
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import io
+import json
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import flet as ft
+from flet.core.connection import Connection
+from flet.core.protocol import Command, CommandEncoder
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+class RecordingConnection(Connection):
+    """A Flet connection that records command batches and answers for the client."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.page: Optional[ft.Page] = None
+        self.messages: List[List[Command]] = []
+        self._next_id = 1
+
+    def send_command(self, session_id: str, command: Command) -> Any:
+        self.messages.append([command])
+        if command.name == "invokeMethod" and self.page is not None:
+            # Answer client storage calls at once, as the client would
+            method_id = command.values[0]
+            data = json.dumps({"method_id": method_id, "result": "false", "error": ""})
+            self.page._get_event_handler("invoke_method_result")(SimpleNamespace(data=data))
+        return SimpleNamespace(result="", error="")
+
+    def send_commands(self, session_id: str, commands: List[Command]) -> Any:
+        self.messages.append(commands)
+        results = []
+        for command in commands:
+            if command.name == "add":
+                # One new id for each control in the added subtree
+                ids = range(self._next_id, self._next_id + len(command.commands))
+                self._next_id += len(command.commands)
+                results.append(" ".join(f"_{n}" for n in ids))
+        return SimpleNamespace(results=results, error="")
+
+    def mark(self) -> int:
+        return len(self.messages)
+
+    def since(self, mark: int) -> List[List[Command]]:
+        return self.messages[mark:]
+
+
+def payload_size(commands: List[Command]) -> int:
+    """Return the size of a command batch as JSON, as Flet encodes it."""
+    return len(json.dumps(commands, cls=CommandEncoder, separators=(",", ":")))
+
+
+def count_commands(commands: List[Command]) -> int:
+    """Return the number of control commands, counting each added control."""
+    return sum(len(command.commands) or 1 for command in commands)
+
+
+def load_main(path: Path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location("swipe_payload_main", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    # Scenarios are found relative to main.py, so a copy elsewhere finds the repo's
+    module.__file__ = str(ROOT / "swipe_verse" / "main.py")
+    return module
+
+
+def find_gesture_detector(control: Any) -> Optional[ft.GestureDetector]:
+    if isinstance(control, ft.GestureDetector):
+        return control
+    for child in control._get_children():
+        found = find_gesture_detector(child)
+        if found is not None:
+            return found
+    return None
+
+
+def find_button(control: Any, text: str) -> Any:
+    if isinstance(control, ft.ElevatedButton) and control.text == text:
+        return control
+    for child in control._get_children():
+        found = find_button(child, text)
+        if found is not None:
+            return found
+    return None
+
+
+def run(main_path: Path, swipes: int) -> List[Dict[str, int]]:
+    """Open the game screen and swipe right, returning each swipe's payload."""
+    module = load_main(main_path)
+    conn = RecordingConnection()
+    loop = asyncio.new_event_loop()
+    page = ft.Page(conn, "bench", loop=loop)
+    conn.page = page
+    # Reported by the client when it connects
+    page._set_attr("platform", "linux", dirty=False)
+
+    with redirect_stdout(io.StringIO()):
+        module.main(page)
+        # The title screen's first button starts the game
+        start_button = find_button(page, "Start Game")
+        if start_button is None:
+            raise RuntimeError(f"No Start Game button on the title screen of {main_path}")
+        start_button.on_click(SimpleNamespace(control=start_button))
+
+        results = []
+        for _ in range(swipes):
+            detector = find_gesture_detector(page)
+            if detector is None:
+                break
+            mark = conn.mark()
+            detector.on_horizontal_drag_update(SimpleNamespace(delta_x=120.0))
+            detector.on_horizontal_drag_end(SimpleNamespace(velocity_x=0.0))
+            messages = conn.since(mark)
+            next_card = messages[-1]
+            results.append(
+                {
+                    "messages": len(messages),
+                    "commands": count_commands(next_card),
+                    "bytes": payload_size(next_card),
+                    "total_bytes": sum(payload_size(m) for m in messages),
+                }
+            )
+    loop.close()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--swipes", type=int, default=10)
+    parser.add_argument("--main", type=Path, default=ROOT / "swipe_verse" / "main.py")
+    args = parser.parse_args()
+
+    results = run(args.main, args.swipes)
+    if not results:
+        print("No card to swipe")
+        return 1
+
+    print(f"{'swipe':>5} {'commands':>9} {'bytes':>7} {'swipe total':>12}")
+    for n, result in enumerate(results, 1):
+        print(
+            f"{n:>5} {result['commands']:>9} {result['bytes']:>7} {result['total_bytes']:>12}"
+        )
+    count = len(results)
+    print(
+        f"{'mean':>5} {sum(r['commands'] for r in results) / count:>9.1f} "
+        f"{sum(r['bytes'] for r in results) / count:>7.0f} "
+        f"{sum(r['total_bytes'] for r in results) / count:>12.0f}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())